@@ -0,0 +1,86 @@
+# Synthetic guilds and members shared by the benchmarks, scaled to the sizes of large real guilds
+
+import random
+
+import hikari
+import pytest
+
+from tests import utils
+
+GUILD_ID = 1 << 40
+OWNER_ID = 1
+ROLE_COUNT = 250
+CHANNEL_COUNT = 50
+MEMBER_COUNT = 1000
+LARGE_MEMBER_COUNT = 100_000
+# Real guilds have far fewer distinct role combinations than members
+ROLE_SET_COUNT = 200
+LARGE_ROLE_SET_COUNT = 2000
+
+
+def make_role_sets(rng: random.Random, count: int, size: int = 5) -> list[list[int]]:
+    return [[GUILD_ID, *(GUILD_ID + r for r in rng.sample(range(1, ROLE_COUNT), size))] for _ in range(count)]
+
+
+@pytest.fixture(scope="session")
+def roles():
+    rng = random.Random(0)
+    # Positions are shuffled so sorting does not get already sorted input
+    positions = rng.sample(range(1, ROLE_COUNT), ROLE_COUNT - 1)
+    roles = [utils.make_role(id=GUILD_ID, guild_id=GUILD_ID, permissions=hikari.Permissions.VIEW_CHANNEL)]
+    roles += [
+        utils.make_role(
+            id=GUILD_ID + i,
+            guild_id=GUILD_ID,
+            position=position,
+            color=hikari.Color(i % 3 and i),
+            permissions=hikari.Permissions(rng.getrandbits(41) & ~hikari.Permissions.ADMINISTRATOR),
+        )
+        for i, position in enumerate(positions, start=1)
+    ]
+    return roles
+
+
+@pytest.fixture(scope="session")
+def guild(roles):
+    return utils.make_guild(roles, id=GUILD_ID, owner_id=OWNER_ID)
+
+
+@pytest.fixture(scope="session")
+def channels():
+    rng = random.Random(1)
+    return [
+        utils.make_channel(
+            {
+                GUILD_ID + role: (hikari.Permissions(rng.getrandbits(41)), hikari.Permissions(rng.getrandbits(41)))
+                for role in rng.sample(range(ROLE_COUNT), 8)
+            },
+            id=10 + i,
+            guild_id=GUILD_ID,
+        )
+        for i in range(CHANNEL_COUNT)
+    ]
+
+
+@pytest.fixture(scope="session")
+def members(guild):
+    rng = random.Random(2)
+    role_sets = make_role_sets(rng, ROLE_SET_COUNT)
+    return [utils.make_guild_member(guild, id=100 + i, role_ids=rng.choice(role_sets)) for i in range(MEMBER_COUNT)]
+
+
+@pytest.fixture(scope="session")
+def member_pairs(members):
+    rng = random.Random(3)
+    return [(rng.choice(members), rng.choice(members)) for _ in range(MEMBER_COUNT)]
+
+
+@pytest.fixture(scope="session")
+def large_members(guild):
+    rng = random.Random(4)
+    app = utils.make_cache_app([guild])
+    role_sets = make_role_sets(rng, LARGE_ROLE_SET_COUNT)
+    return [
+        utils.make_cached_member(app, id=100 + i, guild_id=GUILD_ID, role_ids=rng.choice(role_sets))
+        for i in range(LARGE_MEMBER_COUNT)
+    ]
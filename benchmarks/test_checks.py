@@ -0,0 +1,32 @@
+import hikari
+
+import toolbox
+from benchmarks.conftest import CHANNEL_COUNT
+
+# A check decorator, the handler and audit logging each checking the same permissions
+CHECKS_PER_INTERACTION = 3
+
+
+def handle_interactions(member_pairs, channels):
+    for moderator, member in member_pairs:
+        channel = channels[moderator.id % CHANNEL_COUNT]
+        for _ in range(CHECKS_PER_INTERACTION):
+            if toolbox.has_permissions(moderator, hikari.Permissions.BAN_MEMBERS, channel):
+                try:
+                    toolbox.require_moderation(moderator, member, hikari.Permissions.BAN_MEMBERS)
+                except toolbox.ModerationError:
+                    pass
+
+
+def test_checks_unscoped(benchmark, member_pairs, channels):
+    benchmark.group = f"{CHECKS_PER_INTERACTION} checks per interaction x1000"
+    benchmark(handle_interactions, member_pairs, channels)
+
+
+def test_checks_scoped(benchmark, member_pairs, channels):
+    @toolbox.memoize_permissions
+    def handle_interaction(moderator, member):
+        handle_interactions([(moderator, member)], channels)
+
+    benchmark.group = f"{CHECKS_PER_INTERACTION} checks per interaction x1000"
+    benchmark(lambda: [handle_interaction(moderator, member) for moderator, member in member_pairs])
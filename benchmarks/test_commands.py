@@ -0,0 +1,61 @@
+import pytest
+
+import toolbox
+
+CHOICES = [[f"Choice {i}", f"choice_{i}"] for i in range(25)]
+
+
+def test_as_command_choices(benchmark):
+    benchmark.group = "command choices: 25 pairs"
+    benchmark(toolbox.as_command_choices, CHOICES)
+
+
+def test_cached_command_choices(benchmark):
+    benchmark.group = "command choices: 25 pairs"
+    benchmark(toolbox.cached_command_choices, CHOICES)
+
+
+def test_iter_command_choices(benchmark):
+    rows = [(f"tag {i}", i) for i in range(10_000)]
+    benchmark.group = "first 25 of 10k rows as command choices"
+    benchmark(lambda: list(toolbox.iter_command_choices(rows)))
+
+
+def test_as_command_choices_slice(benchmark):
+    rows = [(f"tag {i}", i) for i in range(10_000)]
+    benchmark.group = "first 25 of 10k rows as command choices"
+    benchmark(lambda: toolbox.as_command_choices(rows)[:25])
+
+
+WORDS = ("iron", "gold", "wooden", "diamond", "ancient", "cursed", "shiny", "broken")
+ITEMS = ("sword", "shield", "helmet", "ring", "amulet", "bow", "staff", "boots")
+NAMES = [f"{WORDS[i % 8]} {ITEMS[i // 8 % 8]} {i}" for i in range(100_000)]
+QUERIES = {
+    "prefix": "diamond ri",
+    "substring": "helmet 4242",
+    "typo": "ancinet bow 9999",
+}
+
+
+@pytest.fixture(scope="module")
+def choice_index():
+    return toolbox.ChoiceIndex(NAMES)
+
+
+@pytest.mark.parametrize("kind", QUERIES)
+def test_linear_substring_scan(benchmark, kind):
+    benchmark.group = f"search 100k choices: {kind}"
+    choices = toolbox.as_command_choices(NAMES)
+    query = QUERIES[kind]
+    benchmark(lambda: [choice for choice in choices if query in choice.name.lower()][:25])
+
+
+@pytest.mark.parametrize("kind", QUERIES)
+def test_choice_index_search(benchmark, choice_index, kind):
+    benchmark.group = f"search 100k choices: {kind}"
+    benchmark(choice_index.search, QUERIES[kind])
+
+
+def test_choice_index_build(benchmark):
+    benchmark.group = "build ChoiceIndex of 100k choices"
+    benchmark.pedantic(toolbox.ChoiceIndex, (NAMES,), rounds=3)
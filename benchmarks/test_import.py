@@ -0,0 +1,81 @@
+import subprocess
+import sys
+
+import pytest
+
+# Names imported by workers that only need part of toolbox, and everything at once
+STATEMENTS = {
+    "import toolbox": "import toolbox",
+    "sort_roles": "from toolbox import sort_roles",
+    "remove_markdown": "from toolbox import remove_markdown",
+    "everything": "from toolbox import *",
+}
+
+
+# Names imported by workers that never use hikari themselves, which should not have to import it
+COLD_STATEMENTS = {
+    "remove_markdown": "from toolbox import remove_markdown",
+    "format_dt": "from toolbox import format_dt",
+}
+
+
+def import_times(statement: str, *, preload_hikari: bool = True) -> dict:
+    """Run a statement in a new interpreter and parse `python -X importtime`.
+
+    With `preload_hikari`, hikari is imported first and only the times of toolbox modules are kept.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import hikari; {statement}" if preload_hikari else statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    # The first line is the header: import time: self [us] | cumulative | imported package
+    for line in result.stderr.splitlines()[1:]:
+        _, self_time, _, name = line.replace("|", ":").split(":")
+        if name.strip().startswith("toolbox") or not preload_hikari:
+            times[name.strip()] = int(self_time)
+
+    return times
+
+
+def is_toolbox(name: str) -> bool:
+    return name == "toolbox" or name.startswith("toolbox.")
+
+
+def unload_toolbox() -> None:
+    for name in [name for name in sys.modules if is_toolbox(name)]:
+        del sys.modules[name]
+
+
+@pytest.fixture()
+def restore_toolbox():
+    # The other benchmarks keep using the modules they imported, so put them back after importing new copies
+    modules = {name: module for name, module in sys.modules.items() if is_toolbox(name)}
+    yield
+    unload_toolbox()
+    sys.modules.update(modules)
+
+
+@pytest.mark.parametrize("name", STATEMENTS)
+def test_import(benchmark, restore_toolbox, name):
+    benchmark.group = f"import: {name}"
+    # Where the time goes, stored with the results in the benchmark JSON
+    benchmark.extra_info["importtime_us"] = import_times(STATEMENTS[name])
+
+    code = compile(STATEMENTS[name], "<import>", "exec")
+    benchmark.pedantic(exec, (code, {}), setup=unload_toolbox, rounds=50)
+
+
+@pytest.mark.parametrize("name", COLD_STATEMENTS)
+def test_cold_import(benchmark, name):
+    benchmark.group = f"cold import: {name}"
+    # Everything the statement imports, including hikari if it is pulled in
+    times = import_times(COLD_STATEMENTS[name], preload_hikari=False)
+    benchmark.extra_info["importtime_us"] = times
+    benchmark.extra_info["imports_hikari"] = "hikari" in times
+
+    # A new interpreter per round, so nothing is imported beforehand
+    command = [sys.executable, "-c", COLD_STATEMENTS[name]]
+    benchmark.pedantic(subprocess.run, (command,), {"check": True}, rounds=10)
@@ -0,0 +1,19 @@
+import pytest
+
+import toolbox
+
+MESSAGE = "**Patch notes** are out, see `/changelog` for ||spoilers||"
+
+
+@pytest.fixture(params=(False, True), ids=("disabled", "enabled"))
+def instrumentation(request):
+    if request.param:
+        toolbox.enable_instrumentation()
+    yield
+    toolbox.disable_instrumentation()
+    toolbox.reset_instrumentation()
+
+
+def test_remove_markdown_instrumentation(benchmark, instrumentation):
+    benchmark.group = "remove_markdown x100 with instrumentation"
+    benchmark(lambda: [toolbox.remove_markdown(MESSAGE) for _ in range(100)])
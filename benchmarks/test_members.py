@@ -0,0 +1,65 @@
+import hikari
+
+import toolbox
+from benchmarks.conftest import LARGE_MEMBER_COUNT
+
+
+def test_can_moderate(benchmark, member_pairs):
+    benchmark.group = "can_moderate x1000"
+    benchmark(lambda: [toolbox.can_moderate(a, b, hikari.Permissions.BAN_MEMBERS) for a, b in member_pairs])
+
+
+def test_role_hierarchy_can_moderate(benchmark, guild, member_pairs):
+    hierarchy = toolbox.RoleHierarchy(guild)
+    resolver = toolbox.PermissionResolver(guild)
+    benchmark.group = "can_moderate x1000"
+    benchmark(
+        lambda: [
+            hierarchy.can_moderate(a, b, hikari.Permissions.BAN_MEMBERS, resolver=resolver) for a, b in member_pairs
+        ]
+    )
+
+
+def test_is_above(benchmark, member_pairs):
+    benchmark.group = "is_above x1000"
+    benchmark(lambda: [toolbox.is_above(a, b) for a, b in member_pairs])
+
+
+def test_role_hierarchy_is_above(benchmark, guild, member_pairs):
+    hierarchy = toolbox.RoleHierarchy(guild)
+    benchmark.group = "is_above x1000"
+    benchmark(lambda: [hierarchy.is_above(a, b) for a, b in member_pairs])
+
+
+def test_role_hierarchy_is_above_large(benchmark, guild, large_members):
+    hierarchy = toolbox.RoleHierarchy(guild)
+    moderator = large_members[0]
+    benchmark.group = f"is_above x{LARGE_MEMBER_COUNT}"
+    benchmark.pedantic(lambda: [hierarchy.is_above(moderator, m) for m in large_members], rounds=5)
+
+
+def test_get_member_color(benchmark, members):
+    benchmark.group = "get_member_color x1000"
+    benchmark(lambda: [toolbox.get_member_color(m) for m in members])
+
+
+def test_member_color_resolver(benchmark, guild, members):
+    colors = toolbox.MemberColorResolver(guild)
+    benchmark.group = "get_member_color x1000"
+    benchmark(lambda: [colors.get_color(m) for m in members])
+
+
+def test_member_color_resolver_large(benchmark, guild, large_members):
+    benchmark.group = f"get_member_color x{LARGE_MEMBER_COUNT}"
+
+    def get_all():
+        colors = toolbox.MemberColorResolver(guild)
+        return [colors.get_color(m) for m in large_members]
+
+    benchmark.pedantic(get_all, rounds=5)
+
+
+def test_get_possessive(benchmark, large_members):
+    members = large_members[:1000]
+    benchmark.group = "get_possessive x1000"
+    benchmark(lambda: [toolbox.get_possessive(m) for m in members])
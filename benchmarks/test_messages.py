@@ -0,0 +1,151 @@
+import asyncio
+import re
+from unittest import mock
+
+import hikari
+import pytest
+
+import toolbox
+
+# The generic URL regex message links were validated with before a dedicated parser was added
+LEGACY_MESSAGE_LINK_REGEX = re.compile(
+    r"https?:\/\/(www\.)?[-a-zA-Z0-9@:%._\+~#=]{1,256}\.[a-zA-Z0-9()]{1,6}\b([-a-zA-Z0-9()!@:%_\+.~#?&\/\/=]*)channels[\/][0-9]{1,}[\/][0-9]{1,}[\/][0-9]{1,}"
+)
+
+LINK = "https://discord.com/channels/574921006817476608/1010666418007719956/1012539497415704636"
+
+CONTENTS = {
+    "message with 5 links": " ".join(f"quoting {LINK} here" for _ in range(5)),
+    "4000 chars without links": "lorem ipsum dolor sit amet " * 148,
+    "adversarial dotted host": "https://" + "a." * 2000,
+    "adversarial repeated scheme": "https://discord.com/" * 200,
+}
+
+
+@pytest.mark.parametrize("name", CONTENTS)
+def test_legacy_regex_finditer(benchmark, name):
+    benchmark.group = f"find message links: {name}"
+    benchmark(lambda: list(LEGACY_MESSAGE_LINK_REGEX.finditer(CONTENTS[name])))
+
+
+@pytest.mark.parametrize("name", CONTENTS)
+def test_find_message_links(benchmark, name):
+    benchmark.group = f"find message links: {name}"
+    benchmark(lambda: list(toolbox.find_message_links(CONTENTS[name])))
+
+
+def legacy_validate_embed(embed: hikari.Embed) -> hikari.Embed:
+    """validate_embed before it measured embeds in a single pass."""
+    if (length := embed.total_length()) > 6000:
+        raise toolbox.EmbedValidationError(f"Embed total length must be less than 6000 characters, got {length}.")
+
+    if embed.title and (length := len(embed.title)) > 256:
+        raise toolbox.EmbedValidationError(f"Embed title must be less than 256 characters, got {length}.")
+
+    if embed.description and (length := len(embed.description)) > 4096:
+        raise toolbox.EmbedValidationError(f"Embed description must be less than 4096 characters, got {length}.")
+
+    if embed.footer and embed.footer.text and (length := len(embed.footer.text)) > 2048:
+        raise toolbox.EmbedValidationError(f"Embed footer text must be less than 2048 characters, got {length}.")
+
+    if embed.author and embed.author.name and (length := len(embed.author.name)) > 256:
+        raise toolbox.EmbedValidationError(f"Embed author name must be less than 256 characters, got {length}.")
+
+    if embed.fields:
+        if (field_count := len(embed.fields)) > 25:
+            raise toolbox.EmbedValidationError(f"Embed must have less than 25 fields, got {field_count}.")
+
+        for i, field in enumerate(embed.fields):
+            if (length := len(field.name)) > 256:
+                raise toolbox.EmbedValidationError(f"Embed field {i}: name must be less than 256 characters.")
+            if (length := len(field.value)) > 1024:
+                raise toolbox.EmbedValidationError(f"Embed field {i}: value must be less than 1024 characters.")
+
+    return embed
+
+
+def make_report_embed(page: int) -> hikari.Embed:
+    embed = hikari.Embed(title=f"Report page {page}", description="Summary of the week. " * 10)
+    for i in range(10):
+        embed.add_field(name=f"Entry {i}", value="Some value that takes up space. " * 2)
+    return embed.set_footer(text=f"Page {page}").set_author(name="Report bot")
+
+
+REPORT_EMBEDS = [make_report_embed(page) for page in range(10)]
+
+
+def test_legacy_validate_embed_batch(benchmark):
+    benchmark.group = "validate 10 report embeds"
+    benchmark(lambda: [legacy_validate_embed(embed) for embed in REPORT_EMBEDS])
+
+
+def test_validate_embed_batch(benchmark):
+    benchmark.group = "validate 10 report embeds"
+    benchmark(lambda: [toolbox.validate_embed(embed) for embed in REPORT_EMBEDS])
+
+
+def test_validate_embeds(benchmark):
+    benchmark.group = "validate 10 report embeds"
+    benchmark(lambda: toolbox.find_embed_violations(REPORT_EMBEDS))
+
+
+def make_full_embed() -> hikari.Embed:
+    embed = hikari.Embed(title="t" * 256, description="d" * 3000).set_footer(text="f" * 100).set_author(name="a" * 100)
+    for i in range(25):
+        embed.add_field(name=f"Field {i}", value="v" * 80)
+    return embed
+
+
+FULL_EMBED = make_full_embed()
+
+
+def test_legacy_validate_full_embed(benchmark):
+    benchmark.group = "validate an embed with 25 fields"
+    benchmark(legacy_validate_embed, FULL_EMBED)
+
+
+def test_validate_full_embed(benchmark):
+    benchmark.group = "validate an embed with 25 fields"
+    benchmark(toolbox.validate_embed, FULL_EMBED)
+
+
+LOG_LINES = [f"`{i:05}` **user {i}** joined the server {i} minutes ago" for i in range(2000)]
+
+
+def test_paginate_embed(benchmark):
+    benchmark.group = "paginate 2000 lines"
+    benchmark(lambda: list(toolbox.paginate_embed(LOG_LINES, title="Join log")))
+
+
+def test_batch_embeds(benchmark):
+    embeds = list(toolbox.paginate_embed(LOG_LINES, title="Join log"))
+    benchmark.group = "paginate 2000 lines"
+    benchmark(lambda: list(toolbox.batch_embeds(embeds)))
+
+
+MESSAGE_LINKS = [f"https://discord.com/channels/1/{i % 10}/{i % 50}" for i in range(100)]
+
+
+@pytest.fixture(scope="module")
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture()
+def bot():
+    bot = mock.Mock(spec=hikari.RESTAware)
+    bot.rest.fetch_message = mock.AsyncMock(return_value=mock.Mock(spec=hikari.Message))
+    return bot
+
+
+def test_fetch_messages_from_links(benchmark, loop, bot):
+    benchmark.group = "fetch 100 message links"
+    benchmark(lambda: loop.run_until_complete(toolbox.fetch_messages_from_links(MESSAGE_LINKS, bot=bot)))
+
+
+def test_fetch_messages_from_links_cached(benchmark, loop, bot):
+    cache = toolbox.MessageCache()
+    benchmark.group = "fetch 100 message links"
+    benchmark(lambda: loop.run_until_complete(toolbox.fetch_messages_from_links(MESSAGE_LINKS, bot=bot, cache=cache)))
@@ -0,0 +1,99 @@
+import asyncio
+import concurrent.futures
+import itertools
+import statistics
+import time
+
+import pytest
+
+import toolbox
+from benchmarks.test_strings import make_message
+
+FLOOD_SIZE = 200
+FLOOD_LENGTH = 4000
+TICK = 0.001
+# Scanning results are sent back from the executor, so scanners are flooded with long messages with a few matches
+SPARSE_WORDS = ("lorem", "ipsum", "dolor", "sit", "amet", "**https://example.com/page**", "discord.gg/abc")
+
+
+@pytest.fixture(scope="module")
+def process_pool():
+    with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+        # Start the workers before measuring
+        list(executor.map(toolbox.remove_markdown, ["**warm up**"] * 4))
+        yield executor
+
+
+async def measure_lag(handle_message, messages):
+    """Handle a flood of messages arriving at once, while a ticker measures how late the event loop runs it."""
+    lags = []
+
+    async def ticker():
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(TICK)
+            lags.append(time.perf_counter() - start - TICK)
+
+    ticker_task = asyncio.create_task(ticker())
+    await asyncio.sleep(TICK)
+    await asyncio.gather(*(handle_message(message) for message in messages))
+    await asyncio.sleep(2 * TICK)  # Let the ticker record the tick the flood delayed
+    ticker_task.cancel()
+    return max(lags)
+
+
+def make_sparse_message(length: int) -> str:
+    words = itertools.cycle(SPARSE_WORDS[:5] * 10 + SPARSE_WORDS[5:])
+    message = ""
+    while len(message) < length:
+        message += next(words) + " "
+    return message[:length]
+
+
+def run_flood(benchmark, handle_message, make_message=make_message):
+    messages = [make_message(FLOOD_LENGTH)[:-3] + f"{i:03}" for i in range(FLOOD_SIZE)]
+    lags = []
+    benchmark.group = f"event loop lag, flood of {FLOOD_SIZE} messages of {FLOOD_LENGTH} characters"
+    benchmark.pedantic(lambda: lags.append(asyncio.run(measure_lag(handle_message, messages))), rounds=5)
+    # The longest the event loop was blocked for in each round, the median is less sensitive to noise
+    benchmark.extra_info["median_max_lag_ms"] = round(statistics.median(lags) * 1000, 2)
+    benchmark.extra_info["worst_max_lag_ms"] = round(max(lags) * 1000, 2)
+
+
+def test_flood_inline(benchmark):
+    async def handle_message(message):
+        toolbox.remove_markdown(message)
+
+    run_flood(benchmark, handle_message)
+
+
+def test_flood_thread_pool(benchmark):
+    async def handle_message(message):
+        await toolbox.remove_markdown_async(message)
+
+    run_flood(benchmark, handle_message)
+
+
+def test_flood_process_pool(benchmark, process_pool):
+    async def handle_message(message):
+        await toolbox.remove_markdown_async(message, executor=process_pool)
+
+    run_flood(benchmark, handle_message)
+
+
+def test_flood_scanner_inline(benchmark):
+    scanner = toolbox.ContentScanner()
+
+    async def handle_message(message):
+        list(scanner.scan(message))
+
+    run_flood(benchmark, handle_message, make_sparse_message)
+
+
+def test_flood_scanner_process_pool(benchmark, process_pool):
+    scanner = toolbox.ContentScanner()
+
+    async def handle_message(message):
+        await scanner.scan_async(message, executor=process_pool)
+
+    run_flood(benchmark, handle_message, make_sparse_message)
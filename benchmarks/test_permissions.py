@@ -0,0 +1,35 @@
+import toolbox
+from benchmarks.conftest import CHANNEL_COUNT
+from benchmarks.conftest import LARGE_MEMBER_COUNT
+
+
+def test_calculate_permissions(benchmark, members, channels):
+    benchmark.group = "calculate_permissions x1000"
+    benchmark(lambda: [toolbox.calculate_permissions(m, channels[m.id % CHANNEL_COUNT]) for m in members])
+
+
+def test_permission_resolver(benchmark, guild, members, channels):
+    resolver = toolbox.PermissionResolver(guild)
+    benchmark.group = "calculate_permissions x1000"
+    benchmark(lambda: [resolver.calculate_permissions(m, channels[m.id % CHANNEL_COUNT]) for m in members])
+
+
+def test_calculate_permissions_bulk(benchmark, members, channels):
+    benchmark.group = "calculate_permissions x1000"
+    benchmark(toolbox.calculate_permissions_bulk, members, channels[0])
+
+
+def test_calculate_permissions_bulk_large(benchmark, large_members, channels):
+    benchmark.group = f"calculate_permissions x{LARGE_MEMBER_COUNT}"
+    benchmark.pedantic(toolbox.calculate_permissions_bulk, (large_members, channels[0]), rounds=5)
+
+
+def test_permission_resolver_large(benchmark, guild, large_members, channels):
+    benchmark.group = f"calculate_permissions x{LARGE_MEMBER_COUNT}"
+
+    def calculate_all():
+        # A fresh resolver every round, so the cost of filling its cache is included
+        resolver = toolbox.PermissionResolver(guild)
+        return [resolver.calculate_permissions(m, channels[0]) for m in large_members]
+
+    benchmark.pedantic(calculate_all, rounds=5)
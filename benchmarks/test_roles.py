@@ -0,0 +1,46 @@
+import random
+
+import pytest
+
+import toolbox
+from benchmarks.conftest import GUILD_ID
+from benchmarks.conftest import ROLE_COUNT
+from tests import utils
+
+
+@pytest.fixture(scope="module")
+def role_order(guild):
+    return toolbox.RoleOrder(guild)
+
+
+def test_sort_roles(benchmark, roles):
+    benchmark.group = f"sort {ROLE_COUNT} roles"
+    benchmark(toolbox.sort_roles, roles)
+
+
+def test_role_order_view(benchmark, role_order):
+    benchmark.group = f"sort {ROLE_COUNT} roles"
+    benchmark(role_order.sort_roles)
+
+
+def test_sort_roles_member_subset(benchmark, roles):
+    roles_by_id = {role.id: role for role in roles}
+    role_ids = [role.id for role in roles[::25]]
+    benchmark.group = "sort a member's 10 roles"
+    benchmark(lambda: toolbox.sort_roles([roles_by_id[role_id] for role_id in role_ids]))
+
+
+def test_role_order_get_roles(benchmark, role_order, roles):
+    role_ids = [role.id for role in roles[::25]]
+    benchmark.group = "sort a member's 10 roles"
+    benchmark(role_order.get_roles, role_ids)
+
+
+def test_role_order_update_role(benchmark, role_order):
+    rng = random.Random(1)
+    benchmark.group = "role update"
+    benchmark(
+        lambda: role_order.update_role(
+            utils.make_role(id=GUILD_ID + rng.randrange(1, ROLE_COUNT), position=rng.randrange(1, ROLE_COUNT))
+        )
+    )
@@ -0,0 +1,100 @@
+import tracemalloc
+
+import hikari
+import pytest
+
+import toolbox
+from benchmarks.conftest import CHANNEL_COUNT
+from benchmarks.conftest import GUILD_ID
+from benchmarks.conftest import OWNER_ID
+from benchmarks.conftest import ROLE_COUNT
+from tests import utils
+
+
+@pytest.fixture(scope="module")
+def snapshot(guild, channels):
+    snapshot = toolbox.GuildSnapshot(guild)
+    for channel in channels:
+        snapshot.update_channel(channel)
+    return snapshot
+
+
+def copy_guild_objects(roles, channels):
+    # Real cache objects instead of the mocks of the fixtures, so their memory is representative
+    roles = [
+        utils.make_role(
+            id=role.id, guild_id=GUILD_ID, position=role.position, color=role.color, permissions=role.permissions
+        )
+        for role in roles
+    ]
+    channels = [
+        hikari.GuildTextChannel(
+            app=None,
+            id=channel.id,
+            name=f"channel {channel.id}",
+            type=hikari.ChannelType.GUILD_TEXT,
+            guild_id=hikari.Snowflake(GUILD_ID),
+            parent_id=None,
+            position=0,
+            is_nsfw=False,
+            permission_overwrites={
+                target_id: hikari.PermissionOverwrite(
+                    id=target_id, type=overwrite.type, allow=overwrite.allow, deny=overwrite.deny
+                )
+                for target_id, overwrite in channel.permission_overwrites.items()
+            },
+            topic=None,
+            last_message_id=None,
+            rate_limit_per_user=0,
+            last_pin_timestamp=None,
+            default_auto_archive_duration=0,
+        )
+        for channel in channels
+    ]
+    return roles, channels
+
+
+def measure(factory):
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        value = factory()
+        return value, tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+
+def test_snapshot_memory(benchmark, roles, channels):
+    (cache_roles, cache_channels), cache_size = measure(lambda: copy_guild_objects(roles, channels))
+    guild = utils.make_guild(cache_roles, id=GUILD_ID, owner_id=OWNER_ID, channels=cache_channels)
+    toolbox.GuildSnapshot(guild)  # So the attributes the mock guild creates on first use are not measured
+    snapshot, snapshot_size = measure(lambda: toolbox.GuildSnapshot(guild))
+
+    # The memory taken per guild, not including the members
+    benchmark.extra_info["cache_objects_bytes"] = cache_size
+    benchmark.extra_info["snapshot_bytes"] = snapshot_size
+    benchmark.extra_info["ratio"] = round(cache_size / snapshot_size, 1)
+    assert snapshot_size < cache_size
+
+    benchmark.group = f"snapshot {ROLE_COUNT} roles and {CHANNEL_COUNT} channels"
+    benchmark(toolbox.GuildSnapshot, guild)
+
+
+def test_snapshot_calculate_permissions(benchmark, snapshot, members, channels):
+    benchmark.group = "calculate_permissions x1000"
+    benchmark(lambda: [snapshot.calculate_permissions(m, channels[m.id % CHANNEL_COUNT]) for m in members])
+
+
+def test_snapshot_can_moderate(benchmark, snapshot, member_pairs):
+    benchmark.group = "can_moderate x1000"
+    benchmark(lambda: [snapshot.can_moderate(a, b, hikari.Permissions.BAN_MEMBERS) for a, b in member_pairs])
+
+
+def test_snapshot_is_above(benchmark, snapshot, member_pairs):
+    benchmark.group = "is_above x1000"
+    benchmark(lambda: [snapshot.is_above(a, b) for a, b in member_pairs])
+
+
+def test_snapshot_get_member_color(benchmark, snapshot, members):
+    benchmark.group = "get_member_color x1000"
+    benchmark(lambda: [snapshot.get_member_color(m) for m in members])
@@ -0,0 +1,218 @@
+import datetime
+import itertools
+import typing as t
+
+import hikari
+import pytest
+
+import toolbox
+
+MESSAGE_LENGTHS = (250, 1000, 4000, 16000)
+
+FORMATTED_WORDS = (
+    "**bold**",
+    "__underline__",
+    "~~strikethrough~~",
+    "||spoiler||",
+    "_italic_",
+    "*italic*",
+    "`code`",
+    "```multi code```",
+    "**~~nested~~**",
+    "plain",
+)
+
+
+def make_message(length: int) -> str:
+    """Make a message of exactly `length` characters densely packed with formatting."""
+    words = itertools.cycle(FORMATTED_WORDS)
+    message = "> "
+    while len(message) < length:
+        message += next(words) + " "
+    return message[:length]
+
+
+@pytest.mark.parametrize("length", MESSAGE_LENGTHS)
+def test_remove_markdown(benchmark, length):
+    benchmark.group = "remove_markdown"
+    benchmark(toolbox.remove_markdown, make_message(length))
+
+
+@pytest.mark.parametrize("formats", (toolbox.MarkdownFormat.ALL, toolbox.MarkdownFormat.BOLD))
+def test_remove_markdown_calls(benchmark, formats):
+    messages = [make_message(250)] * 1000
+    benchmark.group = "remove_markdown batch of 1000"
+    benchmark(lambda: [toolbox.remove_markdown(message, formats) for message in messages])
+
+
+@pytest.mark.parametrize("formats", (toolbox.MarkdownFormat.ALL, toolbox.MarkdownFormat.BOLD))
+def test_markdown_stripper(benchmark, formats):
+    messages = [make_message(250)] * 1000
+    stripper = toolbox.MarkdownStripper(formats)
+    benchmark.group = "remove_markdown batch of 1000"
+    benchmark(lambda: [stripper(message) for message in messages])
+
+
+@pytest.mark.parametrize("formats", (toolbox.MarkdownFormat.ALL, toolbox.MarkdownFormat.BOLD))
+def test_remove_markdown_many(benchmark, formats):
+    messages = [make_message(250)] * 1000
+    benchmark.group = "remove_markdown batch of 1000"
+    benchmark(lambda: list(toolbox.remove_markdown_many(messages, formats)))
+
+
+TIMESTAMP_COUNT = 5000
+START = datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc)
+DATETIMES = [START + datetime.timedelta(minutes=i) for i in range(TIMESTAMP_COUNT)]
+
+
+def test_format_dt_loop(benchmark):
+    benchmark.group = f"format {TIMESTAMP_COUNT} datetimes"
+    benchmark(lambda: [toolbox.format_dt(time, toolbox.TimestampStyle.RELATIVE) for time in DATETIMES])
+
+
+def test_format_dt_many(benchmark):
+    benchmark.group = f"format {TIMESTAMP_COUNT} datetimes"
+    benchmark(toolbox.format_dt_many, DATETIMES, toolbox.TimestampStyle.RELATIVE)
+
+
+def test_format_dt_many_posix(benchmark):
+    benchmark.group = f"format {TIMESTAMP_COUNT} datetimes"
+    seconds = [int(time.timestamp()) for time in DATETIMES]
+    benchmark(toolbox.format_dt_many, seconds, toolbox.TimestampStyle.RELATIVE)
+
+
+def test_format_dt_many_numpy(benchmark):
+    np = pytest.importorskip("numpy")
+    benchmark.group = f"format {TIMESTAMP_COUNT} datetimes"
+    array = np.array([time.replace(tzinfo=None) for time in DATETIMES], dtype="datetime64[s]")
+    benchmark(toolbox.format_dt_many, array, toolbox.TimestampStyle.RELATIVE)
+
+
+SNOWFLAKES = [hikari.Snowflake(1075825934051516416 + (i << 22) * 60_000) for i in range(TIMESTAMP_COUNT)]
+
+
+def test_snowflake_to_timestamp(benchmark):
+    benchmark.group = f"{TIMESTAMP_COUNT} snowflakes to timestamps"
+    benchmark(lambda: [toolbox.snowflake_to_timestamp(snowflake) for snowflake in SNOWFLAKES])
+
+
+def test_created_at_timestamp(benchmark):
+    benchmark.group = f"{TIMESTAMP_COUNT} snowflakes to timestamps"
+    benchmark(lambda: [int(snowflake.created_at.timestamp()) for snowflake in SNOWFLAKES])
+
+
+def test_format_dt_created_at(benchmark):
+    benchmark.group = f"format {TIMESTAMP_COUNT} snowflakes"
+
+    def format_all():
+        return [toolbox.format_dt(snowflake.created_at, toolbox.TimestampStyle.RELATIVE) for snowflake in SNOWFLAKES]
+
+    benchmark(format_all)
+
+
+def test_format_snowflake(benchmark):
+    benchmark.group = f"format {TIMESTAMP_COUNT} snowflakes"
+
+    def format_all():
+        return [toolbox.format_snowflake(snowflake, toolbox.TimestampStyle.RELATIVE) for snowflake in SNOWFLAKES]
+
+    benchmark(format_all)
+
+
+def test_format_snowflakes(benchmark):
+    benchmark.group = f"format {TIMESTAMP_COUNT} snowflakes"
+
+    def format_all():
+        return toolbox.format_snowflakes(SNOWFLAKES, toolbox.TimestampStyle.RELATIVE)
+
+    benchmark(format_all)
+
+
+def test_format_snowflakes_numpy(benchmark):
+    np = pytest.importorskip("numpy")
+    benchmark.group = f"format {TIMESTAMP_COUNT} snowflakes"
+    array = np.array(SNOWFLAKES, dtype=np.uint64)
+
+    def format_all():
+        return toolbox.format_snowflakes(array, toolbox.TimestampStyle.RELATIVE)
+
+    benchmark(format_all)
+
+
+def legacy_find_urls(content: str) -> t.List[str]:
+    """The finditer wrapper used before find_urls existed."""
+    return [match.group() for match in toolbox.strings.LINK_REGEX.finditer(content)]
+
+
+LINK_CONTENTS = {
+    "4000 chars without links": "lorem ipsum dolor sit amet " * 148,
+    "message with 5 links": " ".join(f"read https://example.com/page/{i}?ref=discord please" for i in range(5)),
+    "adversarial dotted host 4k": "https://" + "a." * 2000,
+    "adversarial dotted host 16k": "https://" + "a." * 8000,
+    "adversarial repeated scheme 4k": "http://" * 600,
+    "adversarial repeated scheme 16k": "http://" * 2400,
+    "adversarial failing hosts 16k": ("http://" + "a." * 128 + "-") * 60,
+}
+
+
+@pytest.mark.parametrize("name", LINK_CONTENTS)
+def test_is_url(benchmark, name):
+    benchmark.group = f"is_url: {name}"
+    benchmark(toolbox.is_url, LINK_CONTENTS[name], fullmatch=False)
+
+
+@pytest.mark.parametrize("name", LINK_CONTENTS)
+def test_is_invite(benchmark, name):
+    benchmark.group = f"is_invite: {name}"
+    benchmark(toolbox.is_invite, LINK_CONTENTS[name], fullmatch=False)
+
+
+@pytest.mark.parametrize("name", LINK_CONTENTS)
+def test_legacy_find_urls(benchmark, name):
+    benchmark.group = f"find urls: {name}"
+    benchmark(legacy_find_urls, LINK_CONTENTS[name])
+
+
+@pytest.mark.parametrize("name", LINK_CONTENTS)
+def test_find_urls(benchmark, name):
+    benchmark.group = f"find urls: {name}"
+    benchmark(lambda: list(toolbox.find_urls(LINK_CONTENTS[name])))
+
+
+@pytest.mark.parametrize("name", LINK_CONTENTS)
+def test_find_invites(benchmark, name):
+    benchmark.group = f"find invites: {name}"
+    benchmark(lambda: list(toolbox.find_invites(LINK_CONTENTS[name])))
+
+
+SCAN_CONTENTS = {
+    "plain chat message": "hey, did anyone see the new update? looks pretty good to me",
+    "formatted message with links": (
+        "**Patch notes** are out: https://example.com/patch?v=2 ||spoilers|| and `code` "
+        "> join discord.gg/example or see https://discord.com/channels/1/2/3"
+    ),
+    "4000 formatted chars": make_message(4000),
+}
+
+
+def scan_separately(content: str) -> t.Tuple[object, ...]:
+    """The moderation pipeline ContentScanner replaces, scanning the content once per kind of content."""
+    return (
+        toolbox.remove_markdown(content),
+        list(toolbox.find_urls(content)),
+        list(toolbox.find_invites(content)),
+        list(toolbox.find_message_links(content)),
+    )
+
+
+@pytest.mark.parametrize("name", SCAN_CONTENTS)
+def test_scan_separately(benchmark, name):
+    benchmark.group = f"scan content: {name}"
+    benchmark(scan_separately, SCAN_CONTENTS[name])
+
+
+@pytest.mark.parametrize("name", SCAN_CONTENTS)
+def test_content_scanner(benchmark, name):
+    benchmark.group = f"scan content: {name}"
+    scanner = toolbox.ContentScanner()
+    benchmark(lambda: list(scanner.scan(SCAN_CONTENTS[name])))
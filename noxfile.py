@@ -5,9 +5,15 @@ from nox import options
 
 PATH_TO_PROJECT = os.path.join(".", "toolbox")
 PATH_TO_TESTS = os.path.join(".", "tests")
+PATH_TO_BENCHMARKS = os.path.join(".", "benchmarks")
+BENCHMARK_OUTPUT = "benchmark.json"
+BENCHMARK_BASELINE = "benchmark_baseline.json"
+# Allowed slowdown of the fastest round of a benchmark compared to the baseline, less noisy than the mean
+BENCHMARK_TOLERANCE = "min:15%"
 SCRIPT_PATHS = [
     PATH_TO_PROJECT,
     PATH_TO_TESTS,
+    PATH_TO_BENCHMARKS,
     "noxfile.py",
     "docs/source/conf.py",
 ]
@@ -46,6 +52,32 @@ def pytest(session: nox.Session):
     session.run("pytest", PATH_TO_TESTS)
 
 
+@nox.session()
+def benchmark(session: nox.Session):
+    """Run the benchmarks, writing the results to benchmark.json.
+
+    If benchmark_baseline.json exists, the results are compared against it
+    and the session fails when a benchmark regressed by more than the tolerance.
+    Pass `-- --save-baseline` to write the results to benchmark_baseline.json instead.
+    """
+    session.install("-Ur", "requirements.txt")
+    session.install("-U", ".")
+    session.install("-U", "pytest")
+    session.install("-U", "pytest-asyncio")
+    session.install("-U", "pytest-benchmark")
+
+    args = list(session.posargs)
+    if "--save-baseline" in args:
+        args.remove("--save-baseline")
+        args.append(f"--benchmark-json={BENCHMARK_BASELINE}")
+    else:
+        args.append(f"--benchmark-json={BENCHMARK_OUTPUT}")
+        if os.path.isfile(BENCHMARK_BASELINE):
+            args += [f"--benchmark-compare={BENCHMARK_BASELINE}", f"--benchmark-compare-fail={BENCHMARK_TOLERANCE}"]
+
+    session.run("pytest", PATH_TO_BENCHMARKS, *args)
+
+
 @nox.session(reuse_venv=True)
 def sphinx(session):
     session.install("-Ur", "doc_requirements.txt")
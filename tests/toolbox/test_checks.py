@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+from unittest import mock
+
+import hikari
+import pytest
+
+import toolbox
+from tests import utils
+
+
+@pytest.fixture
+def guild():
+    return utils.make_guild(
+        [
+            utils.make_role(id=100, position=0, permissions=hikari.Permissions.VIEW_CHANNEL),
+            utils.make_role(id=1, position=1, permissions=hikari.Permissions.BAN_MEMBERS),
+            utils.make_role(id=2, position=2, permissions=hikari.Permissions.ADMINISTRATOR),
+        ],
+        id=100,
+        owner_id=10,
+    )
+
+
+@pytest.fixture
+def channel():
+    return utils.make_channel({100: (hikari.Permissions.NONE, hikari.Permissions.VIEW_CHANNEL)}, id=200, guild_id=100)
+
+
+def test_has_permissions(guild, channel):
+    member = utils.make_guild_member(guild, id=11, role_ids=[100, 1])
+
+    assert toolbox.has_permissions(member, hikari.Permissions.VIEW_CHANNEL | hikari.Permissions.BAN_MEMBERS)
+    assert not toolbox.has_permissions(member, hikari.Permissions.VIEW_CHANNEL | hikari.Permissions.KICK_MEMBERS)
+    assert not toolbox.has_permissions(member, hikari.Permissions.VIEW_CHANNEL, channel)
+    assert toolbox.has_permissions(member, hikari.Permissions.NONE, channel)
+
+
+def test_require_moderation(guild):
+    owner = utils.make_guild_member(guild, id=10, role_ids=[100])
+    admin = utils.make_guild_member(guild, id=11, role_ids=[100, 2])
+    moderator = utils.make_guild_member(guild, id=12, role_ids=[100, 1])
+    member = utils.make_guild_member(guild, id=13, role_ids=[100])
+
+    toolbox.require_moderation(moderator, member, hikari.Permissions.BAN_MEMBERS)
+    toolbox.require_moderation(admin, moderator, hikari.Permissions.KICK_MEMBERS)
+
+    with pytest.raises(toolbox.ModerationError) as exc_info:
+        toolbox.require_moderation(moderator, member, hikari.Permissions.KICK_MEMBERS)
+    assert exc_info.value.permissions == hikari.Permissions.KICK_MEMBERS
+
+    for moderator_, member_ in ((member, moderator), (admin, owner)):
+        with pytest.raises(toolbox.ModerationError):
+            toolbox.require_moderation(moderator_, member_)
+
+
+def test_scope_memoizes_permissions(guild, channel):
+    member = utils.make_guild_member(guild, id=11, role_ids=[100, 1])
+
+    with mock.patch("toolbox.checks.calculate_permissions", wraps=toolbox.calculate_permissions) as calculate:
+        with toolbox.permission_scope():
+            for _ in range(3):
+                assert toolbox.has_permissions(member, hikari.Permissions.BAN_MEMBERS)
+                assert not toolbox.has_permissions(member, hikari.Permissions.VIEW_CHANNEL, channel)
+
+            with toolbox.permission_scope():  # Nested scopes share the outer cache
+                assert toolbox.has_permissions(member, hikari.Permissions.BAN_MEMBERS)
+
+        assert calculate.call_count == 2
+
+        toolbox.has_permissions(member, hikari.Permissions.BAN_MEMBERS)  # Outside of a scope nothing is cached
+        toolbox.has_permissions(member, hikari.Permissions.BAN_MEMBERS)
+        assert calculate.call_count == 4
+
+
+def test_scope_memoizes_moderation(guild):
+    moderator = utils.make_guild_member(guild, id=12, role_ids=[100, 1])
+    member = utils.make_guild_member(guild, id=13, role_ids=[100])
+
+    with mock.patch("toolbox.checks.can_moderate", wraps=toolbox.can_moderate) as can_moderate:
+        with toolbox.permission_scope():
+            for _ in range(3):
+                toolbox.require_moderation(moderator, member, hikari.Permissions.BAN_MEMBERS)
+                with pytest.raises(toolbox.ModerationError):
+                    toolbox.require_moderation(moderator, member, hikari.Permissions.KICK_MEMBERS)
+
+        assert can_moderate.call_count == 2
+
+
+def test_memoize_permissions_sync(guild):
+    member = utils.make_guild_member(guild, id=11, role_ids=[100, 1])
+
+    @toolbox.memoize_permissions
+    def handler() -> bool:
+        return toolbox.has_permissions(member, hikari.Permissions.BAN_MEMBERS) and toolbox.has_permissions(
+            member, hikari.Permissions.VIEW_CHANNEL
+        )
+
+    with mock.patch("toolbox.checks.calculate_permissions", wraps=toolbox.calculate_permissions) as calculate:
+        assert handler()
+        assert handler()
+        assert calculate.call_count == 2  # Once per call of the handler
+
+
+@pytest.mark.asyncio
+async def test_memoize_permissions_isolates_tasks(guild):
+    member = utils.make_guild_member(guild, id=11, role_ids=[100, 1])
+    roles_updated = asyncio.Event()
+
+    @toolbox.memoize_permissions
+    async def first_handler() -> list[bool]:
+        results = [toolbox.has_permissions(member, hikari.Permissions.BAN_MEMBERS)]
+        await roles_updated.wait()
+        return results + [toolbox.has_permissions(member, hikari.Permissions.BAN_MEMBERS)]
+
+    @toolbox.memoize_permissions
+    async def second_handler() -> bool:
+        member.role_ids = [hikari.Snowflake(100)]
+        roles_updated.set()
+        return toolbox.has_permissions(member, hikari.Permissions.BAN_MEMBERS)
+
+    # Each handler has its own scope, the first one keeps the permissions from before the update
+    assert await asyncio.gather(first_handler(), second_handler()) == [[True, True], False]
@@ -57,3 +57,129 @@ def test_kwargs_choices(diff_name_and_value):
         b="e",
         c="f",
     ) == diff_name_and_value
+
+
+def test_cached_command_choices(diff_name_and_value):
+    choices = toolbox.cached_command_choices([["a", "d"], ["b", "e"], ["c", "f"]])
+
+    assert choices == diff_name_and_value
+    assert toolbox.cached_command_choices([["a", "d"], ["b", "e"], ["c", "f"]]) is choices
+    assert toolbox.cached_command_choices({"a": "d", "b": "e", "c": "f"}) == diff_name_and_value
+    assert toolbox.cached_command_choices(a="d", b="e", c="f") == diff_name_and_value
+
+
+def test_cached_command_choices_distinguishes_types():
+    assert toolbox.cached_command_choices(1, 2)[0].name == "1"
+    assert toolbox.cached_command_choices(1.0, 2)[0].name == "1.0"
+    assert toolbox.cached_command_choices(True, 2)[0].name == "True"
+    assert toolbox.cached_command_choices([(1, "b")])[0].name == "1"
+    assert toolbox.cached_command_choices([[1.0, "b"]])[0].name == "1.0"
+
+
+def test_cached_command_choices_empty():
+    for args in ((), ([],), ((),), ({},)):
+        assert toolbox.cached_command_choices(*args) == tuple(toolbox.as_command_choices(*args)) == ()
+
+
+def test_cached_command_choices_eviction():
+    first = toolbox.cached_command_choices("evicted")
+
+    for i in range(1024):
+        toolbox.cached_command_choices(f"choice {i}")
+
+    assert toolbox.cached_command_choices("evicted") is not first
+
+
+def test_choice_index_prefix():
+    index = toolbox.ChoiceIndex(["Europe/Berlin", "Europe/Amsterdam", "America/New_York", "Asia/Tokyo", "Europe"])
+
+    assert [choice.name for choice in index.search("eur")] == ["Europe", "Europe/Amsterdam", "Europe/Berlin"]
+    assert [choice.name for choice in index.search("EUROPE/B")][0] == "Europe/Berlin"
+    assert [choice.name for choice in index.search("eur", limit=2)] == ["Europe", "Europe/Amsterdam"]
+    assert len(index.search("")) == 5
+
+
+def test_choice_index_substring_beats_partial_match():
+    # Shorter names sharing every trigram of the query without containing it, more than are compared per search
+    names = [f"424 242 {i}" for i in range(1000)] + ["a much longer name with 4242 in it"]
+    index = toolbox.ChoiceIndex(names)
+
+    assert [choice.name for choice in index.search("4242", limit=2)] == [names[-1], "424 242 0"]
+
+
+def test_choice_index_short_query():
+    index = toolbox.ChoiceIndex(["America/New_York", "Europe/London", "Asia/Tokyo", "yo"])
+
+    assert [choice.name for choice in index.search("to")] == ["Asia/Tokyo"]
+    assert [choice.name for choice in index.search("yo")] == ["yo", "Asia/Tokyo", "America/New_York"]
+    assert [choice.name for choice in index.search("o")] == ["yo", "Asia/Tokyo", "Europe/London", "America/New_York"]
+    assert [choice.name for choice in index.search("o", limit=2)] == ["yo", "Asia/Tokyo"]
+
+
+def test_choice_index_fuzzy():
+    index = toolbox.ChoiceIndex({"New York": "ny", "Newark": "nwk", "York": "yrk", "Tokyo": "tyo"})
+
+    results = index.search("york")
+
+    assert [choice.value for choice in results] == ["yrk", "ny"]
+    assert [choice.value for choice in index.search("new yrok")] == ["ny"]  # Typo
+    assert index.search("zzz") == []
+
+
+def test_choice_index_returns_choices():
+    index = toolbox.ChoiceIndex([["Red", 1], ["Green", 2]])
+
+    assert index.search("gre") == [hikari.CommandChoice(name="Green", value=2)]
+    assert index.search("gre")[0] is index.choices[1]
+    assert len(index) == 2
+
+
+def test_generator_choices(same_name_and_value):
+    assert toolbox.as_command_choices(name for name in "abc") == same_name_and_value
+    assert toolbox.as_command_choices(iter([])) == ()
+
+
+def test_conversions_share_pairs():
+    for choices in ([("a", "d"), ["b", "e"], "c"], [None, "a"], [0, ("b", 1)]):
+        expected = tuple(toolbox.iter_command_choices(choices, limit=None))
+
+        assert toolbox.as_command_choices(choices) == expected
+        assert toolbox.as_command_choices(iter(choices)) == expected
+        assert toolbox.cached_command_choices(choices) == expected
+
+    assert toolbox.as_command_choices([("a", "d")]) == (hikari.CommandChoice(name="a", value="d"),)
+
+
+def test_iter_command_choices_limit():
+    consumed = []
+
+    def rows():
+        for i in range(1000):
+            consumed.append(i)
+            yield (f"tag {i}", i)
+
+    choices = list(toolbox.iter_command_choices(rows()))
+
+    assert len(choices) == 25
+    assert choices[3] == hikari.CommandChoice(name="tag 3", value=3)
+    assert len(consumed) == 25
+
+
+def test_iter_command_choices_mapping(diff_name_and_value):
+    assert tuple(toolbox.iter_command_choices({"a": "d", "b": "e", "c": "f", "x": "y"}, limit=3)) == diff_name_and_value
+    assert len(list(toolbox.iter_command_choices(range(100), limit=None))) == 100
+
+
+@pytest.mark.asyncio
+async def test_aiter_command_choices():
+    consumed = []
+
+    async def rows():
+        for i in range(100):
+            consumed.append(i)
+            yield [str(i), i]
+
+    choices = [choice async for choice in toolbox.aiter_command_choices(rows(), limit=10)]
+
+    assert choices == [hikari.CommandChoice(name=str(i), value=i) for i in range(10)]
+    assert len(consumed) == 10
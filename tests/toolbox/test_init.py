@@ -0,0 +1,68 @@
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+import toolbox
+
+
+def test_all_matches_submodules():
+    submodules = (
+        "checks",
+        "commands",
+        "errors",
+        "instrumentation",
+        "members",
+        "messages",
+        "permissions",
+        "roles",
+        "snapshots",
+        "strings",
+    )
+    expected = [name for submodule in submodules for name in importlib.import_module(f"toolbox.{submodule}").__all__]
+
+    assert list(toolbox.__all__) == expected
+    assert all(getattr(toolbox, name) is getattr(toolbox.strings, name) for name in toolbox.strings.__all__)
+    assert set(toolbox.__all__) <= set(dir(toolbox))
+
+
+def test_missing_attribute():
+    with pytest.raises(AttributeError):
+        toolbox.does_not_exist
+
+
+@pytest.mark.parametrize(
+    ("statement", "imported"),
+    [
+        ("import toolbox", set()),
+        ("import toolbox; toolbox.sort_roles", {"toolbox.internal", "toolbox.roles"}),
+        ("import toolbox.roles", {"toolbox.internal", "toolbox.roles"}),
+        ("from toolbox import remove_markdown", {"toolbox.internal", "toolbox.strings"}),
+    ],
+)
+def test_submodules_imported_on_first_use(statement, imported):
+    code = f"import sys; {statement}; print(sorted(m for m in sys.modules if m.startswith('toolbox.')))"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+    assert output.strip() == repr(sorted(imported))
+
+
+def test_strings_does_not_import_hikari():
+    code = (
+        "import sys, datetime, toolbox; toolbox.remove_markdown('**a**'); toolbox.format_dt(datetime.datetime.now()); "
+        "list(toolbox.ContentScanner(message_links=False).scan('https://example.com')); print('hikari' in sys.modules)"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+    assert output.strip() == "False"
+
+
+def test_regexes_compiled_on_first_use():
+    code = (
+        "import toolbox.strings as s; s.remove_markdown('**a**'); "
+        "print(s._link_regex.cache_info().currsize, s._format_dict.cache_info().currsize, type(s.LINK_REGEX).__name__)"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+    assert output.split() == ["0", "1", "Pattern"]
@@ -0,0 +1,92 @@
+import asyncio
+from unittest import mock
+
+import hikari
+import pytest
+
+import toolbox
+
+
+@pytest.fixture()
+def instrumentation():
+    toolbox.reset_instrumentation()
+    toolbox.enable_instrumentation(sample_size=10)
+    yield
+    toolbox.disable_instrumentation()
+    toolbox.reset_instrumentation()
+
+
+def test_enable_and_disable():
+    original = toolbox.remove_markdown
+
+    toolbox.enable_instrumentation()
+    assert toolbox.is_instrumentation_enabled()
+    assert toolbox.remove_markdown is not original
+    assert toolbox.strings.remove_markdown is toolbox.remove_markdown
+    assert toolbox.remove_markdown.__wrapped__ is original
+
+    toolbox.disable_instrumentation()
+    assert not toolbox.is_instrumentation_enabled()
+    assert toolbox.remove_markdown is original
+    assert toolbox.strings.remove_markdown is original
+    assert not hasattr(toolbox.PermissionResolver.calculate_permissions, "__wrapped__")
+
+
+def test_disable_restores_names_first_accessed_while_enabled():
+    original = toolbox.strings.find_urls
+    vars(toolbox).pop("find_urls", None)  # Not yet cached by the package
+    toolbox.reset_instrumentation()
+
+    toolbox.enable_instrumentation()
+    assert toolbox.find_urls is not original
+    toolbox.disable_instrumentation()
+
+    assert toolbox.find_urls is original
+    list(toolbox.find_urls("https://example.com"))
+    assert toolbox.get_instrumentation_snapshot()["functions"] == {}
+
+
+def test_records_calls(instrumentation):
+    for _ in range(20):
+        assert toolbox.remove_markdown("**a**") == "a"
+
+    with pytest.raises(toolbox.EmbedValidationError):
+        toolbox.validate_embed(hikari.Embed(title="a" * 300))
+
+    functions = toolbox.get_instrumentation_snapshot()["functions"]
+
+    assert functions["remove_markdown"]["calls"] == 20
+    assert functions["remove_markdown"]["errors"] == 0
+    assert 0 < functions["remove_markdown"]["p50_seconds"] <= functions["remove_markdown"]["max_seconds"]
+    assert (functions["validate_embed"]["calls"], functions["validate_embed"]["errors"]) == (1, 1)
+
+
+def test_records_iterators_when_consumed(instrumentation):
+    urls = toolbox.find_urls("https://example.com and https://example.org")
+    assert "find_urls" not in toolbox.get_instrumentation_snapshot()["functions"]
+
+    assert len(list(urls)) == 2
+    next(toolbox.ContentScanner().scan("**a** **b**"))
+
+    functions = toolbox.get_instrumentation_snapshot()["functions"]
+    assert functions["find_urls"]["calls"] == 1
+    assert functions["ContentScanner.scan"]["calls"] == 1
+
+
+@pytest.mark.asyncio
+async def test_records_coroutines_and_caches(instrumentation):
+    bot = mock.Mock()
+    bot.rest.fetch_message = mock.AsyncMock(return_value=mock.Mock())
+    cache = toolbox.MessageCache()
+    toolbox.track_cache("messages", cache)
+    link = "https://discord.com/channels/1/2/3"
+
+    await toolbox.fetch_message_from_link(link, bot=bot, cache=cache)
+    await toolbox.fetch_message_from_link(link, bot=bot, cache=cache)
+    await asyncio.sleep(0)
+
+    snapshot = toolbox.get_instrumentation_snapshot()
+    assert snapshot["enabled"]
+    assert snapshot["functions"]["fetch_message_from_link"]["calls"] == 2
+    assert snapshot["functions"]["MessageCache.fetch_message"]["calls"] == 2
+    assert snapshot["caches"]["messages"] == {"hits": 1, "misses": 1, "size": 1, "hit_rate": 0.5}
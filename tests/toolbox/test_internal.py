@@ -0,0 +1,65 @@
+import asyncio
+import concurrent.futures
+
+import pytest
+
+from toolbox.internal import submit_batched
+
+
+class CountingExecutor(concurrent.futures.ThreadPoolExecutor):
+    def __init__(self) -> None:
+        super().__init__(max_workers=1)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+def double(value: int) -> int:
+    if value < 0:
+        raise ValueError(value)
+    return value * 2
+
+
+@pytest.mark.asyncio
+async def test_calls_within_window_are_batched():
+    with CountingExecutor() as executor:
+        results = await asyncio.gather(*(submit_batched(executor, double, i) for i in range(10)))
+        assert executor.submitted == 1
+
+        await asyncio.gather(*(submit_batched(executor, double, i, max_batch_size=4) for i in range(10)))
+        assert executor.submitted == 4
+
+    assert results == [i * 2 for i in range(10)]
+
+
+@pytest.mark.asyncio
+async def test_failing_call_does_not_fail_batch():
+    with CountingExecutor() as executor:
+        results = await asyncio.gather(
+            *(submit_batched(executor, double, i) for i in (1, -1, 2)), return_exceptions=True
+        )
+
+    assert results[0] == 2 and results[2] == 4
+    assert isinstance(results[1], ValueError)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_call():
+    with CountingExecutor() as executor:
+        cancelled = submit_batched(executor, double, 1)
+        other = submit_batched(executor, double, 2)
+        cancelled.cancel()
+
+        assert await other == 4
+        assert cancelled.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_shut_down_executor():
+    executor = CountingExecutor()
+    executor.shutdown()
+
+    with pytest.raises(RuntimeError):
+        await submit_batched(executor, double, 1)
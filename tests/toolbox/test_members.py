@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import random
 from unittest import mock
 
 import hikari
+import pytest
 
 import toolbox
 from tests import utils
@@ -37,6 +39,236 @@ def test_highest_role_no_color():
     assert toolbox.get_member_color(member) == hikari.Color(100)
 
 
+def test_calculate_permissions_bulk():
+    guild = utils.make_guild(
+        [
+            utils.make_role(id=100, permissions=hikari.Permissions.VIEW_CHANNEL),
+            utils.make_role(id=1, permissions=hikari.Permissions.SEND_MESSAGES),
+            utils.make_role(id=2, permissions=hikari.Permissions.BAN_MEMBERS),
+        ],
+        id=100,
+        owner_id=10,
+    )
+    channel = utils.make_channel(
+        {1: (hikari.Permissions.NONE, hikari.Permissions.VIEW_CHANNEL), 12: (hikari.Permissions.KICK_MEMBERS, 0)},
+        id=200,
+        guild_id=100,
+    )
+    members = [
+        utils.make_guild_member(guild, id=10, role_ids=[100]),
+        utils.make_guild_member(guild, id=11, role_ids=[100, 1]),
+        utils.make_guild_member(guild, id=12, role_ids=[100, 1]),
+        utils.make_guild_member(guild, id=13, role_ids=[100, 2, 1]),
+    ]
+
+    for target in (None, channel):
+        assert toolbox.calculate_permissions_bulk(iter(members), target) == {
+            member.id: toolbox.calculate_permissions(member, target) for member in members
+        }
+
+
+def test_calculate_permissions_bulk_empty():
+    assert toolbox.calculate_permissions_bulk([]) == {}
+
+
+def test_calculate_permissions_bulk_different_guilds():
+    roles = [utils.make_role(id=100)]
+    members = [
+        utils.make_guild_member(utils.make_guild(roles, id=100), id=10, role_ids=[]),
+        utils.make_guild_member(utils.make_guild(roles, id=101), id=11, role_ids=[]),
+    ]
+
+    with pytest.raises(ValueError):
+        toolbox.calculate_permissions_bulk(members)
+
+
+@pytest.fixture
+def hierarchy_guild():
+    return utils.make_guild(
+        [
+            utils.make_role(id=100, position=0),
+            utils.make_role(id=1, position=1, permissions=hikari.Permissions.BAN_MEMBERS),
+            utils.make_role(id=2, position=2),
+            utils.make_role(id=3, position=2),
+            utils.make_role(id=4, position=3, permissions=hikari.Permissions.ADMINISTRATOR),
+        ],
+        id=100,
+        owner_id=10,
+    )
+
+
+def test_role_hierarchy_is_above(hierarchy_guild):
+    hierarchy = toolbox.RoleHierarchy(hierarchy_guild)
+    low = utils.make_guild_member(hierarchy_guild, id=11, role_ids=[100, 1])
+    tied_low_id = utils.make_guild_member(hierarchy_guild, id=12, role_ids=[100, 1, 2])
+    tied_high_id = utils.make_guild_member(hierarchy_guild, id=13, role_ids=[100, 3])
+
+    assert hierarchy.is_above(tied_low_id, low)
+    assert hierarchy.is_above(tied_low_id, tied_high_id)
+    assert not hierarchy.is_above(tied_high_id, tied_low_id)
+    assert not hierarchy.is_above(low, low)
+
+
+def test_role_hierarchy_can_moderate(hierarchy_guild):
+    hierarchy = toolbox.RoleHierarchy(hierarchy_guild)
+    resolver = toolbox.PermissionResolver(hierarchy_guild)
+    owner = utils.make_guild_member(hierarchy_guild, id=10, role_ids=[100])
+    admin = utils.make_guild_member(hierarchy_guild, id=11, role_ids=[100, 4])
+    moderator = utils.make_guild_member(hierarchy_guild, id=12, role_ids=[100, 1, 2])
+    member = utils.make_guild_member(hierarchy_guild, id=13, role_ids=[100])
+
+    for moderator_, member_, permissions in (
+        (moderator, member, hikari.Permissions.BAN_MEMBERS),
+        (moderator, member, hikari.Permissions.KICK_MEMBERS),
+        (admin, member, hikari.Permissions.KICK_MEMBERS),
+        (admin, owner, hikari.Permissions.NONE),
+        (member, moderator, hikari.Permissions.NONE),
+        (moderator, member, hikari.Permissions.NONE),
+    ):
+        expected = toolbox.can_moderate(moderator_, member_, permissions)
+        assert hierarchy.can_moderate(moderator_, member_, permissions) == expected
+        assert hierarchy.can_moderate(moderator_, member_, permissions, resolver=resolver) == expected
+
+
+def test_role_hierarchy_updates(hierarchy_guild):
+    hierarchy = toolbox.RoleHierarchy(hierarchy_guild)
+    member1 = utils.make_guild_member(hierarchy_guild, id=11, role_ids=[100, 1])
+    member2 = utils.make_guild_member(hierarchy_guild, id=12, role_ids=[100, 2])
+    assert hierarchy.is_above(member2, member1)
+
+    hierarchy.update_role(utils.make_role(id=1, position=5))
+    assert hierarchy.is_above(member1, member2)
+
+    hierarchy.remove_role(1)
+    assert hierarchy.is_above(member2, member1)
+
+    member2.role_ids = [hikari.Snowflake(100)]
+    hierarchy.update_member(member2)
+    assert not hierarchy.is_above(member2, member1)
+    assert not hierarchy.is_above(member1, member2)
+
+
+def test_role_hierarchy_missing_roles(hierarchy_guild):
+    hierarchy = toolbox.RoleHierarchy(hierarchy_guild)
+    member = utils.make_guild_member(hierarchy_guild, id=11, role_ids=[])
+
+    with pytest.raises(toolbox.CacheFailureError):
+        hierarchy.is_above(member, member)
+
+
+def test_role_hierarchy_tied_top_roles():
+    guild = utils.make_guild(
+        [
+            utils.make_role(id=10, position=5),
+            utils.make_role(id=15, position=5),
+            utils.make_role(id=20, position=5),
+        ],
+        id=100,
+    )
+    hierarchy = toolbox.RoleHierarchy(guild)
+    member1 = utils.make_guild_member(guild, id=1, role_ids=[20, 10])
+    member2 = utils.make_guild_member(guild, id=2, role_ids=[15])
+
+    assert not toolbox.is_above(member1, member2)
+    assert not hierarchy.is_above(member1, member2)
+    assert hierarchy.is_above(member2, member1) == toolbox.is_above(member2, member1)
+
+
+def test_role_hierarchy_matches_is_above():
+    rng = random.Random(7)
+    positions = [rng.randrange(20) for _ in range(100)]
+    guild = utils.make_guild(
+        [utils.make_role(id=100, position=0)]
+        + [utils.make_role(id=role_id, position=positions[role_id]) for role_id in range(1, 100)],
+        id=100,
+    )
+    hierarchy = toolbox.RoleHierarchy(guild)
+    members = [
+        utils.make_guild_member(guild, id=1000 + i, role_ids=[100, *rng.sample(range(1, 100), rng.randint(0, 5))])
+        for i in range(50)
+    ]
+
+    for member1 in members:
+        for member2 in members:
+            assert hierarchy.is_above(member1, member2) == toolbox.is_above(member1, member2)
+
+
+def test_member_color_resolver():
+    guild = utils.make_guild(
+        [
+            utils.make_role(id=100, position=0),
+            utils.make_role(id=1, position=1, color=hikari.Color(200)),
+            utils.make_role(id=2, position=2, color=hikari.Color(100)),
+            utils.make_role(id=3, position=3),
+        ],
+        id=100,
+    )
+    colors = toolbox.MemberColorResolver(guild)
+
+    assert colors.get_color(utils.make_guild_member(guild, id=10, role_ids=[100])) == hikari.Color(0)
+    assert colors.get_color(utils.make_guild_member(guild, id=11, role_ids=[100, 1, 3])) == hikari.Color(200)
+    assert colors.get_color(utils.make_guild_member(guild, id=12, role_ids=[100, 1, 2, 3])) == hikari.Color(100)
+
+
+def test_member_color_resolver_updates():
+    guild = utils.make_guild(
+        [utils.make_role(id=1, position=1, color=hikari.Color(200)), utils.make_role(id=2, position=2)], id=100
+    )
+    colors = toolbox.MemberColorResolver(guild, max_cache_size=1)
+    assert colors.get_color_for([1, 2]) == hikari.Color(200)
+
+    colors.update_role(utils.make_role(id=2, position=2, color=hikari.Color(300)))
+    assert colors.get_color_for([1, 2]) == hikari.Color(300)
+
+    colors.update_role(utils.make_role(id=1, position=3, color=hikari.Color(200)))
+    assert colors.get_color_for([1, 2]) == hikari.Color(200)
+
+    colors.remove_role(1)
+    assert colors.get_color_for([1, 2]) == hikari.Color(300)
+
+    colors.update_role(utils.make_role(id=2, position=2))
+    assert colors.get_color_for([1, 2]) == hikari.Color(0)
+
+
+@pytest.mark.parametrize("max_cache_size", [0, -1])
+def test_member_color_resolver_invalid_max_cache_size(max_cache_size):
+    with pytest.raises(ValueError):
+        toolbox.MemberColorResolver(utils.make_guild([], id=100), max_cache_size=max_cache_size)
+
+
+def test_member_color_resolver_tied_roles():
+    guild = utils.make_guild(
+        [
+            utils.make_role(id=10, position=5, color=hikari.Color(1)),
+            utils.make_role(id=20, position=5, color=hikari.Color(2)),
+        ],
+        id=100,
+    )
+    colors = toolbox.MemberColorResolver(guild)
+    member1 = utils.make_guild_member(guild, id=1, role_ids=[20, 10])
+    member2 = utils.make_guild_member(guild, id=2, role_ids=[10, 20])
+
+    assert colors.get_color(member1) == toolbox.get_member_color(member1) == hikari.Color(2)
+    assert colors.get_color(member2) == toolbox.get_member_color(member2) == hikari.Color(1)
+
+
+def test_member_color_resolver_matches_get_member_color():
+    rng = random.Random(3)
+    positions = [rng.randrange(20) for _ in range(100)]
+    guild = utils.make_guild(
+        [
+            utils.make_role(id=role_id, position=positions[role_id], color=hikari.Color(rng.choice((0, role_id))))
+            for role_id in range(100)
+        ],
+        id=100,
+    )
+    colors = toolbox.MemberColorResolver(guild, max_cache_size=10)
+
+    for member_id in range(200):
+        member = utils.make_guild_member(guild, id=member_id, role_ids=rng.sample(range(100), rng.randint(0, 5)))
+        assert colors.get_color(member) == toolbox.get_member_color(member)
+
+
 def test_user_possessive_no_s():
     user = mock.Mock(["username"])
     user.username = "RickAstley"
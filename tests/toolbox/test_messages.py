@@ -1,3 +1,5 @@
+import asyncio
+import time
 from unittest import mock
 
 import hikari
@@ -20,6 +22,216 @@ async def test_fetch_message_from_link():
     bot.rest.fetch_message.assert_called_with(channel_id, message_id)
 
 
+@pytest.mark.asyncio
+async def test_fetch_message_from_link_invalid():
+    with pytest.raises(ValueError):
+        await toolbox.fetch_message_from_link("https://example.com/channels/1/2/3", bot=mock.Mock())
+
+
+def test_find_message_links():
+    content = (
+        "see https://discord.com/channels/1/2/3, https://ptb.discordapp.com/channels/@me/4/5?x "
+        "and https://example.com/channels/6/7/8 or (https://canary.discord.com/channels/9/10/11)"
+    )
+
+    links = list(toolbox.find_message_links(content))
+
+    assert [(link.guild_id, link.channel_id, link.message_id) for link in links] == [
+        (1, 2, 3),
+        (None, 4, 5),
+        (9, 10, 11),
+    ]
+    assert content[slice(*links[0].span)] == "https://discord.com/channels/1/2/3"
+
+
+def test_find_message_links_none():
+    assert list(toolbox.find_message_links("no links here")) == []
+
+
+class StubREST:
+    """Records calls to fetch_message, returning (channel_id, message_id) tuples in place of messages."""
+
+    def __init__(self, *, delay: float = 0.01, missing: tuple = ()) -> None:
+        self.delay = delay
+        self.missing = missing
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def fetch_message(self, channel_id, message_id):
+        self.calls.append((time.perf_counter(), channel_id, message_id))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+
+        if message_id in self.missing:
+            raise LookupError(message_id)
+
+        return (channel_id, message_id)
+
+
+class StubBot:
+    def __init__(self, **kwargs) -> None:
+        self.rest = StubREST(**kwargs)
+
+
+def make_link(channel_id, message_id):
+    return f"https://discord.com/channels/574921006817476608/{channel_id}/{message_id}"
+
+
+@pytest.mark.asyncio
+async def test_fetch_messages_from_links():
+    bot = StubBot(missing=(3,))
+    links = [make_link(1, 1), "not a link", make_link(2, 2), make_link(1, 1), make_link(3, 3)]
+
+    results = await toolbox.fetch_messages_from_links(links, bot=bot)
+
+    assert results[0] == (1, 1)
+    assert isinstance(results[1], ValueError)
+    assert results[2] == (2, 2)
+    assert results[3] == (1, 1)
+    assert isinstance(results[4], LookupError)
+    assert sorted(call[1:] for call in bot.rest.calls) == [(1, 1), (2, 2), (3, 3)]
+
+
+@pytest.mark.asyncio
+async def test_fetch_messages_from_links_concurrency():
+    bot = StubBot(delay=0.02)
+    links = [make_link(1, message_id) for message_id in range(20)]
+
+    start = time.perf_counter()
+    results = await toolbox.fetch_messages_from_links(links, bot=bot, concurrency=5)
+    elapsed = time.perf_counter() - start
+
+    assert results == [(1, message_id) for message_id in range(20)]
+    assert bot.rest.max_in_flight == 5
+    assert elapsed < 20 * 0.02  # Faster than awaiting them one by one
+
+
+@pytest.mark.asyncio
+async def test_fetch_messages_from_links_cache():
+    bot = StubBot()
+    bot.cache = mock.Mock()
+    bot.cache.get_message.side_effect = lambda message_id: "cached" if message_id == 1 else None
+
+    results = await toolbox.fetch_messages_from_links([make_link(1, 1), make_link(1, 2)], bot=bot)
+
+    assert results == ["cached", (1, 2)]
+    assert [call[1:] for call in bot.rest.calls] == [(1, 2)]
+
+
+@pytest.mark.asyncio
+async def test_fetch_messages_from_links_invalid_concurrency():
+    with pytest.raises(ValueError):
+        await toolbox.fetch_messages_from_links([], bot=StubBot(), concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_message_cache_hits_and_coalescing():
+    bot = StubBot()
+    cache = toolbox.MessageCache()
+
+    first = await asyncio.gather(
+        *(toolbox.fetch_message_from_link(make_link(1, 1), bot=bot, cache=cache) for _ in range(3))
+    )
+    second = await toolbox.fetch_message_from_link(make_link(1, 1), bot=bot, cache=cache)
+
+    assert first == [(1, 1)] * 3
+    assert second == (1, 1)
+    assert len(bot.rest.calls) == 1
+    assert (cache.misses, cache.coalesced, cache.hits) == (1, 2, 1)
+
+
+@pytest.mark.asyncio
+async def test_message_cache_ttl():
+    bot = StubBot(delay=0)
+    cache = toolbox.MessageCache(ttl=10)
+
+    with mock.patch.object(time, "monotonic", return_value=100):
+        await cache.fetch_message(1, 1, bot=bot)
+    with mock.patch.object(time, "monotonic", return_value=105):
+        await cache.fetch_message(1, 1, bot=bot)
+    with mock.patch.object(time, "monotonic", return_value=111):
+        await cache.fetch_message(1, 1, bot=bot)
+
+    assert len(bot.rest.calls) == 2
+    assert (cache.misses, cache.hits) == (2, 1)
+
+
+@pytest.mark.asyncio
+async def test_message_cache_lru_eviction():
+    bot = StubBot(delay=0)
+    cache = toolbox.MessageCache(max_size=2)
+
+    await cache.fetch_message(1, 1, bot=bot)
+    await cache.fetch_message(1, 2, bot=bot)
+    await cache.fetch_message(1, 1, bot=bot)  # 2 is now the least recently used
+    await cache.fetch_message(1, 3, bot=bot)
+
+    assert len(cache) == 2
+    await cache.fetch_message(1, 1, bot=bot)
+    await cache.fetch_message(1, 2, bot=bot)
+    assert [call[1:] for call in bot.rest.calls] == [(1, 1), (1, 2), (1, 3), (1, 2)]
+
+
+@pytest.mark.asyncio
+async def test_message_cache_errors_not_cached():
+    bot = StubBot(delay=0, missing=(1,))
+    cache = toolbox.MessageCache()
+
+    for _ in range(2):
+        with pytest.raises(LookupError):
+            await cache.fetch_message(1, 1, bot=bot)
+
+    assert len(bot.rest.calls) == 2
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_message_cache_invalidation():
+    bot = StubBot(delay=0)
+    cache = toolbox.MessageCache()
+    await cache.fetch_message(1, 1, bot=bot)
+    await cache.fetch_message(1, 2, bot=bot)
+    await cache.fetch_message(2, 3, bot=bot)
+
+    await cache._on_message_event(mock.Mock(channel_id=1, message_id=1))
+    await cache._on_bulk_delete(mock.Mock(channel_id=1, message_ids=[2, 3]))
+
+    assert len(cache) == 1
+    await cache.fetch_message(2, 3, bot=bot)
+    assert cache.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_message_cache_invalidated_while_fetching():
+    bot = StubBot()
+    cache = toolbox.MessageCache()
+
+    task = asyncio.ensure_future(cache.fetch_message(1, 1, bot=bot))
+    await asyncio.sleep(0)
+    cache.invalidate(1, 1)
+
+    assert await task == (1, 1)
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_fetch_messages_from_links_message_cache():
+    bot = StubBot(delay=0)
+    cache = toolbox.MessageCache()
+    await cache.fetch_message(1, 1, bot=bot)
+
+    results = await toolbox.fetch_messages_from_links([make_link(1, 1), make_link(1, 2)], bot=bot, cache=cache)
+
+    assert results == [(1, 1), (1, 2)]
+    assert [call[1:] for call in bot.rest.calls] == [(1, 1), (1, 2)]
+    assert cache.hits == 1
+
+
 def test_validate_embed_valid():
     toolbox.validate_embed(
         hikari.Embed(
@@ -77,3 +289,100 @@ def test_validate_embed_footer():
 def test_validate_embed_author():
     with pytest.raises(toolbox.EmbedValidationError):
         toolbox.validate_embed(hikari.Embed().set_author(name="a" * 300))
+
+
+def test_validate_embed_collects_all_violations():
+    embed = hikari.Embed(title="a" * 300, description="a" * 5000).add_field(name="a", value="a" * 1100)
+
+    with pytest.raises(toolbox.EmbedValidationError) as exc_info:
+        toolbox.validate_embed(embed)
+
+    assert exc_info.value.violations == [
+        toolbox.EmbedViolation(0, "title", 300, 256),
+        toolbox.EmbedViolation(0, "description", 5000, 4096),
+        toolbox.EmbedViolation(0, "fields[0].value", 1100, 1024),
+        toolbox.EmbedViolation(0, "total", 6401, 6000),
+    ]
+    assert "Embed 0 title must be at most 256 characters, got 300." in str(exc_info.value)
+
+
+def test_find_embed_violations_total_length_matches_hikari():
+    embed = (
+        hikari.Embed(title="title", description="description")
+        .add_field(name="name", value="value")
+        .set_footer(text="footer")
+        .set_author(name="author")
+    )
+    violations = toolbox.find_embed_violations([embed] * 400)
+
+    assert violations[0] == toolbox.EmbedViolation(None, "total", embed.total_length() * 400, 6000)
+
+
+def test_validate_embeds():
+    embeds = [hikari.Embed(description="a" * 1000) for _ in range(7)]
+
+    assert toolbox.validate_embeds(embeds[:6]) == embeds[:6]  # Exactly 6000 characters
+    with pytest.raises(toolbox.EmbedValidationError) as exc_info:
+        toolbox.validate_embeds(embeds)
+
+    assert exc_info.value.violations == [toolbox.EmbedViolation(None, "total", 7000, 6000)]
+
+
+def test_find_embed_violations_message_limits():
+    assert toolbox.find_embed_violations([hikari.Embed(description="a" * 3001)] * 2) == [
+        toolbox.EmbedViolation(None, "total", 6002, 6000)
+    ]
+    assert toolbox.find_embed_violations([hikari.Embed(title="a")] * 11) == [
+        toolbox.EmbedViolation(None, "embeds", 11, 10)
+    ]
+    assert toolbox.find_embed_violations([hikari.Embed(title="a")] * 10) == []
+
+
+def test_paginate_embed_description():
+    lines = [f"line {i} " + "a" * (i % 200) for i in range(500)]
+
+    pages = list(toolbox.paginate_embed(iter(lines), title="Title", color=0xFF0000))
+
+    assert len(pages) > 1
+    assert all(page.title == "Title" and page.color == 0xFF0000 for page in pages)
+    assert "\n".join(page.description for page in pages) == "\n".join(lines)
+    assert all(len(page.description) <= 4096 for page in pages)
+
+
+def test_paginate_embed_long_line():
+    pages = list(toolbox.paginate_embed(["a" * 10000]))
+
+    assert [len(page.description) for page in pages] == [4096, 4096, 1808]
+
+
+def test_paginate_embed_fields():
+    fields = [(f"name {i}", "value\n" * 300, i % 2 == 0) for i in range(30)]
+
+    pages = list(toolbox.paginate_embed(["header"], fields))
+
+    assert pages[0].description == "header"
+    all_fields = [field for page in pages for field in page.fields]
+    for i in range(30):
+        chunks = [field for field in all_fields if field.name == f"name {i}"]
+        assert len(chunks) == 2  # 1799 characters are split in two
+        assert "\n".join(field.value for field in chunks) == "value\n" * 300
+        assert all(field.is_inline == (i % 2 == 0) for field in chunks)
+
+    for page in pages:
+        toolbox.validate_embed(page)
+
+
+def test_paginate_embed_empty():
+    assert list(toolbox.paginate_embed()) == []
+
+
+def test_batch_embeds():
+    fields = ((str(i), "a" * 1000) for i in range(100))
+
+    batches = list(toolbox.batch_embeds(toolbox.paginate_embed(fields=fields)))
+
+    assert sum(len(page.fields) for batch in batches for page in batch) == 100
+    for batch in batches:
+        toolbox.validate_embeds(batch)
+
+    assert [len(batch) for batch in toolbox.batch_embeds(hikari.Embed(title="a") for _ in range(25))] == [10, 10, 5]
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import random
+from unittest import mock
+
+import hikari
+import pytest
+
+import toolbox
+from tests import utils
+
+GUILD_ID = 1000
+OWNER_ID = 1
+
+
+def random_permissions(rng: random.Random) -> hikari.Permissions:
+    return hikari.Permissions(rng.getrandbits(41) & ~hikari.Permissions.ADMINISTRATOR)
+
+
+def make_member(guild: hikari.GatewayGuild, id: int, role_ids: list[int]) -> hikari.Member:
+    return utils.make_guild_member(guild, id=id, role_ids=role_ids)
+
+
+@pytest.fixture
+def guild():
+    return utils.make_guild(
+        [
+            utils.make_role(id=GUILD_ID, permissions=hikari.Permissions.VIEW_CHANNEL),
+            utils.make_role(id=1, permissions=hikari.Permissions.SEND_MESSAGES),
+            utils.make_role(id=2, permissions=hikari.Permissions.BAN_MEMBERS),
+            utils.make_role(id=3, permissions=hikari.Permissions.ADMINISTRATOR),
+        ],
+        id=GUILD_ID,
+        owner_id=OWNER_ID,
+    )
+
+
+@pytest.fixture
+def channel():
+    return utils.make_channel(
+        {
+            GUILD_ID: (hikari.Permissions.NONE, hikari.Permissions.VIEW_CHANNEL),
+            1: (hikari.Permissions.VIEW_CHANNEL, hikari.Permissions.NONE),
+        },
+        id=2000,
+        guild_id=GUILD_ID,
+    )
+
+
+def test_role_permissions(guild):
+    resolver = toolbox.PermissionResolver(guild)
+    member = make_member(guild, 10, [GUILD_ID, 1, 2])
+
+    assert resolver.calculate_permissions(member) == (
+        hikari.Permissions.VIEW_CHANNEL | hikari.Permissions.SEND_MESSAGES | hikari.Permissions.BAN_MEMBERS
+    )
+
+
+def test_channel_permissions(guild, channel):
+    resolver = toolbox.PermissionResolver(guild)
+
+    assert resolver.calculate_permissions(make_member(guild, 10, [GUILD_ID]), channel) == hikari.Permissions.NONE
+    assert resolver.calculate_permissions(make_member(guild, 11, [GUILD_ID, 1]), channel) == (
+        hikari.Permissions.VIEW_CHANNEL | hikari.Permissions.SEND_MESSAGES
+    )
+
+
+def test_owner_and_administrator(guild, channel):
+    resolver = toolbox.PermissionResolver(guild)
+
+    assert resolver.calculate_permissions(make_member(guild, OWNER_ID, []), channel) == (
+        hikari.Permissions.all_permissions()
+    )
+    assert resolver.calculate_permissions(make_member(guild, 10, [3]), channel) == hikari.Permissions.all_permissions()
+
+
+def test_missing_everyone_role():
+    with pytest.raises(toolbox.CacheFailureError):
+        toolbox.PermissionResolver(utils.make_guild([], id=GUILD_ID))
+
+
+@pytest.mark.parametrize("max_cache_size", [0, -1])
+def test_invalid_max_cache_size(guild, max_cache_size):
+    with pytest.raises(ValueError):
+        toolbox.PermissionResolver(guild, max_cache_size=max_cache_size)
+
+
+def test_max_cache_size_of_one(guild):
+    resolver = toolbox.PermissionResolver(guild, max_cache_size=1)
+
+    for role_ids in ([guild.id], [guild.id, 1], [guild.id]):
+        member = make_member(guild, 10, role_ids)
+        assert resolver.calculate_permissions(member) == toolbox.calculate_permissions(member)
+
+
+def test_update_role(guild):
+    resolver = toolbox.PermissionResolver(guild)
+    member = make_member(guild, 10, [GUILD_ID, 1])
+    other = make_member(guild, 11, [GUILD_ID, 2])
+    assert resolver.calculate_permissions(member) & hikari.Permissions.SEND_MESSAGES
+    assert resolver.calculate_permissions(other) & hikari.Permissions.BAN_MEMBERS
+
+    resolver.update_role(utils.make_role(id=1, permissions=hikari.Permissions.KICK_MEMBERS))
+
+    assert resolver.calculate_permissions(member) == hikari.Permissions.VIEW_CHANNEL | hikari.Permissions.KICK_MEMBERS
+    assert resolver.calculate_permissions(other) & hikari.Permissions.BAN_MEMBERS
+
+    resolver.remove_role(1)
+
+    assert resolver.calculate_permissions(member) == hikari.Permissions.VIEW_CHANNEL
+
+
+def test_update_everyone_role(guild, channel):
+    resolver = toolbox.PermissionResolver(guild)
+    member = make_member(guild, 10, [GUILD_ID, 1])
+    assert resolver.calculate_permissions(member, channel) & hikari.Permissions.VIEW_CHANNEL
+
+    resolver.update_role(utils.make_role(id=GUILD_ID, permissions=hikari.Permissions.NONE))
+
+    assert resolver.calculate_permissions(member, channel) == (
+        hikari.Permissions.VIEW_CHANNEL | hikari.Permissions.SEND_MESSAGES
+    )
+    assert resolver.calculate_permissions(member) == hikari.Permissions.SEND_MESSAGES
+
+
+def test_update_channel(guild, channel):
+    resolver = toolbox.PermissionResolver(guild)
+    member = make_member(guild, 10, [GUILD_ID])
+    assert resolver.calculate_permissions(member, channel) == hikari.Permissions.NONE
+
+    resolver.update_channel(utils.make_channel({}, id=channel.id, guild_id=GUILD_ID))
+
+    assert resolver.calculate_permissions(member, channel) == hikari.Permissions.VIEW_CHANNEL
+
+
+def test_update_guild(guild):
+    resolver = toolbox.PermissionResolver(guild)
+    member = make_member(guild, 10, [GUILD_ID])
+
+    resolver.update_guild(utils.make_guild([], id=GUILD_ID, owner_id=10))
+
+    assert resolver.calculate_permissions(member) == hikari.Permissions.all_permissions()
+
+
+def test_subscribe(guild):
+    resolver = toolbox.PermissionResolver(guild)
+    bot = mock.Mock()
+
+    resolver.subscribe(bot)
+    subscribed = {call.args for call in bot.event_manager.subscribe.call_args_list}
+    resolver.unsubscribe(bot)
+
+    assert hikari.RoleUpdateEvent in {event_type for event_type, _ in subscribed}
+    assert subscribed == {call.args for call in bot.event_manager.unsubscribe.call_args_list}
+
+
+@pytest.mark.asyncio
+async def test_role_update_event(guild):
+    resolver = toolbox.PermissionResolver(guild)
+    member = make_member(guild, 10, [GUILD_ID, 1])
+    bot = mock.Mock()
+    resolver.subscribe(bot)
+    callbacks = dict(call.args for call in bot.event_manager.subscribe.call_args_list)
+
+    event = mock.Mock(guild_id=GUILD_ID, role=utils.make_role(id=1))
+    await callbacks[hikari.RoleUpdateEvent](event)
+
+    assert resolver.calculate_permissions(member) == hikari.Permissions.VIEW_CHANNEL
+
+
+def test_matches_calculate_permissions():
+    rng = random.Random(42)
+    roles = [utils.make_role(id=GUILD_ID, permissions=random_permissions(rng))]
+    roles += [utils.make_role(id=role_id, permissions=random_permissions(rng)) for role_id in range(1, 50)]
+    roles[-1] = utils.make_role(id=49, permissions=hikari.Permissions.ADMINISTRATOR)
+    guild = utils.make_guild(roles, id=GUILD_ID, owner_id=OWNER_ID)
+    resolver = toolbox.PermissionResolver(guild, max_cache_size=16)
+
+    channels = [
+        utils.make_channel(
+            {
+                target_id: (random_permissions(rng), random_permissions(rng))
+                for target_id in rng.sample([GUILD_ID, *range(1, 60), *range(100, 120)], 10)
+            },
+            id=channel_id,
+            guild_id=GUILD_ID,
+        )
+        for channel_id in range(2000, 2010)
+    ]
+
+    for member_id in range(100, 400):
+        role_ids = [GUILD_ID, *rng.sample(range(1, 55), rng.randint(0, 5))]
+        member = make_member(guild, rng.choice((member_id, OWNER_ID)) if member_id % 50 == 0 else member_id, role_ids)
+
+        for channel in (None, *channels):
+            assert resolver.calculate_permissions(member, channel) == toolbox.calculate_permissions(member, channel)
@@ -1,5 +1,16 @@
+import asyncio
+import concurrent.futures
+import pickle
+import random
+import re
+
+import pytest
+
 from toolbox.strings import MarkdownFormat
+from toolbox.strings import MarkdownStripper
 from toolbox.strings import remove_markdown
+from toolbox.strings import remove_markdown_async
+from toolbox.strings import remove_markdown_many
 
 test_dict = {
     "": (MarkdownFormat.ALL, ""),
@@ -54,6 +65,176 @@ def test_remove_markdown():
             assert remove_markdown(test, format) == result
 
 
+def test_remove_markdown_code_block_spanning_formats():
+    assert remove_markdown("`__test 45__` __test 46__") == "__test 45__ test 46"
+    assert remove_markdown("**test 47 `test 48`**") == "test 47 test 48"
+    assert remove_markdown("`test 49 ```test 50``` test 51`") == "test 49 test 50 test 51"
+
+
+def test_remove_markdown_quote_with_code_block():
+    assert remove_markdown("> `test 52` test 53") == "test 52 test 53"
+    assert remove_markdown("`> test 54` > test 55") == "> test 54 test 55"
+
+
+def test_remove_markdown_placeholder_in_content():
+    assert remove_markdown("\ue000`test 56`\ue0000\ue000") == "\ue000test 56\ue0000\ue000"
+
+
+def test_remove_markdown_every_private_use_character_in_content():
+    private_use = "".join(map(chr, range(0xE000, 0xF900)))
+    # Removing the italic makes "\ue000\ue002" adjacent, so it cannot be used as a placeholder either
+    content = private_use + "\ue000*\ue002* `test **56**` \ue0010\ue001"
+    assert remove_markdown(content) == private_use + "\ue000\ue002 test **56** \ue0010\ue001"
+
+
+def test_markdown_stripper():
+    for test, (format, result) in test_dict.items():
+        assert MarkdownStripper(format)(test) == result
+
+
+def test_markdown_stripper_pickle():
+    stripper = pickle.loads(pickle.dumps(MarkdownStripper(MarkdownFormat.BOLD)))
+
+    assert stripper.formats == MarkdownFormat.BOLD
+    assert stripper("**test 57** *test 57*") == "test 57 *test 57*"
+
+
+def test_remove_markdown_many():
+    assert list(remove_markdown_many(test_dict)) == [remove_markdown(test) for test in test_dict]
+
+
+def test_remove_markdown_many_is_lazy():
+    consumed = []
+
+    def contents():
+        for i in range(100):
+            consumed.append(i)
+            yield f"**test {i}**"
+
+    results = remove_markdown_many(contents())
+    assert next(results) == "test 0"
+    assert consumed == [0]
+
+
+def test_remove_markdown_many_executor():
+    contents = [f"**test {i}** `_test {i}_`" for i in range(1000)]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(remove_markdown_many(iter(contents), executor=executor, chunksize=7))
+
+    assert results == [f"test {i} _test {i}_" for i in range(1000)]
+
+
+def test_remove_markdown_many_invalid_chunksize():
+    with pytest.raises(ValueError):
+        remove_markdown_many([], chunksize=0)
+
+
+@pytest.mark.asyncio
+async def test_remove_markdown_async_inline():
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    executor.shutdown()  # Submitting would fail, short messages must not be
+
+    assert await remove_markdown_async("**test**", executor=executor) == "test"
+
+
+@pytest.mark.asyncio
+async def test_remove_markdown_async_process_pool():
+    contents = [f"**test {i}** `_test {i}_`" for i in range(20)]
+    stripper = MarkdownStripper(MarkdownFormat.BOLD)
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=1) as executor:
+        results = await asyncio.gather(
+            *(remove_markdown_async(content, executor=executor, threshold=0) for content in contents),
+            stripper.strip_async("**bold** *italic*", executor=executor, threshold=0),
+        )
+
+    assert results == [*(f"test {i} _test {i}_" for i in range(20)), "bold *italic*"]
+
+
+# The implementation remove_markdown was rewritten from, used as a reference for the equivalence tests.
+# It applies every format one after another, replacing the first occurrence of each match.
+LEGACY_FORMAT_DICT = {
+    MarkdownFormat.MULTI_CODE_BLOCK: (re.compile(r"(`{3}[^`]+`{3})"), 3),
+    MarkdownFormat.CODE_BLOCK: (re.compile(r"(`[^`]+`)"), 1),
+    MarkdownFormat.MULTI_QUOTE: (re.compile(r"\s*>{3} ([\s\S]+)"), 0),
+    MarkdownFormat.QUOTE: (re.compile(r"\s*> ([\s\S]+)"), 0),
+    MarkdownFormat.BOLD: (re.compile(r"(\*{2}[^*]+\*{2})"), 2),
+    MarkdownFormat.UNDERLINE: (re.compile(r"(__[^_]+__)"), 2),
+    MarkdownFormat.STRIKETHROUGH: (re.compile(r"(~~[^~]+~~)"), 2),
+    MarkdownFormat.ITALIC_UNDERSCORE: (re.compile(r"(_[^_]+_)"), 1),
+    MarkdownFormat.ITALIC_ASTERISK: (re.compile(r"(\*[^*]+\*)"), 1),
+    MarkdownFormat.SPOILER: (re.compile(r"(\|{2}[^|]+\|{2})"), 2),
+}
+
+
+def legacy_remove_markdown(content, formats=MarkdownFormat.ALL):
+    code_block_matches = []
+    for format, (regex, replace) in LEGACY_FORMAT_DICT.items():
+        if not formats & format:
+            continue
+        is_code_block = format & (MarkdownFormat.MULTI_CODE_BLOCK | MarkdownFormat.CODE_BLOCK)
+        is_quote = format & (MarkdownFormat.MULTI_QUOTE | MarkdownFormat.QUOTE)
+        if is_code_block:
+            code_block_matches += re.findall(regex, content)
+        for match in re.findall(regex, content):
+            if is_quote and not code_block_matches:
+                content = content.replace(">>> " if format == MarkdownFormat.MULTI_QUOTE else "> ", "")
+            elif is_code_block or not any(match in code_block for code_block in code_block_matches):
+                content = content.replace(match, match[replace:-replace], 1)
+    return content
+
+
+WRAPPERS = {
+    MarkdownFormat.BOLD: "**",
+    MarkdownFormat.UNDERLINE: "__",
+    MarkdownFormat.STRIKETHROUGH: "~~",
+    MarkdownFormat.SPOILER: "||",
+    MarkdownFormat.ITALIC_UNDERSCORE: "_",
+    MarkdownFormat.ITALIC_ASTERISK: "*",
+}
+
+
+def generate_content(rng, formats, words, depth=0, allowed=frozenset(WRAPPERS)):
+    """Generate well-formed markdown: unique words, nested formats that don't share delimiters, plain code blocks."""
+    parts = []
+    for _ in range(rng.randint(1, 3)):
+        roll = rng.random()
+        if roll < 0.5 and depth < 3 and allowed:
+            format = rng.choice(sorted(allowed))
+            delimiter = WRAPPERS[format]
+            nested = frozenset(f for f in allowed if WRAPPERS[f][0] != delimiter[0])
+            parts.append(delimiter + generate_content(rng, formats, words, depth + 1, nested) + delimiter)
+        elif roll < 0.7 and depth == 0:
+            words.append(f"code{len(words)}")
+            ticks = "```" if formats & MarkdownFormat.MULTI_CODE_BLOCK and rng.random() < 0.5 else "`"
+            parts.append(f"{ticks}{words[-1]} block{len(words)}{ticks}")
+        else:
+            words.append(f"word{len(words)}")
+            parts.append(words[-1])
+
+    content = " ".join(parts)
+    if depth == 0 and "`" not in content and rng.random() < 0.2:
+        content = rng.choice(("> ", ">>> ")) + content
+    return content
+
+
+def test_remove_markdown_equivalence():
+    rng = random.Random(1337)
+    flags = [format for format in MarkdownFormat if format not in (MarkdownFormat.NONE, MarkdownFormat.ALL)]
+
+    for test, (format, _) in test_dict.items():
+        assert remove_markdown(test, format) == legacy_remove_markdown(test, format), test
+
+    for _ in range(2000):
+        formats = MarkdownFormat.ALL
+        if rng.random() < 0.5:
+            formats = MarkdownFormat(sum(rng.sample(flags, rng.randint(1, len(flags)))))
+
+        content = generate_content(rng, formats, [])
+        assert remove_markdown(content, formats) == legacy_remove_markdown(content, formats), content
+
+
 # MIT License
 #
 # Copyright (c) 2022-present HyperGH
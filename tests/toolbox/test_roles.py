@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import random
+
+import pytest
+
 import toolbox
 from tests import utils
 
@@ -16,3 +20,82 @@ def test_sort_roles():
     assert roles[0].position == 3
     assert roles[1].position == 2
     assert roles[2].position == 1
+
+
+@pytest.fixture
+def role_order():
+    return toolbox.RoleOrder(
+        utils.make_guild(
+            [
+                utils.make_role(id=1, position=1),
+                utils.make_role(id=3, position=3),
+                utils.make_role(id=2, position=2),
+                utils.make_role(id=4, position=2),
+            ],
+            id=100,
+        )
+    )
+
+
+def test_role_order_views(role_order):
+    assert [role.id for role in role_order.descending()] == [3, 2, 4, 1]
+    assert [role.id for role in role_order.ascending()] == [1, 4, 2, 3]
+    assert [role.id for role in role_order.sort_roles()] == [3, 2, 4, 1]
+    assert [role.id for role in reversed(role_order.descending())] == [1, 4, 2, 3]
+    assert [role.id for role in role_order.descending()[1:3]] == [2, 4]
+    assert role_order.descending()[0].id == 3
+    assert role_order.descending()[-1].id == 1
+    assert role_order.ascending()[-1].id == 3
+
+    assert [role.id for role in role_order.descending()[::-2]] == [1, 2]
+    assert [role.id for role in role_order.ascending()[1:]] == [4, 2, 3]
+
+    with pytest.raises(IndexError):
+        role_order.descending()[4]
+
+
+def test_role_order_tied_positions(role_order):
+    tied = [role_order.get_role(4), role_order.get_role(2)]
+
+    # sort_roles keeps the order roles are passed in, RoleOrder orders them by ID
+    assert [role.id for role in toolbox.sort_roles(tied)] == [4, 2]
+    assert [role.id for role in role_order.get_roles([4, 2])] == [2, 4]
+    assert [role.id for role in role_order.sort_roles() if role.position == 2] == [2, 4]
+
+
+def test_role_order_get_roles(role_order):
+    assert [role.id for role in role_order.get_roles([1, 3, 4, 999])] == [3, 4, 1]
+    assert [role.id for role in role_order.get_roles([1, 3, 4], ascending=True)] == [1, 4, 3]
+    assert role_order.get_role(4).position == 2
+    assert role_order.get_role(999) is None
+    assert role_order.get_role("4") is role_order.get_role(4)
+    assert [role.id for role in role_order.get_roles(["1", "3"])] == [3, 1]
+
+
+def test_role_order_updates(role_order):
+    view = role_order.descending()
+
+    role_order.update_role(utils.make_role(id=1, position=4))
+    role_order.update_role(utils.make_role(id=5, position=0))
+    role_order.remove_role(3)
+    role_order.remove_role(999)
+    role_order.remove_role("5")
+
+    assert [role.id for role in view] == [1, 2, 4]
+    assert 3 not in role_order
+    assert 5 not in role_order
+    assert len(role_order) == 3
+
+
+def test_role_order_matches_sort_roles():
+    rng = random.Random(5)
+    positions = rng.sample(range(1000), 350)
+    roles = {role_id: utils.make_role(id=role_id, position=positions.pop()) for role_id in range(250)}
+    role_order = toolbox.RoleOrder(utils.make_guild(list(roles.values()), id=100))
+
+    for role_id in rng.choices(range(250), k=100):
+        roles[role_id] = utils.make_role(id=role_id, position=positions.pop())
+        role_order.update_role(roles[role_id])
+
+    assert list(role_order.sort_roles()) == list(toolbox.sort_roles(list(roles.values())))
+    assert list(role_order.sort_roles(ascending=True)) == list(toolbox.sort_roles(list(roles.values()), ascending=True))
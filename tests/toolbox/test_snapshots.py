@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import random
+import sys
+from unittest import mock
+
+import hikari
+import pytest
+
+import toolbox
+from tests import utils
+
+GUILD_ID = 1000
+OWNER_ID = 1
+
+
+def random_permissions(rng: random.Random) -> hikari.Permissions:
+    return hikari.Permissions(rng.getrandbits(41) & ~hikari.Permissions.ADMINISTRATOR)
+
+
+@pytest.fixture
+def channel():
+    return utils.make_channel(
+        {
+            GUILD_ID: (hikari.Permissions.NONE, hikari.Permissions.VIEW_CHANNEL),
+            1: (hikari.Permissions.VIEW_CHANNEL, hikari.Permissions.NONE),
+        },
+        id=2000,
+        guild_id=GUILD_ID,
+    )
+
+
+@pytest.fixture
+def guild(channel):
+    return utils.make_guild(
+        [
+            utils.make_role(id=GUILD_ID, permissions=hikari.Permissions.VIEW_CHANNEL),
+            utils.make_role(id=1, position=1, color=hikari.Color(100), permissions=hikari.Permissions.SEND_MESSAGES),
+            utils.make_role(id=2, position=2, permissions=hikari.Permissions.BAN_MEMBERS),
+            utils.make_role(id=3, position=3, permissions=hikari.Permissions.ADMINISTRATOR),
+        ],
+        id=GUILD_ID,
+        owner_id=OWNER_ID,
+        channels=[channel],
+    )
+
+
+def test_calculate_permissions(guild, channel):
+    snapshot = toolbox.GuildSnapshot(guild)
+
+    assert snapshot.calculate_permissions(utils.make_guild_member(guild, id=10, role_ids=[GUILD_ID, 1, 2])) == (
+        hikari.Permissions.VIEW_CHANNEL | hikari.Permissions.SEND_MESSAGES | hikari.Permissions.BAN_MEMBERS
+    )
+    assert snapshot.calculate_permissions(utils.make_guild_member(guild, id=10, role_ids=[GUILD_ID]), channel.id) == (
+        hikari.Permissions.NONE
+    )
+    assert snapshot.calculate_permissions(utils.make_guild_member(guild, id=OWNER_ID, role_ids=[]), channel) == (
+        hikari.Permissions.all_permissions()
+    )
+
+
+def test_unknown_channel(guild):
+    snapshot = toolbox.GuildSnapshot(guild)
+    member = utils.make_guild_member(guild, id=10, role_ids=[GUILD_ID])
+    channel = utils.make_channel({GUILD_ID: (hikari.Permissions.SEND_MESSAGES, 0)}, id=2001, guild_id=GUILD_ID)
+
+    with pytest.raises(toolbox.CacheFailureError):
+        snapshot.calculate_permissions(member, channel.id)
+
+    # Channel objects are added to the snapshot
+    expected = hikari.Permissions.VIEW_CHANNEL | hikari.Permissions.SEND_MESSAGES
+    assert snapshot.calculate_permissions(member, channel) == expected
+    assert snapshot.calculate_permissions(member, channel.id) == expected
+
+
+def test_missing_everyone_role():
+    with pytest.raises(toolbox.CacheFailureError):
+        toolbox.GuildSnapshot(utils.make_guild([utils.make_role(id=1)], id=GUILD_ID))
+
+
+def test_hierarchy_and_color(guild):
+    snapshot = toolbox.GuildSnapshot(guild)
+    moderator = utils.make_guild_member(guild, id=10, role_ids=[GUILD_ID, 1, 2])
+    member = utils.make_guild_member(guild, id=11, role_ids=[GUILD_ID, 1])
+    owner = utils.make_guild_member(guild, id=OWNER_ID, role_ids=[GUILD_ID])
+
+    assert snapshot.is_above(moderator, member)
+    assert not snapshot.is_above(member, moderator)
+    assert snapshot.get_member_color(moderator) == hikari.Color(100)
+    assert snapshot.get_member_color(owner) == hikari.Color(0)
+    assert snapshot.can_moderate(moderator, member, hikari.Permissions.BAN_MEMBERS)
+    assert not snapshot.can_moderate(moderator, member, hikari.Permissions.KICK_MEMBERS)
+    assert not snapshot.can_moderate(moderator, owner)
+
+    with pytest.raises(toolbox.CacheFailureError):
+        snapshot.is_above(moderator, utils.make_guild_member(guild, id=12, role_ids=[]))
+
+
+def test_tied_top_roles():
+    guild = utils.make_guild(
+        [
+            utils.make_role(id=GUILD_ID),
+            utils.make_role(id=10, position=5, color=hikari.Color(1)),
+            utils.make_role(id=15, position=5),
+            utils.make_role(id=20, position=5, color=hikari.Color(2)),
+        ],
+        id=GUILD_ID,
+    )
+    snapshot = toolbox.GuildSnapshot(guild)
+    member1 = utils.make_guild_member(guild, id=11, role_ids=[20, 10])
+    member2 = utils.make_guild_member(guild, id=12, role_ids=[15])
+
+    assert snapshot.is_above(member1, member2) == toolbox.is_above(member1, member2)
+    assert snapshot.is_above(member2, member1) == toolbox.is_above(member2, member1)
+    assert snapshot.get_member_color(member1) == toolbox.get_member_color(member1) == hikari.Color(2)
+
+
+def test_updates(guild, channel):
+    snapshot = toolbox.GuildSnapshot(guild)
+    member = utils.make_guild_member(guild, id=10, role_ids=[GUILD_ID, 1, 4])
+    other = utils.make_guild_member(guild, id=11, role_ids=[GUILD_ID, 2])
+    assert snapshot.is_above(other, member)
+
+    snapshot.update_role(utils.make_role(id=4, position=5, color=hikari.Color(200)))
+    assert snapshot.is_above(member, other)
+    assert snapshot.get_member_color(member) == hikari.Color(200)
+    assert len(snapshot) == 5
+
+    snapshot.update_role(utils.make_role(id=1, position=1, permissions=hikari.Permissions.KICK_MEMBERS))
+    snapshot.remove_role(4)
+    assert snapshot.calculate_permissions(member) == hikari.Permissions.VIEW_CHANNEL | hikari.Permissions.KICK_MEMBERS
+    assert snapshot.get_member_color(member) == hikari.Color(0)
+    assert len(snapshot) == 4
+
+    snapshot.update_channel(utils.make_channel({}, id=channel.id, guild_id=GUILD_ID))
+    assert snapshot.calculate_permissions(member, channel) & hikari.Permissions.VIEW_CHANNEL
+    snapshot.remove_channel(channel.id)
+    with pytest.raises(toolbox.CacheFailureError):
+        snapshot.calculate_permissions(member, channel.id)
+
+    snapshot.update_guild(utils.make_guild([], id=GUILD_ID, owner_id=10))
+    assert snapshot.calculate_permissions(member) == hikari.Permissions.all_permissions()
+
+
+@pytest.mark.asyncio
+async def test_channel_update_event(guild, channel):
+    snapshot = toolbox.GuildSnapshot(guild)
+    member = utils.make_guild_member(guild, id=10, role_ids=[GUILD_ID])
+    bot = mock.Mock()
+    snapshot.subscribe(bot)
+    callbacks = dict(call.args for call in bot.event_manager.subscribe.call_args_list)
+
+    event = mock.Mock(guild_id=GUILD_ID, channel=utils.make_channel({}, id=channel.id, guild_id=GUILD_ID))
+    await callbacks[hikari.GuildChannelUpdateEvent](event)
+
+    assert snapshot.calculate_permissions(member, channel.id) == hikari.Permissions.VIEW_CHANNEL
+
+
+def test_sizeof_includes_arrays(guild):
+    snapshot = toolbox.GuildSnapshot(guild)
+
+    assert sys.getsizeof(snapshot) > object.__sizeof__(snapshot) + 4 * 64
+
+
+def test_matches_member_functions():
+    rng = random.Random(42)
+    roles = [utils.make_role(id=GUILD_ID, permissions=random_permissions(rng))]
+    roles += [
+        utils.make_role(
+            id=role_id,
+            position=rng.randrange(1, 20),  # Include roles sharing a position
+            color=hikari.Color(rng.choice((0, rng.getrandbits(24)))),
+            permissions=random_permissions(rng),
+        )
+        for role_id in range(1, 50)
+    ]
+    roles[-1] = utils.make_role(id=49, position=3, permissions=hikari.Permissions.ADMINISTRATOR)
+    channels = [
+        utils.make_channel(
+            {
+                target_id: (random_permissions(rng), random_permissions(rng))
+                for target_id in rng.sample([GUILD_ID, *range(1, 60), *range(100, 120)], 10)
+            },
+            id=channel_id,
+            guild_id=GUILD_ID,
+        )
+        for channel_id in range(2000, 2010)
+    ]
+    guild = utils.make_guild(roles, id=GUILD_ID, owner_id=OWNER_ID, channels=channels)
+    snapshot = toolbox.GuildSnapshot(guild)
+
+    members = []
+    for member_id in range(100, 300):
+        role_ids = [GUILD_ID, *rng.sample(range(1, 55), rng.randint(0, 5))]
+        member_id = rng.choice((member_id, OWNER_ID)) if member_id % 50 == 0 else member_id
+        members.append(utils.make_guild_member(guild, id=member_id, role_ids=role_ids))
+
+    for member in members:
+        assert snapshot.get_member_color(member) == toolbox.get_member_color(member)
+        for channel in (None, *channels):
+            assert snapshot.calculate_permissions(member, channel) == toolbox.calculate_permissions(member, channel)
+
+    for moderator, member in zip(members, reversed(members)):
+        assert snapshot.is_above(moderator, member) == toolbox.is_above(moderator, member)
+        for permissions in (hikari.Permissions.NONE, hikari.Permissions.BAN_MEMBERS):
+            expected = toolbox.can_moderate(moderator, member, permissions)
+            assert snapshot.can_moderate(moderator, member, permissions) == expected
@@ -1,5 +1,10 @@
+import asyncio
+import concurrent.futures
 import datetime
+import pickle
+from unittest import mock
 
+import hikari
 import pytest
 
 import toolbox
@@ -34,3 +39,197 @@ def test_no_style():
 def test_has_style():
     time = datetime.datetime.now()
     assert toolbox.format_dt(time, style=toolbox.TimestampStyle.SHORT_TIME) == f"<t:{int(time.timestamp())}:t>"
+
+
+def test_format_dt_many():
+    time = datetime.datetime(2023, 2, 16, 15, 50, 25, tzinfo=datetime.timezone.utc)
+    snowflake = hikari.Snowflake(1075825934051516416)
+    user = mock.Mock(spec=hikari.Unique, id=snowflake)
+
+    assert toolbox.format_dt_many([time, 1676562625, snowflake, user], toolbox.TimestampStyle.RELATIVE) == [
+        toolbox.format_dt(time, toolbox.TimestampStyle.RELATIVE),
+        "<t:1676562625:R>",
+        toolbox.format_dt(snowflake.created_at, toolbox.TimestampStyle.RELATIVE),
+        toolbox.format_dt(snowflake.created_at, toolbox.TimestampStyle.RELATIVE),
+    ]
+    assert toolbox.format_dt_many(iter([time])) == [toolbox.format_dt(time)]
+
+
+def test_format_dt_many_numpy():
+    np = pytest.importorskip("numpy")
+    times = [
+        datetime.datetime(2023, 2, 16, tzinfo=datetime.timezone.utc) + datetime.timedelta(seconds=i) for i in range(100)
+    ]
+    expected = [toolbox.format_dt(time, toolbox.TimestampStyle.LONG_DATE) for time in times]
+
+    datetimes = np.array([time.replace(tzinfo=None) for time in times], dtype="datetime64[us]")
+    seconds = np.array([int(time.timestamp()) for time in times], dtype=np.int64)
+
+    assert toolbox.format_dt_many(datetimes, toolbox.TimestampStyle.LONG_DATE) == expected
+    assert toolbox.format_dt_many(seconds, toolbox.TimestampStyle.LONG_DATE) == expected
+    with pytest.raises(TypeError):
+        toolbox.format_dt_many(np.zeros(3))
+
+
+SNOWFLAKES = [hikari.Snowflake(id) for id in (175928847299117063, 1075825934051516416, 1420070400000 << 22)]
+
+
+def test_snowflake_to_timestamp():
+    for snowflake in SNOWFLAKES:
+        assert toolbox.snowflake_to_timestamp(snowflake) == int(snowflake.created_at.timestamp())
+        assert toolbox.snowflake_to_timestamp(int(snowflake)) == int(snowflake.created_at.timestamp())
+
+    assert toolbox.snowflake_to_timestamp(mock.Mock(spec=hikari.Unique, id=SNOWFLAKES[0])) == 1462015105
+
+
+def test_format_snowflake():
+    for style in (None, *toolbox.TimestampStyle):
+        for snowflake in SNOWFLAKES:
+            assert toolbox.format_snowflake(snowflake, style) == toolbox.format_dt(snowflake.created_at, style)
+
+
+def test_format_snowflakes():
+    expected = [toolbox.format_dt(snowflake.created_at, toolbox.TimestampStyle.RELATIVE) for snowflake in SNOWFLAKES]
+
+    assert toolbox.format_snowflakes(SNOWFLAKES, toolbox.TimestampStyle.RELATIVE) == expected
+
+    np = pytest.importorskip("numpy")
+    assert toolbox.format_snowflakes(np.array(SNOWFLAKES, dtype=np.uint64), toolbox.TimestampStyle.RELATIVE) == expected
+    assert toolbox.format_snowflakes(np.array(SNOWFLAKES, dtype=np.int64), toolbox.TimestampStyle.RELATIVE) == expected
+
+
+def test_find_urls():
+    content = "see https://somewebsite.com/page and http://www.example.org?a=2 or ftp://nope.com"
+
+    urls = list(toolbox.find_urls(content))
+
+    assert [url.url for url in urls] == ["https://somewebsite.com/page", "http://www.example.org?a=2"]
+    assert all(content[slice(*url.span)] == url.url for url in urls)
+    assert list(toolbox.find_urls("no links here")) == []
+
+
+def test_find_invites():
+    content = "join discord.gg/Jx4cNGG or https://discord.com/invite/my-server/ but not discord.com/channels/1/2/3"
+
+    invites = list(toolbox.find_invites(content))
+
+    assert [invite.code for invite in invites] == ["Jx4cNGG", "my-server"]
+    assert content[slice(*invites[1].span)] == "https://discord.com/invite/my-server/"
+    assert list(toolbox.find_invites("no invites here")) == []
+
+
+def test_content_scanner():
+    content = (
+        "**see https://discord.com/channels/1/2/3** and `https://in.code.com` "
+        "||join https://discord.gg/Jx4cNGG|| > quote"
+    )
+
+    matches = list(toolbox.ContentScanner().scan(content))
+
+    assert [type(match).__name__ for match in matches] == [
+        "MarkdownSpan",
+        "MessageLink",
+        "URLMatch",
+        "MarkdownSpan",
+        "MarkdownSpan",
+        "InviteMatch",
+        "URLMatch",
+        "MarkdownSpan",
+    ]
+    bold, link, url, code, spoiler, invite, _, quote = matches
+    assert (bold.format, content[slice(*bold.content_span)]) == (toolbox.MarkdownFormat.BOLD, content[2:40])
+    assert (link.guild_id, link.channel_id, link.message_id) == (1, 2, 3)
+    assert content[slice(*url.span)] == "https://discord.com/channels/1/2/3"
+    assert code.format == toolbox.MarkdownFormat.CODE_BLOCK  # Links in code blocks are not searched
+    assert spoiler.format == toolbox.MarkdownFormat.SPOILER
+    assert invite.code == "Jx4cNGG"
+    assert (quote.format, quote.content_span) == (toolbox.MarkdownFormat.QUOTE, None)
+    assert [match.span[0] for match in matches] == sorted(match.span[0] for match in matches)
+
+
+def test_content_scanner_options():
+    content = "**bold** https://example.com discord.gg/abc"
+
+    matches = list(toolbox.ContentScanner(toolbox.MarkdownFormat.NONE, urls=False).scan(content))
+    assert matches == [toolbox.InviteMatch("abc", (29, 43))]
+    assert list(toolbox.ContentScanner().scan("plain text")) == []
+
+
+def test_content_scanner_matches_separate_scans():
+    contents = [
+        "see https://example.com/a and discord.gg/abc",
+        "https://discord.com/channels/@me/4/5?x_y_",
+        "https://discord.gg/abc?event=1 and https://discord.com/channels/1/2/3",
+    ]
+    scanner = toolbox.ContentScanner()
+
+    for content in contents:
+        matches = list(scanner.scan(content))
+        assert [m for m in matches if isinstance(m, toolbox.URLMatch)] == list(toolbox.find_urls(content))
+        assert [m for m in matches if isinstance(m, toolbox.InviteMatch)] == list(toolbox.find_invites(content))
+        assert [m for m in matches if isinstance(m, toolbox.MessageLink)] == list(toolbox.find_message_links(content))
+
+
+def test_content_scanner_markdown_does_not_split_links():
+    scanner = toolbox.ContentScanner()
+
+    content = "a_b https://example.com/c_d"
+    assert (
+        list(scanner.scan(content))
+        == list(toolbox.find_urls(content))
+        == [toolbox.URLMatch("https://example.com/c_d", (4, 27))]
+    )
+
+    # Markdown containing whole links is still found
+    content = "*a* https://example.com/_b_ _c_ **https://example.com**"
+    assert [match.span for match in scanner.scan(content)] == [(0, 3), (4, 27), (28, 31), (32, 55), (34, 53)]
+
+
+@pytest.mark.asyncio
+async def test_content_scanner_scan_messages():
+    async def messages():
+        for content in ("**a**", None):
+            yield mock.Mock(content=content)
+
+    results = [
+        (message.content, matches) async for message, matches in toolbox.ContentScanner().scan_messages(messages())
+    ]
+
+    assert results == [("**a**", [toolbox.MarkdownSpan(toolbox.MarkdownFormat.BOLD, (0, 5), (2, 3))]), (None, [])]
+
+
+@pytest.mark.asyncio
+async def test_async_scans_match_sync_scans():
+    content = "**Join** https://discord.gg/abc or see https://example.com/page ||spoiler|| " * 3
+    scanner = toolbox.ContentScanner()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        for threshold in (0, len(content) + 1):  # On the executor, then inline
+            urls, invites, matches = await asyncio.gather(
+                toolbox.find_urls_async(content, executor=executor, threshold=threshold),
+                toolbox.find_invites_async(content, executor=executor, threshold=threshold),
+                scanner.scan_async(content, executor=executor, threshold=threshold),
+            )
+
+            assert urls == list(toolbox.find_urls(content))
+            assert invites == list(toolbox.find_invites(content))
+            assert matches == list(scanner.scan(content))
+
+
+@pytest.mark.asyncio
+async def test_scan_async_process_pool():
+    content = "**https://discord.com/channels/1/2/3** `code`"
+    scanner = toolbox.ContentScanner()
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=1) as executor:
+        assert await scanner.scan_async(content, executor=executor, threshold=0) == list(scanner.scan(content))
+
+
+def test_content_scanner_pickle():
+    scanner = toolbox.ContentScanner(toolbox.MarkdownFormat.BOLD, invites=False)
+    content = "**https://discord.gg/abc** https://discord.com/channels/1/2/3"
+
+    unpickled = pickle.loads(pickle.dumps(scanner))
+
+    assert repr(unpickled) == repr(scanner)
+    assert list(unpickled.scan(content)) == list(scanner.scan(content))
@@ -1,17 +1,26 @@
 from __future__ import annotations
 
 import typing
+from unittest import mock
 
 import hikari
+from hikari.users import UserImpl
 
 __all__: typing.Sequence[str] = (
     "make_role",
     "make_member",
+    "make_guild",
+    "make_guild_member",
+    "make_channel",
+    "make_cache_app",
+    "make_cached_member",
 )
 
 
 def make_role(
     *,
+    id: typing.Optional[int] = None,
+    guild_id: typing.Optional[int] = None,
     position: int = 0,
     name: str = "",
     color: hikari.Color = hikari.Color(0),
@@ -19,10 +28,10 @@ def make_role(
 ) -> hikari.Role:
     return hikari.Role(
         app=None,
-        id=None,
+        id=hikari.Snowflake(id) if id is not None else None,
         name=name,
         color=color,
-        guild_id=None,
+        guild_id=hikari.Snowflake(guild_id) if guild_id is not None else None,
         is_hoisted=True,
         icon_hash=None,
         unicode_emoji=None,
@@ -63,3 +72,90 @@ def make_member(roles: list[hikari.Role] = None):
     type(member).get_roles = lambda self: GLOBAL_ROLES[id(self)]
 
     return member
+
+
+def make_guild(
+    roles: list[hikari.Role],
+    *,
+    id: int,
+    owner_id: int = 0,
+    channels: typing.Sequence[hikari.PermissibleGuildChannel] = (),
+) -> hikari.GatewayGuild:
+    guild = mock.Mock(spec=hikari.GatewayGuild)
+    guild.id = hikari.Snowflake(id)
+    guild.owner_id = hikari.Snowflake(owner_id)
+    guild.get_roles.return_value = {role.id: role for role in roles}
+    guild.get_channels.return_value = {channel.id: channel for channel in channels}
+    return guild
+
+
+def make_guild_member(guild: hikari.GatewayGuild, *, id: int, role_ids: list[int]) -> hikari.Member:
+    member = mock.Mock(spec=hikari.Member)
+    member.id = hikari.Snowflake(id)
+    member.guild_id = guild.id
+    member.role_ids = [hikari.Snowflake(role_id) for role_id in role_ids]
+    member.get_guild.return_value = guild
+    guild_roles = guild.get_roles()
+    member.get_roles.side_effect = lambda: [
+        role for role_id in member.role_ids if (role := guild_roles.get(role_id)) is not None
+    ]
+    member.get_top_role.side_effect = lambda: hikari.Member.get_top_role(member)
+    return member
+
+
+def make_channel(
+    overwrites: dict[int, tuple[hikari.Permissions, hikari.Permissions]], *, id: int, guild_id: int
+) -> hikari.PermissibleGuildChannel:
+    channel = mock.Mock(spec=hikari.PermissibleGuildChannel)
+    channel.id = hikari.Snowflake(id)
+    channel.guild_id = hikari.Snowflake(guild_id)
+    channel.permission_overwrites = {
+        hikari.Snowflake(target_id): hikari.PermissionOverwrite(
+            id=hikari.Snowflake(target_id),
+            type=hikari.PermissionOverwriteType.ROLE,
+            allow=allow,
+            deny=deny,
+        )
+        for target_id, (allow, deny) in overwrites.items()
+    }
+    return channel
+
+
+def make_cache_app(guilds: list[hikari.GatewayGuild]) -> hikari.CacheAware:
+    app = mock.Mock(spec=hikari.CacheAware)
+    guilds_by_id = {guild.id: guild for guild in guilds}
+    roles = {role_id: role for guild in guilds for role_id, role in guild.get_roles().items()}
+    app.cache.get_guild.side_effect = guilds_by_id.get
+    app.cache.get_role.side_effect = roles.get
+    return app
+
+
+# A real member resolving its guild and roles from the cache of the app, far cheaper to create than a mock
+def make_cached_member(app: hikari.CacheAware, *, id: int, guild_id: int, role_ids: list[int]) -> hikari.Member:
+    user = UserImpl(
+        id=hikari.Snowflake(id),
+        app=app,
+        discriminator="0",
+        username=f"user {id}",
+        global_name=None,
+        avatar_hash=None,
+        banner_hash=None,
+        accent_color=None,
+        is_bot=False,
+        is_system=False,
+        flags=hikari.UserFlag.NONE,
+    )
+    return hikari.Member(
+        guild_id=hikari.Snowflake(guild_id),
+        is_deaf=False,
+        is_mute=False,
+        is_pending=False,
+        joined_at=None,
+        nickname=None,
+        premium_since=None,
+        raw_communication_disabled_until=None,
+        role_ids=[hikari.Snowflake(role_id) for role_id in role_ids],
+        user=user,
+        guild_avatar_hash=None,
+        guild_flags=None,
+    )
@@ -1,12 +1,152 @@
-from .commands import *
-from .errors import *
-from .members import *
-from .messages import *
-from .roles import *
-from .strings import *
+import sys
+import types
+import typing as t
+
+if t.TYPE_CHECKING:
+    from .checks import *
+    from .commands import *
+    from .errors import *
+    from .instrumentation import *
+    from .members import *
+    from .messages import *
+    from .permissions import *
+    from .roles import *
+    from .snapshots import *
+    from .strings import *
 
 __version__ = "0.1.7"
 
+# The submodule each public name is defined in, submodules are only imported when one of their names is first used
+_EXPORTS: t.Dict[str, str] = {
+    **dict.fromkeys(
+        ("permission_scope", "memoize_permissions", "has_permissions", "require_moderation"),
+        "checks",
+    ),
+    **dict.fromkeys(
+        (
+            "as_command_choices",
+            "iter_command_choices",
+            "aiter_command_choices",
+            "cached_command_choices",
+            "ChoiceIndex",
+        ),
+        "commands",
+    ),
+    **dict.fromkeys(("ToolboxError", "CacheFailureError", "EmbedValidationError", "ModerationError"), "errors"),
+    **dict.fromkeys(
+        (
+            "enable_instrumentation",
+            "disable_instrumentation",
+            "reset_instrumentation",
+            "is_instrumentation_enabled",
+            "get_instrumentation_snapshot",
+            "track_cache",
+        ),
+        "instrumentation",
+    ),
+    **dict.fromkeys(
+        (
+            "get_member_color",
+            "is_above",
+            "get_possessive",
+            "calculate_permissions",
+            "calculate_permissions_bulk",
+            "can_moderate",
+            "RoleHierarchy",
+            "MemberColorResolver",
+        ),
+        "members",
+    ),
+    **dict.fromkeys(
+        (
+            "fetch_message_from_link",
+            "fetch_messages_from_links",
+            "find_message_links",
+            "MessageCache",
+            "MessageLink",
+            "EmbedViolation",
+            "find_embed_violations",
+            "validate_embed",
+            "validate_embeds",
+            "paginate_embed",
+            "batch_embeds",
+        ),
+        "messages",
+    ),
+    **dict.fromkeys(("PermissionResolver",), "permissions"),
+    **dict.fromkeys(("sort_roles", "RoleOrder"), "roles"),
+    **dict.fromkeys(("GuildSnapshot",), "snapshots"),
+    **dict.fromkeys(
+        (
+            "format_dt",
+            "format_dt_many",
+            "format_snowflake",
+            "format_snowflakes",
+            "snowflake_to_timestamp",
+            "TimestampStyle",
+            "utcnow",
+            "is_url",
+            "is_invite",
+            "find_urls",
+            "find_invites",
+            "find_urls_async",
+            "find_invites_async",
+            "URLMatch",
+            "InviteMatch",
+            "MarkdownSpan",
+            "ContentMatch",
+            "ContentScanner",
+            "remove_markdown",
+            "remove_markdown_many",
+            "remove_markdown_async",
+            "MarkdownStripper",
+            "MarkdownFormat",
+        ),
+        "strings",
+    ),
+}
+_SUBMODULES = frozenset(
+    (
+        "checks",
+        "commands",
+        "errors",
+        "instrumentation",
+        "internal",
+        "members",
+        "messages",
+        "permissions",
+        "roles",
+        "snapshots",
+        "strings",
+    )
+)
+
+__all__: t.Sequence[str] = tuple(_EXPORTS)
+
+
+def _import_submodule(name: str) -> types.ModuleType:
+    # Unlike importlib.import_module, __import__ shows up in the output of python -X importtime
+    __import__(f"{__name__}.{name}")
+    return sys.modules[f"{__name__}.{name}"]
+
+
+if not t.TYPE_CHECKING:
+
+    def __getattr__(name: str) -> t.Any:
+        if (submodule := _EXPORTS.get(name)) is not None:
+            value = getattr(_import_submodule(submodule), name)
+        elif name in _SUBMODULES:
+            value = _import_submodule(name)
+        else:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+        globals()[name] = value  # Later accesses find the value without calling __getattr__
+        return value
+
+    def __dir__() -> t.List[str]:
+        return sorted({*globals(), *_EXPORTS, *_SUBMODULES})
+
+
 # MIT License
 #
 # Copyright (c) 2022-present HyperGH
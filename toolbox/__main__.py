@@ -1,6 +1,10 @@
+import argparse
+import json
 import os
 import platform
 import sys
+import time
+import typing as t
 
 import hikari
 
@@ -15,6 +19,57 @@ if sys.platform == "win32":
 
 ORANGE = "\x1b[38;2;255;156;35m"
 WHITE = "\x1b[37m"
+CLEAR = "\x1b[2J\x1b[H"
+
+parser = argparse.ArgumentParser(prog="python -m toolbox", description="Show information about hikari-toolbox.")
+parser.add_argument(
+    "snapshot",
+    nargs="?",
+    help="Path to a JSON dump of toolbox.get_instrumentation_snapshot() to summarize instead.",
+)
+parser.add_argument(
+    "--interval",
+    type=float,
+    help="Keep summarizing the snapshot every INTERVAL seconds, for a snapshot that is dumped periodically.",
+)
+args = parser.parse_args()
+
+
+def format_summary(snapshot: t.Dict[str, t.Any]) -> str:
+    lines = [
+        f"{ORANGE}hikari-toolbox - instrumentation summary ({'enabled' if snapshot['enabled'] else 'disabled'})",
+        f"{WHITE}{'-' * 96}",
+        f"{ORANGE}{'Function':<40}{'Calls':>10}{'Errors':>8}{'Total s':>10}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}{WHITE}",
+    ]
+    functions = sorted(snapshot["functions"].items(), key=lambda item: item[1]["total_seconds"], reverse=True)
+    for name, stats in functions:
+        lines.append(
+            f"{name:<40}{stats['calls']:>10}{stats['errors']:>8}{stats['total_seconds']:>10.3f}"
+            f"{stats['p50_seconds'] * 1000:>9.3f}{stats['p90_seconds'] * 1000:>9.3f}{stats['p99_seconds'] * 1000:>9.3f}"
+        )
+
+    lines += ["", f"{ORANGE}{'Cache':<40}{'Hits':>10}{'Misses':>10}{'Size':>8}{'Hit rate':>10}{WHITE}"]
+    for name, stats in snapshot["caches"].items():
+        lines.append(f"{name:<40}{stats['hits']:>10}{stats['misses']:>10}{stats['size']:>8}{stats['hit_rate']:>10.1%}")
+
+    return "\n".join(lines) + "\n"
+
+
+if args.snapshot:
+    try:
+        while True:
+            with open(args.snapshot) as f:
+                summary = format_summary(json.load(f))
+
+            sys.stderr.write(CLEAR + summary if args.interval else summary)
+            if not args.interval:
+                break
+
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        pass
+
+    sys.exit()
 
 uname = platform.uname()
 system_details = f"{uname.system} {uname.machine} ({uname.node}) - {uname.release}"
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import functools
+import inspect
+import typing as t
+
+import hikari
+
+from .errors import ModerationError
+from .members import calculate_permissions
+from .members import can_moderate
+
+__all__: t.Sequence[str] = ("permission_scope", "memoize_permissions", "has_permissions", "require_moderation")
+
+CallableT = t.TypeVar("CallableT", bound=t.Callable[..., t.Any])
+
+# Results of the checks made in the current scope, None outside of one
+_scope_cache: contextvars.ContextVar[t.Optional[t.Dict[t.Tuple[t.Any, ...], t.Any]]] = contextvars.ContextVar(
+    "toolbox_permission_scope", default=None
+)
+
+
+@contextlib.contextmanager
+def permission_scope() -> t.Iterator[None]:
+    """Memoize the permission checks made within this block, such as while handling a single interaction.
+
+    Inside the scope, `has_permissions` and `require_moderation` calculate the permissions of each member
+    only once, later checks reuse the result. The scope is local to the current context, so concurrent
+    event handlers each get their own. Entering a scope while one is active reuses the active one.
+
+    Permissions are not recalculated within the scope when roles or overwrites change,
+    so it should only span the handling of a single event.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        @bot.listen()
+        async def on_interaction(event: hikari.InteractionCreateEvent) -> None:
+            with toolbox.permission_scope():
+                await run_checks(event)
+                await run_command(event)
+    """
+    if _scope_cache.get() is not None:
+        yield
+        return
+
+    token = _scope_cache.set({})
+    try:
+        yield
+    finally:
+        _scope_cache.reset(token)
+
+
+def memoize_permissions(func: CallableT) -> CallableT:
+    """Decorator running a function or coroutine function within a `permission_scope`.
+
+    Parameters
+    ----------
+    func : Callable[..., Any]
+        The function to decorate, such as an event listener or command handler.
+
+    Returns
+    -------
+    Callable[..., Any]
+        The decorated function.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        @bot.listen()
+        @toolbox.memoize_permissions
+        async def on_interaction(event: hikari.InteractionCreateEvent) -> None:
+            ...
+    """
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args: t.Any, **kwargs: t.Any) -> t.Any:
+            with permission_scope():
+                return await func(*args, **kwargs)
+
+        return t.cast(CallableT, async_wrapper)
+
+    @functools.wraps(func)
+    def wrapper(*args: t.Any, **kwargs: t.Any) -> t.Any:
+        with permission_scope():
+            return func(*args, **kwargs)
+
+    return t.cast(CallableT, wrapper)
+
+
+def has_permissions(
+    member: hikari.Member,
+    permissions: hikari.Permissions,
+    channel: t.Optional[hikari.PermissibleGuildChannel] = None,
+) -> bool:
+    """
+    Returns True if "member" has all of "permissions", taking the overwrites of "channel" into account if provided.
+
+    Within a `permission_scope`, the permissions of each member are only calculated once per channel.
+
+    Parameters
+    ----------
+    member : hikari.Member
+        The member to check.
+    permissions : hikari.Permissions
+        The permissions `member` should have.
+    channel : hikari.PermissibleGuildChannel, optional
+        The channel for permission overwrite calculations, by default None.
+
+    Returns
+    -------
+    bool
+        Whether "member" has all of "permissions".
+
+    Raises
+    ------
+    CacheFailureError
+        Some objects could not be resolved from cache to perform the operation.
+    """
+    cache = _scope_cache.get()
+    if cache is None:
+        return calculate_permissions(member, channel) & permissions == permissions
+
+    key = ("permissions", member.guild_id, member.id, channel.id if channel else None)
+    if (member_permissions := cache.get(key)) is None:
+        member_permissions = cache[key] = calculate_permissions(member, channel)
+
+    return member_permissions & permissions == permissions
+
+
+def require_moderation(
+    moderator: hikari.Member, member: hikari.Member, permissions: hikari.Permissions = hikari.Permissions.NONE
+) -> None:
+    """
+    Raises if "moderator" cannot execute moderation actions on "member", as determined by `can_moderate`.
+
+    Within a `permission_scope`, the result is only calculated once per pair of members and permissions.
+
+    Parameters
+    ----------
+    moderator : hikari.Member
+        The moderator to check.
+    member : hikari.Member
+        The member to check.
+    permissions : hikari.Permissions
+        The permissions `moderator` should have, by default none.
+
+    Raises
+    ------
+    ModerationError
+        "moderator" cannot execute moderation actions on "member".
+    CacheFailureError
+        Some objects could not be resolved from cache to perform the operation.
+    """
+    cache = _scope_cache.get()
+    if cache is None:
+        allowed = can_moderate(moderator, member, permissions)
+    else:
+        key = ("moderation", moderator.guild_id, moderator.id, member.id, int(permissions))
+        if (allowed := cache.get(key)) is None:
+            allowed = cache[key] = can_moderate(moderator, member, permissions)
+
+    if not allowed:
+        raise ModerationError(f"Member {moderator.id} cannot moderate member {member.id}.", permissions)
+
+
+# MIT License
+#
+# Copyright (c) 2022-present HyperGH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
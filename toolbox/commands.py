@@ -1,40 +1,60 @@
+import array
+import bisect
+import heapq
+import itertools
 import typing as t
 
 import hikari
 
-__all__: t.Sequence[str] = ["as_command_choices"]
+from .internal import put_bounded
+
+__all__: t.Sequence[str] = [
+    "as_command_choices",
+    "iter_command_choices",
+    "aiter_command_choices",
+    "cached_command_choices",
+    "ChoiceIndex",
+]
 
 ChoiceTypes = t.Union[str, int, float]
 
+_CHOICE_CACHE_SIZE = 1024
+_choice_cache: t.Dict[t.Hashable, t.Tuple[hikari.CommandChoice, ...]] = {}
+
+_NGRAM_SIZE = 3
+_MIN_SIMILARITY = 0.5  # The fraction of n-grams of a query a fuzzy match must contain
+_MAX_FUZZY_CANDIDATES = 512  # The maximum amount of names compared to a query per search
+
 
 def _dict_to_command_choices(choices: t.Dict[str, ChoiceTypes]) -> t.Sequence[hikari.CommandChoice]:
     return tuple(hikari.CommandChoice(name=k, value=v) for k, v in choices.items())
 
 
 def _list_to_command_choices(
-    choices: t.Union[t.Sequence[ChoiceTypes], t.Sequence[t.Sequence[ChoiceTypes]]],
+    choices: t.Union[t.Iterable[ChoiceTypes], t.Iterable[t.Sequence[ChoiceTypes]]],
 ) -> t.Sequence[hikari.CommandChoice]:
-    if isinstance(choices[0], list):
-        return tuple(
-            hikari.CommandChoice(name=str(name), value=value)
-            for name, value in t.cast(t.Sequence[t.Sequence[ChoiceTypes]], choices)
-        )
-    else:
-        return tuple(
-            hikari.CommandChoice(name=str(item), value=item) for item in t.cast(t.Sequence[ChoiceTypes], choices)
-        )
+    return tuple(map(_to_command_choice, choices))
+
+
+def _to_command_choice(item: t.Union[ChoiceTypes, t.Sequence[ChoiceTypes]]) -> hikari.CommandChoice:
+    # Shared by every conversion, so the same items always result in the same choices
+    if isinstance(item, (list, tuple)):
+        name, value = item
+        return hikari.CommandChoice(name=str(name), value=value)
+
+    return hikari.CommandChoice(name=str(item), value=t.cast(ChoiceTypes, item))
 
 
 @t.overload
-def as_command_choices(choices: t.Sequence[ChoiceTypes]) -> t.Sequence[hikari.CommandChoice]: ...
+def as_command_choices(choices: t.Dict[str, ChoiceTypes]) -> t.Sequence[hikari.CommandChoice]: ...
 
 
 @t.overload
-def as_command_choices(choices: t.Sequence[t.Sequence[ChoiceTypes]]) -> t.Sequence[hikari.CommandChoice]: ...
+def as_command_choices(choices: t.Iterable[ChoiceTypes]) -> t.Sequence[hikari.CommandChoice]: ...
 
 
 @t.overload
-def as_command_choices(choices: t.Dict[str, ChoiceTypes]) -> t.Sequence[hikari.CommandChoice]: ...
+def as_command_choices(choices: t.Iterable[t.Sequence[ChoiceTypes]]) -> t.Sequence[hikari.CommandChoice]: ...
 
 
 @t.overload
@@ -54,8 +74,10 @@ def as_command_choices(*args: t.Any, **kwargs: t.Any) -> t.Sequence[hikari.Comma
 
     Parameters
     ----------
-    choices : typing.Sequence[typing.Union[str, int, float]] or typing.Sequence[typing.Sequence[typing.Union[str, int, float]]] or dict[str, typing.Union[str, int, float]]
-        A sequence or dict to use to generate the `typing.Sequence[hikari.CommandChoice]`.
+    choices : typing.Iterable[typing.Union[str, int, float]] or typing.Iterable[typing.Sequence[typing.Union[str, int, float]]] or dict[str, typing.Union[str, int, float]]
+        An iterable or dict to use to generate the `typing.Sequence[hikari.CommandChoice]`.
+        Lists and tuples are converted as (name, value) pairs, other items are used as both the name and the value.
+        To stop after a number of choices, use `iter_command_choices` instead.
 
         .. code-block:: python
 
@@ -106,6 +128,263 @@ def as_command_choices(*args: t.Any, **kwargs: t.Any) -> t.Sequence[hikari.Comma
     return _list_to_command_choices(choices)
 
 
+def iter_command_choices(
+    choices: t.Union[t.Iterable[ChoiceTypes], t.Iterable[t.Sequence[ChoiceTypes]], t.Mapping[str, ChoiceTypes]],
+    *,
+    limit: t.Optional[int] = 25,
+) -> t.Iterator[hikari.CommandChoice]:
+    """Lazily convert an iterable to `hikari.CommandChoice` objects, stopping after a number of choices.
+
+    Unlike `as_command_choices`, no more items are taken from the iterable than needed,
+    so it can be used with generators or database cursors of any size.
+
+    Parameters
+    ----------
+    choices : typing.Iterable[typing.Union[str, int, float]] or typing.Iterable[typing.Sequence[typing.Union[str, int, float]]] or typing.Mapping[str, typing.Union[str, int, float]]
+        The items to convert. Lists and tuples are converted as (name, value) pairs, other items are used
+        as both the name and the value. Mappings are converted from their items.
+    limit : typing.Optional[int]
+        The maximum amount of choices to convert, by default 25, the maximum Discord accepts.
+        If None, all items are converted.
+
+    Returns
+    -------
+    typing.Iterator[hikari.CommandChoice]
+        The converted choices.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        rows = await db.fetch("SELECT name, id FROM tags WHERE name LIKE $1", f"{query}%")
+        await interaction.create_response(list(toolbox.iter_command_choices(rows)))
+    """
+    if isinstance(choices, t.Mapping):
+        items = itertools.islice(choices.items(), limit)
+        return (hikari.CommandChoice(name=name, value=value) for name, value in items)
+
+    return map(_to_command_choice, itertools.islice(choices, limit))
+
+
+async def aiter_command_choices(
+    choices: t.AsyncIterable[t.Union[ChoiceTypes, t.Sequence[ChoiceTypes]]], *, limit: t.Optional[int] = 25
+) -> t.AsyncIterator[hikari.CommandChoice]:
+    """Lazily convert an async iterable to `hikari.CommandChoice` objects, stopping after a number of choices.
+
+    Parameters
+    ----------
+    choices : typing.AsyncIterable[typing.Union[str, int, float, typing.Sequence[typing.Union[str, int, float]]]]
+        The items to convert. Lists and tuples are converted as (name, value) pairs, other items are used
+        as both the name and the value.
+    limit : typing.Optional[int]
+        The maximum amount of choices to convert, by default 25, the maximum Discord accepts.
+        If None, all items are converted.
+
+    Returns
+    -------
+    typing.AsyncIterator[hikari.CommandChoice]
+        The converted choices.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        choices = [choice async for choice in toolbox.aiter_command_choices(cursor)]
+    """
+    if limit is not None and limit < 0:
+        raise ValueError("limit must be None or at least 0.")
+
+    if limit == 0:
+        return
+
+    count = 0
+    async for item in choices:
+        yield _to_command_choice(item)
+
+        count += 1
+        if count == limit:
+            return
+
+
+def cached_command_choices(*args: t.Any, **kwargs: t.Any) -> t.Tuple[hikari.CommandChoice, ...]:
+    """Convert the arguments to `typing.Sequence[hikari.CommandChoice]`, reusing the result of earlier calls.
+
+    Accepts the same arguments as `as_command_choices`. Identical arguments return the same tuple,
+    so choice tables can be declared once at import time and shared between commands without
+    creating new `hikari.CommandChoice` objects. Up to 1024 tables are kept, the oldest are evicted first.
+    Arguments that are not hashable are converted without caching.
+
+    .. warning::
+        The returned choices are shared between callers and must not be modified.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        COLORS = toolbox.cached_command_choices("red", "green", "blue")
+
+        # Returns the same tuple as `COLORS`
+        toolbox.cached_command_choices("red", "green", "blue")
+
+    Returns
+    -------
+    typing.Tuple[hikari.CommandChoice, ...]
+        The generated `hikari.CommandChoice` objects.
+    """
+    try:
+        key = _choice_key(args, kwargs)
+        choices = _choice_cache.get(key)
+    except TypeError:  # Unhashable arguments
+        return tuple(as_command_choices(*args, **kwargs))
+
+    if choices is None:
+        choices = put_bounded(_choice_cache, key, tuple(as_command_choices(*args, **kwargs)), _CHOICE_CACHE_SIZE)
+
+    return choices
+
+
+class ChoiceIndex:
+    """A search index over command choices, for answering autocomplete interactions.
+
+    Choices whose name starts with the query are returned first, in alphabetical order.
+    If there are not enough of them, they are followed by choices whose name contains the query,
+    shortest first, then by fuzzy matches: choices whose name contains at least half of the trigrams
+    of the query, ranked by how many they contain. Matching is case-insensitive.
+
+    Prefix and substring matches are exact, and queries shorter than a trigram only have those.
+    To keep searches fast on large indexes, fuzzy matching compares at most 512 names to the query,
+    starting with the names sharing the rarest trigrams with it.
+
+    Accepts the same arguments as `as_command_choices`.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        TIMEZONES = toolbox.ChoiceIndex(zoneinfo.available_timezones())
+
+        async def autocomplete(interaction: hikari.AutocompleteInteraction) -> None:
+            await interaction.create_response(TIMEZONES.search(interaction.options[0].value))
+    """
+
+    __slots__ = ("_choices", "_names", "_keys", "_order", "_ngrams")
+
+    def __init__(self, *args: t.Any, **kwargs: t.Any) -> None:
+        self._choices: t.Sequence[hikari.CommandChoice] = as_command_choices(*args, **kwargs)
+        self._names = [choice.name.casefold() for choice in self._choices]
+
+        # The sorted names with the indices of their choices, a flattened prefix tree searched with bisect
+        order = sorted(range(len(self._names)), key=self._names.__getitem__)
+        self._keys = [self._names[i] for i in order]
+        self._order = array.array("l", order)
+
+        ngrams: t.Dict[str, t.List[int]] = {}
+        for i, name in enumerate(self._names):
+            for ngram in _ngrams(name):
+                ngrams.setdefault(ngram, []).append(i)
+        self._ngrams = {ngram: array.array("l", indices) for ngram, indices in ngrams.items()}
+
+    def __len__(self) -> int:
+        return len(self._choices)
+
+    @property
+    def choices(self) -> t.Sequence[hikari.CommandChoice]:
+        """All choices in this index, in the order they were provided in."""
+        return self._choices
+
+    def search(self, query: str, *, limit: int = 25) -> t.List[hikari.CommandChoice]:
+        """Find the choices best matching a query.
+
+        Parameters
+        ----------
+        query : str
+            The text to search for, such as the value of a focused autocomplete option.
+            An empty query returns the first choices.
+        limit : int
+            The maximum amount of choices to return, by default 25, the maximum Discord accepts.
+
+        Returns
+        -------
+        List[hikari.CommandChoice]
+            The matching choices, best matches first.
+        """
+        query = query.casefold()
+        if not query:
+            return list(self._choices[:limit])
+
+        start = bisect.bisect_left(self._keys, query)
+        end = bisect.bisect_left(self._keys, query + "\U0010ffff", start, min(start + limit, len(self._keys)))
+        matches = [self._order[i] for i in range(start, end)]
+
+        if len(matches) < limit:
+            matches.extend(self._fuzzy_search(query, limit - len(matches), exclude=set(matches)))
+
+        return [self._choices[i] for i in matches]
+
+    def _fuzzy_search(self, query: str, limit: int, *, exclude: t.Set[int]) -> t.List[int]:
+        if len(query) < _NGRAM_SIZE:
+            # Too short to share trigrams with any name, so every name is checked for the query instead
+            hits = [(len(name), i) for i, name in enumerate(self._names) if query in name and i not in exclude]
+            return [i for _, i in heapq.nsmallest(limit, hits)]
+
+        ngrams = _ngrams(query)
+
+        min_shared = max(1, int(len(ngrams) * _MIN_SIMILARITY + 0.5))
+        postings = sorted((self._ngrams.get(ngram, ()) for ngram in ngrams), key=len)
+        names = self._names
+
+        # Names containing the query contain all of its n-grams, so they are all in the rarest posting.
+        # They rank above names only sharing n-grams with the query, so every one of them is checked.
+        hits = [(len(names[i]), i) for i in postings[0] if query in names[i] and i not in exclude]
+        if len(hits) >= limit:
+            return [i for _, i in heapq.nsmallest(limit, hits)]
+
+        scores: t.Dict[int, int] = dict.fromkeys(exclude, 0)
+        scores.update((i, 0) for _, i in hits)
+        matches: t.List[t.Tuple[int, int, int]] = []
+        limit -= len(hits)
+
+        # A name containing `threshold` of the n-grams must appear in one of the rarest len - threshold + 1 postings.
+        # Lowering the threshold one posting at a time, the search can stop as soon as enough names reach it,
+        # as names not seen yet contain fewer n-grams than every match found so far.
+        budget = _MAX_FUZZY_CANDIDATES
+        for threshold, posting in zip(range(len(ngrams), min_shared - 1, -1), postings):
+            for i in posting[:budget]:
+                if i not in scores:
+                    name = names[i]
+                    scores[i] = shared = sum(map(name.__contains__, ngrams))
+                    if shared >= min_shared:
+                        matches.append((-shared, len(name), i))
+
+            budget -= len(posting)
+            if budget <= 0 or sum(-score >= threshold for score, _, _ in matches) >= limit:
+                break
+
+        return [i for _, i in sorted(hits)] + [i for _, _, i in heapq.nsmallest(limit, matches)]
+
+
+def _ngrams(text: str) -> t.Set[str]:
+    """Get the n-grams of a string, strings shorter than an n-gram have none."""
+    return {text[i : i + _NGRAM_SIZE] for i in range(len(text) - _NGRAM_SIZE + 1)}
+
+
+def _choice_key(args: t.Tuple[t.Any, ...], kwargs: t.Dict[str, t.Any]) -> t.Hashable:
+    """Make a cache key for the arguments of `as_command_choices`, following the same dispatch.
+
+    The types of all names and values are part of the key, as equal values such as 1, 1.0 and True
+    result in different choices. Raises TypeError if the arguments are not hashable.
+    """
+    mapping = kwargs or (args[0] if len(args) == 1 and isinstance(args[0], dict) else None)
+    if mapping is not None:
+        items = tuple(mapping.items())
+        return (dict, items, tuple(map(type, itertools.chain.from_iterable(items))))
+
+    choices = args if len(args) != 1 else args[0]
+    # Lists and tuples are both (name, value) pairs, so they share a key
+    items = tuple(tuple(item) if isinstance(item, (list, tuple)) else (item,) for item in choices)
+    return (None, items, tuple(map(type, itertools.chain.from_iterable(items))))
+
+
 # MIT License
 #
 # Copyright (c) 2022-present HyperGH
@@ -1,6 +1,13 @@
+from __future__ import annotations
+
 import typing as t
 
-__all__: t.Sequence[str] = ("ToolboxError", "CacheFailureError", "EmbedValidationError")
+if t.TYPE_CHECKING:
+    import hikari
+
+    from .messages import EmbedViolation
+
+__all__: t.Sequence[str] = ("ToolboxError", "CacheFailureError", "EmbedValidationError", "ModerationError")
 
 
 class ToolboxError(Exception):
@@ -14,6 +21,20 @@ class CacheFailureError(ToolboxError):
 class EmbedValidationError(ToolboxError):
     """Exception raised when a embed validation fails."""
 
+    def __init__(self, message: str, violations: t.Sequence[EmbedViolation] = ()) -> None:
+        super().__init__(message)
+        self.violations = violations
+        """All limits that were exceeded, if known."""
+
+
+class ModerationError(ToolboxError):
+    """Exception raised when a member cannot execute moderation actions on another member."""
+
+    def __init__(self, message: str, permissions: hikari.Permissions) -> None:
+        super().__init__(message)
+        self.permissions = permissions
+        """The permissions that were required for the moderation actions."""
+
 
 # MIT License
 #
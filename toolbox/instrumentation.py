@@ -0,0 +1,349 @@
+from __future__ import annotations
+
+import collections
+import collections.abc
+import functools
+import inspect
+import sys
+import time
+import types
+import typing as t
+
+__all__: t.Sequence[str] = (
+    "enable_instrumentation",
+    "disable_instrumentation",
+    "reset_instrumentation",
+    "is_instrumentation_enabled",
+    "get_instrumentation_snapshot",
+    "track_cache",
+)
+
+_PACKAGE = __name__.rpartition(".")[0]
+# The submodules with functions to instrument
+_SUBMODULES = ("checks", "commands", "members", "messages", "permissions", "roles", "snapshots", "strings")
+_PERCENTILES = (50, 90, 99)
+
+
+class _CacheT(t.Protocol):
+    @property
+    def hits(self) -> int: ...
+
+    @property
+    def misses(self) -> int: ...
+
+    def __len__(self) -> int: ...
+
+
+class _FunctionStats:
+    """The statistics recorded for a single instrumented function."""
+
+    __slots__ = ("calls", "errors", "total", "max", "samples")
+
+    def __init__(self, sample_size: int) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples: t.Deque[float] = collections.deque(maxlen=sample_size)
+
+    def record(self, elapsed: float, failed: bool) -> None:
+        self.calls += 1
+        self.errors += failed
+        self.total += elapsed
+        self.max = max(self.max, elapsed)
+        self.samples.append(elapsed)
+
+    def to_dict(self) -> t.Dict[str, t.Any]:
+        samples = sorted(self.samples)
+        stats: t.Dict[str, t.Any] = {
+            "calls": self.calls,
+            "errors": self.errors,
+            "total_seconds": self.total,
+            "mean_seconds": self.total / self.calls if self.calls else 0.0,
+            "max_seconds": self.max,
+        }
+        for percentile in _PERCENTILES:
+            # Nearest rank, over the most recent calls only
+            index = min(len(samples) - 1, len(samples) * percentile // 100)
+            stats[f"p{percentile}_seconds"] = samples[index] if samples else 0.0
+
+        return stats
+
+
+# The original functions that were swapped for instrumented ones: (owner, attribute, original, instrumented)
+_swapped: t.List[t.Tuple[t.Any, str, t.Any, t.Any]] = []
+_stats: t.Dict[str, _FunctionStats] = {}
+_tracked_caches: t.Dict[str, _CacheT] = {}
+_sample_size = 1024
+
+
+def enable_instrumentation(*, sample_size: int = 1024) -> None:
+    """Start recording the calls of every public function and method of toolbox.
+
+    The functions are swapped for instrumented ones in the modules of toolbox and on its classes,
+    so there is no overhead at all while instrumentation is disabled.
+    References to functions taken before enabling, such as ``from toolbox import remove_markdown``,
+    are not swapped and their calls are not recorded, use them through the module instead.
+
+    The time of coroutines includes waiting for I/O. The time of functions returning iterators includes
+    consuming the iterator, and the call is recorded once it is exhausted or closed.
+    Calls made by other toolbox functions are recorded as well.
+
+    Parameters
+    ----------
+    sample_size : int
+        The amount of most recent calls of each function percentiles are calculated from, by default 1024.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        toolbox.enable_instrumentation()
+
+        # Later, such as in a metrics endpoint
+        snapshot = toolbox.get_instrumentation_snapshot()
+        for name, stats in snapshot["functions"].items():
+            calls_metric.labels(name).set(stats["calls"])
+    """
+    global _sample_size
+
+    if sample_size < 1:
+        raise ValueError("sample_size must be at least 1.")
+    if _swapped:
+        return
+
+    _sample_size = sample_size
+    modules = [_import_submodule(name) for name in _SUBMODULES]
+    package = sys.modules[_PACKAGE]
+
+    instrumented: t.Dict[int, t.Any] = {}  # Maps the id of each original function to its instrumented version
+    for module in modules:
+        for name in module.__all__:
+            value = getattr(module, name)
+            if inspect.isfunction(value):
+                instrumented[id(value)] = _instrument(value)
+            elif inspect.isclass(value) and value.__module__ == module.__name__:
+                for attribute, method in vars(value).items():
+                    if inspect.isfunction(method) and (attribute == "__call__" or not attribute.startswith("_")):
+                        _swap(value, attribute, method, _instrument(method))
+
+    # Swap every reference in toolbox, including ones imported by other submodules and cached by the package
+    for module in (package, *modules):
+        for name, value in list(vars(module).items()):
+            if (wrapper := instrumented.get(id(value))) is not None:
+                _swap(module, name, value, wrapper)
+
+
+def disable_instrumentation() -> None:
+    """Stop recording calls, restoring the original functions. The recorded statistics are kept."""
+    wrappers = {id(wrapper) for _, _, _, wrapper in _swapped}
+    while _swapped:
+        owner, name, original, wrapper = _swapped.pop()
+        if getattr(owner, name, None) is wrapper:
+            setattr(owner, name, original)
+
+    # Names first accessed on the package while enabled were cached with their wrapper by its __getattr__,
+    # they are dropped so the next access resolves the original again
+    package = vars(sys.modules[_PACKAGE])
+    for name in [name for name, value in package.items() if id(value) in wrappers]:
+        del package[name]
+
+
+def reset_instrumentation() -> None:
+    """Clear the recorded statistics, without enabling or disabling instrumentation."""
+    _stats.clear()
+
+
+def is_instrumentation_enabled() -> bool:
+    """Whether calls are currently being recorded."""
+    return bool(_swapped)
+
+
+def track_cache(name: str, cache: _CacheT) -> None:
+    """Include the hit rate of a cache, such as a `MessageCache`, in the instrumentation snapshot.
+
+    Parameters
+    ----------
+    name : str
+        The name of the cache in the snapshot. Tracking another cache with the same name replaces it.
+    cache : MessageCache
+        The cache to track. It is kept alive for as long as it is tracked.
+    """
+    _tracked_caches[name] = cache
+
+
+def get_instrumentation_snapshot() -> t.Dict[str, t.Any]:
+    """Get the recorded statistics as a plain dict, which can be dumped to JSON or exported to a metrics system.
+
+    Returns
+    -------
+    Dict[str, Any]
+        A dict with the following keys:
+
+        - ``enabled``: Whether instrumentation is enabled.
+        - ``functions``: The qualified names of called functions, mapped to their
+          ``calls``, ``errors``, ``total_seconds``, ``mean_seconds``, ``max_seconds``,
+          ``p50_seconds``, ``p90_seconds`` and ``p99_seconds``.
+        - ``caches``: The names of the internal caches of toolbox and tracked caches, mapped to their
+          ``hits``, ``misses``, ``size`` and ``hit_rate``.
+    """
+    caches: t.Dict[str, t.Tuple[int, int, int]] = {}
+    if strings := sys.modules.get(f"{_PACKAGE}.strings"):  # Only reported once used
+        for name, function in (
+            ("markdown_plans", strings._compile_plan),
+            ("content_scanners", strings._compile_scanner),
+        ):
+            info = function.cache_info()
+            caches[name] = (info.hits, info.misses, info.currsize)
+
+    for name, cache in _tracked_caches.items():
+        caches[name] = (cache.hits, cache.misses, len(cache))
+
+    return {
+        "enabled": is_instrumentation_enabled(),
+        "functions": {name: stats.to_dict() for name, stats in _stats.items()},
+        "caches": {
+            name: {"hits": hits, "misses": misses, "size": size, "hit_rate": hits / (hits + misses) if hits else 0.0}
+            for name, (hits, misses, size) in caches.items()
+        },
+    }
+
+
+def _import_submodule(name: str) -> types.ModuleType:
+    __import__(f"{_PACKAGE}.{name}")
+    return sys.modules[f"{_PACKAGE}.{name}"]
+
+
+def _swap(owner: t.Any, name: str, original: t.Any, wrapper: t.Any) -> None:
+    setattr(owner, name, wrapper)
+    _swapped.append((owner, name, original, wrapper))
+
+
+def _get_stats(name: str) -> _FunctionStats:
+    if (stats := _stats.get(name)) is None:
+        stats = _stats[name] = _FunctionStats(_sample_size)
+
+    return stats
+
+
+def _instrument(function: t.Callable[..., t.Any]) -> t.Callable[..., t.Any]:
+    """
+    Helper function to wrap a function in one recording its calls, keeping the kind of function it is.
+
+    Parameters
+    ----------
+    function : Callable[..., Any]
+        The function to instrument.
+
+    Returns
+    -------
+    Callable[..., Any]
+        The instrumented function.
+    """
+    name = function.__qualname__
+
+    if inspect.isasyncgenfunction(function):
+
+        @functools.wraps(function)
+        def instrumented_async_generator(*args: t.Any, **kwargs: t.Any) -> t.AsyncIterator[t.Any]:
+            return _record_async_iterator(name, function(*args, **kwargs))
+
+        return instrumented_async_generator
+
+    if inspect.iscoroutinefunction(function):
+
+        @functools.wraps(function)
+        async def instrumented_coroutine(*args: t.Any, **kwargs: t.Any) -> t.Any:
+            start = time.perf_counter()
+            try:
+                result = await function(*args, **kwargs)
+            except BaseException:
+                _get_stats(name).record(time.perf_counter() - start, True)
+                raise
+
+            _get_stats(name).record(time.perf_counter() - start, False)
+            return result
+
+        return instrumented_coroutine
+
+    @functools.wraps(function)
+    def instrumented(*args: t.Any, **kwargs: t.Any) -> t.Any:
+        start = time.perf_counter()
+        try:
+            result = function(*args, **kwargs)
+        except BaseException:
+            _get_stats(name).record(time.perf_counter() - start, True)
+            raise
+
+        elapsed = time.perf_counter() - start
+        # Generators and functions returning iterators do their work while the iterator is consumed
+        if isinstance(result, collections.abc.Iterator):
+            return _record_iterator(name, result, elapsed)
+
+        _get_stats(name).record(elapsed, False)
+        return result
+
+    return instrumented
+
+
+def _record_iterator(name: str, iterator: t.Iterator[t.Any], elapsed: float) -> t.Iterator[t.Any]:
+    failed = False
+    try:
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            except BaseException:
+                failed = True
+                raise
+            finally:
+                elapsed += time.perf_counter() - start
+
+            yield item
+    finally:
+        _get_stats(name).record(elapsed, failed)
+
+
+async def _record_async_iterator(name: str, iterator: t.AsyncIterator[t.Any]) -> t.AsyncIterator[t.Any]:
+    elapsed, failed = 0.0, False
+    try:
+        while True:
+            start = time.perf_counter()
+            try:
+                item = await iterator.__anext__()
+            except StopAsyncIteration:
+                return
+            except BaseException:
+                failed = True
+                raise
+            finally:
+                elapsed += time.perf_counter() - start
+
+            yield item
+    finally:
+        _get_stats(name).record(elapsed, failed)
+
+
+# MIT License
+#
+# Copyright (c) 2022-present HyperGH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import abc
+import asyncio
+import concurrent.futures
+import functools
+import re
+import typing as t
+
+if t.TYPE_CHECKING:
+    import hikari
+
+__all__: t.Sequence[str] = ("EventListener", "ListenerT", "put_bounded", "lazy_regex", "lazy_getattr", "submit_batched")
+
+KeyT = t.TypeVar("KeyT")
+ValueT = t.TypeVar("ValueT")
+
+ArgumentT = t.TypeVar("ArgumentT")
+ResultT = t.TypeVar("ResultT")
+
+ListenerT = t.Tuple[t.Type["hikari.Event"], t.Callable[[t.Any], t.Coroutine[t.Any, t.Any, None]]]
+"""An event type and the callback that should be subscribed to it."""
+
+
+class EventListener(abc.ABC):
+    """Base class for objects that are kept up to date by listening to gateway events."""
+
+    __slots__ = ()
+
+    @abc.abstractmethod
+    def _listeners(self) -> t.Sequence[ListenerT]:
+        """The event types and callbacks this object needs to be subscribed to."""
+
+    def subscribe(self, bot: hikari.EventManagerAware) -> None:
+        """Keep this object up to date by listening to the events it depends on.
+
+        Parameters
+        ----------
+        bot : hikari.EventManagerAware
+            The bot to subscribe to events of.
+        """
+        for event_type, callback in self._listeners():
+            bot.event_manager.subscribe(event_type, callback)
+
+    def unsubscribe(self, bot: hikari.EventManagerAware) -> None:
+        """Stop listening to events previously subscribed to with `subscribe`.
+
+        Parameters
+        ----------
+        bot : hikari.EventManagerAware
+            The bot to unsubscribe from events of.
+        """
+        for event_type, callback in self._listeners():
+            bot.event_manager.unsubscribe(event_type, callback)
+
+
+def put_bounded(cache: t.Dict[KeyT, ValueT], key: KeyT, value: ValueT, max_size: int) -> ValueT:
+    """Insert a value into a dict used as a cache, evicting the oldest entry if it is full.
+
+    Parameters
+    ----------
+    cache : Dict[KeyT, ValueT]
+        The cache to insert into.
+    key : KeyT
+        The key to insert the value at.
+    value : ValueT
+        The value to insert.
+    max_size : int
+        The maximum amount of entries in the cache.
+
+    Returns
+    -------
+    ValueT
+        The inserted value.
+    """
+    if len(cache) >= max_size:
+        del cache[next(iter(cache))]
+
+    cache[key] = value
+    return value
+
+
+def lazy_regex(pattern: str) -> t.Callable[[], t.Pattern[str]]:
+    """Get a function compiling a regex pattern when it is first called, and returning the same pattern after.
+
+    Parameters
+    ----------
+    pattern : str
+        The regex pattern to compile.
+
+    Returns
+    -------
+    Callable[[], Pattern[str]]
+        The function returning the compiled pattern.
+    """
+    return functools.lru_cache(maxsize=None)(functools.partial(re.compile, pattern))
+
+
+def lazy_getattr(module: str, attributes: t.Mapping[str, t.Callable[[], t.Any]]) -> t.Callable[[str], t.Any]:
+    """Make a module level `__getattr__` (PEP 562) creating attributes when they are first accessed.
+
+    Parameters
+    ----------
+    module : str
+        The name of the module, used in the error of missing attributes.
+    attributes : Mapping[str, Callable[[], Any]]
+        The names of the lazy attributes, mapped to functions returning their value.
+        The functions are called on every access, so they should cache their value.
+
+    Returns
+    -------
+    Callable[[str], Any]
+        The `__getattr__` function of the module.
+    """
+
+    def __getattr__(name: str) -> t.Any:
+        if (factory := attributes.get(name)) is None:
+            raise AttributeError(f"module {module!r} has no attribute {name!r}")
+
+        return factory()
+
+    return __getattr__
+
+
+class _Batch:
+    """Calls submitted to the same executor within a batching window, not yet sent to it."""
+
+    __slots__ = ("calls", "futures", "handle")
+
+    def __init__(self) -> None:
+        self.calls: t.List[t.Tuple[t.Callable[[t.Any], t.Any], t.Any]] = []
+        self.futures: t.List[asyncio.Future[t.Any]] = []
+        self.handle: t.Optional[asyncio.TimerHandle] = None
+
+
+# Batches are only kept until they are sent, so no event loop or executor is kept alive
+_batches: t.Dict[t.Tuple[asyncio.AbstractEventLoop, t.Optional[concurrent.futures.Executor]], _Batch] = {}
+
+
+def submit_batched(
+    executor: t.Optional[concurrent.futures.Executor],
+    function: t.Callable[[ArgumentT], ResultT],
+    argument: ArgumentT,
+    *,
+    window: float = 0.002,
+    max_batch_size: int = 64,
+) -> asyncio.Future[ResultT]:
+    """Call a function on an executor, batched with the other calls submitted to it within a short window.
+
+    Each batch is sent to the executor as a single task, so the cost of a task,
+    such as pickling for a `concurrent.futures.ProcessPoolExecutor`, is shared by its calls.
+
+    Parameters
+    ----------
+    executor : concurrent.futures.Executor, optional
+        The executor to call the function on, the default executor of the running event loop if None.
+    function : Callable[[ArgumentT], ResultT]
+        The function to call. It must be picklable for process pools, such as a module level function.
+    argument : ArgumentT
+        The argument to call the function with.
+    window : float
+        The seconds to wait for more calls after the first call of a batch, by default 0.002.
+    max_batch_size : int
+        The amount of calls sending a batch without waiting for the end of the window, by default 64.
+
+    Returns
+    -------
+    asyncio.Future[ResultT]
+        A future resolved with the result of the call, or the exception it raised.
+    """
+    loop = asyncio.get_running_loop()
+    key = (loop, executor)
+    if (batch := _batches.get(key)) is None:
+        batch = _batches[key] = _Batch()
+        batch.handle = loop.call_later(window, _send_batch, key)
+
+    future: asyncio.Future[ResultT] = loop.create_future()
+    batch.calls.append((function, argument))
+    batch.futures.append(future)
+    if len(batch.calls) >= max_batch_size:
+        _send_batch(key)
+
+    return future
+
+
+def _send_batch(key: t.Tuple[asyncio.AbstractEventLoop, t.Optional[concurrent.futures.Executor]]) -> None:
+    if (batch := _batches.pop(key, None)) is None:
+        return
+
+    if batch.handle:
+        batch.handle.cancel()
+
+    loop, executor = key
+    try:
+        results = loop.run_in_executor(executor, _run_batch, batch.calls)
+    except Exception as e:  # Such as an executor that was shut down
+        _resolve_batch(batch.futures, [(False, e)] * len(batch.futures))
+        return
+
+    results.add_done_callback(functools.partial(_on_batch_done, batch.futures))
+
+
+def _run_batch(calls: t.List[t.Tuple[t.Callable[[t.Any], t.Any], t.Any]]) -> t.List[t.Tuple[bool, t.Any]]:
+    # Exceptions are returned, so one failing call does not fail the others
+    results: t.List[t.Tuple[bool, t.Any]] = []
+    for function, argument in calls:
+        try:
+            results.append((True, function(argument)))
+        except Exception as e:
+            results.append((False, e))
+
+    return results
+
+
+def _on_batch_done(
+    futures: t.List[asyncio.Future[t.Any]], results: asyncio.Future[t.List[t.Tuple[bool, t.Any]]]
+) -> None:
+    if results.cancelled():
+        for future in futures:
+            future.cancel()
+    elif (exception := results.exception()) is not None:  # Such as a worker process that died
+        _resolve_batch(futures, [(False, exception)] * len(futures))
+    else:
+        _resolve_batch(futures, results.result())
+
+
+def _resolve_batch(futures: t.List[asyncio.Future[t.Any]], results: t.List[t.Tuple[bool, t.Any]]) -> None:
+    for future, (succeeded, result) in zip(futures, results):
+        if future.done():  # Cancelled by the caller
+            continue
+
+        if succeeded:
+            future.set_result(result)
+        else:
+            future.set_exception(result)
+
+
+# MIT License
+#
+# Copyright (c) 2022-present HyperGH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
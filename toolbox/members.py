@@ -5,9 +5,23 @@ import typing as t
 import hikari
 
 from .errors import CacheFailureError
+from .internal import EventListener
+from .internal import ListenerT
+from .internal import put_bounded
+from .permissions import PermissionResolver
+from .permissions import _check_moderation
 from .roles import sort_roles
 
-__all__: t.Sequence[str] = ("get_member_color", "is_above", "get_possessive", "calculate_permissions", "can_moderate")
+__all__: t.Sequence[str] = (
+    "get_member_color",
+    "is_above",
+    "get_possessive",
+    "calculate_permissions",
+    "calculate_permissions_bulk",
+    "can_moderate",
+    "RoleHierarchy",
+    "MemberColorResolver",
+)
 
 
 def get_member_color(member: hikari.Member) -> hikari.Color:
@@ -28,7 +42,7 @@ def get_member_color(member: hikari.Member) -> hikari.Color:
         return hikari.Color(0)
 
     for role in roles:
-        if role.color != hikari.Color.from_rgb(0, 0, 0):
+        if role.color:  # Colors are ints, black is treated as no color
             return role.color
 
     return hikari.Color(0)
@@ -154,6 +168,54 @@ def calculate_permissions(
     return permissions
 
 
+def calculate_permissions_bulk(
+    members: t.Iterable[hikari.Member], channel: t.Optional[hikari.PermissibleGuildChannel] = None
+) -> t.Mapping[hikari.Snowflake, hikari.Permissions]:
+    """Calculate the permissions of many members of the same guild.
+    If a channel is provided, channel overwrites will be taken into account.
+
+    The guild, its roles and the channel overwrites are only resolved once,
+    and permissions are only calculated once per distinct set of roles.
+
+    Parameters
+    ----------
+    members : Iterable[hikari.Member]
+        The members to calculate the permissions of. All of them must be in the same guild.
+    channel : hikari.GuildChannel, optional
+        The channel for permission overwrite calculations, by default None.
+
+    Returns
+    -------
+    Mapping[hikari.Snowflake, hikari.Permissions]
+        A mapping of member IDs to their calculated permissions.
+
+    Raises
+    ------
+    CacheFailureError
+        Some objects could not be resolved from cache to perform the operation.
+    ValueError
+        The members are not all in the same guild.
+    """
+    members = list(members)
+    if not members:
+        return {}
+
+    guild = members[0].get_guild()
+    if not guild:
+        raise CacheFailureError("Guild could not be resolved from cache.")
+
+    resolver = PermissionResolver(guild, max_cache_size=len(members))
+    permissions: t.Dict[hikari.Snowflake, hikari.Permissions] = {}
+
+    for member in members:
+        if member.guild_id != guild.id:
+            raise ValueError("All members must be in the same guild.")
+
+        permissions[member.id] = resolver.calculate_permissions(member, channel)
+
+    return permissions
+
+
 def can_moderate(
     moderator: hikari.Member, member: hikari.Member, permissions: hikari.Permissions = hikari.Permissions.NONE
 ) -> bool:
@@ -201,6 +263,409 @@ def can_moderate(
     return bool(mod_perms & permissions)
 
 
+class RoleHierarchy(EventListener):
+    """An index of the role hierarchy of a single guild, to compare members without sorting their roles.
+
+    Every role is given a rank, ordered by position and then by ID like in `is_above`.
+    The top role of a member is picked like `hikari.Member.get_top_role`, so out of roles sharing a position,
+    the one listed first in the member's roles wins.
+    The top rank of each member is cached until the member or the roles of the guild are updated.
+
+    The results are identical to `is_above` and `can_moderate`, as long as the index is kept up to date.
+    This can be done by calling `subscribe` with the bot, which listens to role, member and guild updates,
+    or by calling the `update_*` and `remove_*` methods manually.
+
+    Parameters
+    ----------
+    guild : hikari.Guild
+        The guild to index. Its roles are resolved from cache.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        hierarchy = toolbox.RoleHierarchy(guild)
+        hierarchy.subscribe(bot)
+
+        if hierarchy.can_moderate(moderator, member, hikari.Permissions.BAN_MEMBERS):
+            ...
+    """
+
+    __slots__ = ("_guild_id", "_owner_id", "_positions", "_ranks", "_top_ranks")
+
+    def __init__(self, guild: hikari.Guild) -> None:
+        self._guild_id = guild.id
+        self._owner_id = guild.owner_id
+        self._positions: t.Dict[hikari.Snowflake, int] = {role.id: role.position for role in guild.get_roles().values()}
+        self._ranks: t.Dict[hikari.Snowflake, int] = {}
+        self._top_ranks: t.Dict[hikari.Snowflake, int] = {}
+        self._rank_roles()
+
+    @property
+    def guild_id(self) -> hikari.Snowflake:
+        """The ID of the guild this hierarchy indexes."""
+        return self._guild_id
+
+    def get_rank(self, role_id: hikari.Snowflakeish) -> t.Optional[int]:
+        """Get the rank of a role. Higher ranks are higher in the hierarchy.
+
+        Parameters
+        ----------
+        role_id : hikari.Snowflakeish
+            The ID of the role to get the rank of.
+
+        Returns
+        -------
+        Optional[int]
+            The rank of the role, or None if the role is not in the guild.
+        """
+        return self._ranks.get(hikari.Snowflake(role_id))
+
+    def get_top_rank(self, member: hikari.Member) -> int:
+        """Get the rank of the top role of a member.
+
+        Parameters
+        ----------
+        member : hikari.Member
+            The member to get the top rank of.
+
+        Returns
+        -------
+        int
+            The rank of the top role of the member.
+
+        Raises
+        ------
+        CacheFailureError
+            None of the roles of the member are in the guild.
+        """
+        if (top_rank := self._top_ranks.get(member.id)) is not None:
+            return top_rank
+
+        positions = self._positions
+        top_role_id, top_position = None, None
+        for role_id in member.role_ids:
+            if (position := positions.get(role_id)) is not None and (top_position is None or position > top_position):
+                top_role_id, top_position = role_id, position
+
+        if top_role_id is None:
+            raise CacheFailureError("Some objects could not be resolved from cache.")
+
+        self._top_ranks[member.id] = top_rank = self._ranks[top_role_id]
+        return top_rank
+
+    def is_above(self, member1: hikari.Member, member2: hikari.Member) -> bool:
+        """
+        Returns True if member1's top role's position is higher than member2's.
+
+        Parameters
+        ----------
+        member1 : hikari.Member
+            The first member to compare.
+        member2 : hikari.Member
+            The second member to compare.
+
+        Returns
+        -------
+        bool
+            Whether member1's top role's position is higher than member2's.
+
+        Raises
+        ------
+        CacheFailureError
+            None of the roles of one of the members are in the guild.
+        """
+        return self.get_top_rank(member1) > self.get_top_rank(member2)
+
+    def can_moderate(
+        self,
+        moderator: hikari.Member,
+        member: hikari.Member,
+        permissions: hikari.Permissions = hikari.Permissions.NONE,
+        *,
+        resolver: t.Optional[PermissionResolver] = None,
+    ) -> bool:
+        """
+        Returns True if "moderator" can execute moderation actions on "member", also checks if "moderator" has "permissions".
+
+        Parameters
+        ----------
+        moderator : hikari.Member
+            The moderator to check.
+        member : hikari.Member
+            The member to check.
+        permissions : hikari.Permissions
+            The permissions `moderator` should have.
+        resolver : PermissionResolver, optional
+            The resolver to calculate the permissions of `moderator` with, by default `calculate_permissions` is used.
+
+        Returns
+        -------
+        bool
+            Whether "moderator" can execute moderation actions on "member".
+
+        Raises
+        ------
+        CacheFailureError
+            Some objects could not be resolved from cache to perform the operation.
+        """
+        return _check_moderation(
+            self.is_above(moderator, member),
+            member.id == self._owner_id,
+            permissions,
+            lambda: resolver.calculate_permissions(moderator) if resolver else calculate_permissions(moderator),
+        )
+
+    def update_guild(self, guild: hikari.Guild) -> None:
+        """Update the guild owner after a guild update.
+
+        Parameters
+        ----------
+        guild : hikari.Guild
+            The updated guild.
+        """
+        self._owner_id = guild.owner_id
+
+    def update_role(self, role: hikari.Role) -> None:
+        """Update the index after a role was created or updated.
+        The index is only rebuilt if the position of the role changed.
+
+        Parameters
+        ----------
+        role : hikari.Role
+            The created or updated role.
+        """
+        if self._positions.get(role.id) != role.position:
+            self._positions[role.id] = role.position
+            self._rank_roles()
+
+    def remove_role(self, role_id: hikari.Snowflakeish) -> None:
+        """Update the index after a role was deleted.
+
+        Parameters
+        ----------
+        role_id : hikari.Snowflakeish
+            The ID of the deleted role.
+        """
+        if self._positions.pop(hikari.Snowflake(role_id), None) is not None:
+            self._rank_roles()
+
+    def update_member(self, member: hikari.Member) -> None:
+        """Forget the cached top rank of a member after it was updated.
+
+        Parameters
+        ----------
+        member : hikari.Member
+            The updated member.
+        """
+        self._top_ranks.pop(member.id, None)
+
+    def remove_member(self, user_id: hikari.Snowflakeish) -> None:
+        """Forget the cached top rank of a member after it left the guild.
+
+        Parameters
+        ----------
+        user_id : hikari.Snowflakeish
+            The ID of the member that left.
+        """
+        self._top_ranks.pop(hikari.Snowflake(user_id), None)
+
+    def _listeners(self) -> t.Sequence[ListenerT]:
+        return (
+            (hikari.RoleCreateEvent, self._on_role_event),
+            (hikari.RoleUpdateEvent, self._on_role_event),
+            (hikari.RoleDeleteEvent, self._on_role_delete),
+            (hikari.MemberUpdateEvent, self._on_member_update),
+            (hikari.MemberDeleteEvent, self._on_member_delete),
+            (hikari.GuildUpdateEvent, self._on_guild_update),
+        )
+
+    async def _on_role_event(self, event: t.Union[hikari.RoleCreateEvent, hikari.RoleUpdateEvent]) -> None:
+        if event.guild_id == self._guild_id:
+            self.update_role(event.role)
+
+    async def _on_role_delete(self, event: hikari.RoleDeleteEvent) -> None:
+        if event.guild_id == self._guild_id:
+            self.remove_role(event.role_id)
+
+    async def _on_member_update(self, event: hikari.MemberUpdateEvent) -> None:
+        if event.guild_id == self._guild_id:
+            self.update_member(event.member)
+
+    async def _on_member_delete(self, event: hikari.MemberDeleteEvent) -> None:
+        if event.guild_id == self._guild_id:
+            self.remove_member(event.user_id)
+
+    async def _on_guild_update(self, event: hikari.GuildUpdateEvent) -> None:
+        if event.guild_id == self._guild_id:
+            self.update_guild(event.guild)
+
+    def _rank_roles(self) -> None:
+        # Lower IDs are higher in the hierarchy when positions are equal
+        ordered = sorted(self._positions, key=lambda role_id: (self._positions[role_id], -role_id))
+        self._ranks = {role_id: rank for rank, role_id in enumerate(ordered)}
+        self._top_ranks.clear()
+
+
+class MemberColorResolver(EventListener):
+    """Resolves the colors of members in a single guild without sorting their roles.
+
+    Only colored roles are kept, each with its position.
+    The color of a set of roles is found in a single pass over the set,
+    and memoized per set of roles, so members sharing the same roles are only resolved once.
+    Like `get_member_color`, out of differently colored roles sharing the top position,
+    the one listed first in the member's roles is picked, so such sets depend on order and are not memoized.
+
+    The results are identical to `get_member_color`, as long as the roles are kept up to date.
+    This can be done by calling `subscribe` with the bot, which listens to role updates,
+    or by calling `update_role` and `remove_role` manually.
+
+    Parameters
+    ----------
+    guild : hikari.Guild
+        The guild to resolve colors in. Its roles are resolved from cache.
+    max_cache_size : int
+        The maximum amount of role sets to memoize, by default 4096. The oldest entries are evicted first.
+
+    Raises
+    ------
+    ValueError
+        If `max_cache_size` is less than 1.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        colors = toolbox.MemberColorResolver(guild)
+        colors.subscribe(bot)
+
+        embed = hikari.Embed(title="Leaderboard", color=colors.get_color(member))
+    """
+
+    __slots__ = ("_guild_id", "_colored_roles", "_cache", "_max_cache_size")
+
+    def __init__(self, guild: hikari.Guild, *, max_cache_size: int = 4096) -> None:
+        if max_cache_size < 1:
+            raise ValueError("max_cache_size must be at least 1.")
+
+        self._guild_id = guild.id
+        # Maps colored role IDs to their position and color
+        self._colored_roles: t.Dict[int, t.Tuple[int, hikari.Color]] = {
+            role.id: (role.position, role.color) for role in guild.get_roles().values() if role.color
+        }
+        self._cache: t.Dict[t.FrozenSet[int], hikari.Color] = {}
+        self._max_cache_size = max_cache_size
+
+    @property
+    def guild_id(self) -> hikari.Snowflake:
+        """The ID of the guild this resolver resolves colors in."""
+        return self._guild_id
+
+    def get_color(self, member: hikari.Member) -> hikari.Color:
+        """Retrieves the color of a member based on the top colored role.
+
+        Parameters
+        ----------
+        member : hikari.Member
+            The member to get the color of.
+
+        Returns
+        -------
+        hikari.Color
+            The retrieved color object. If no color is found, it will return RGB(0, 0, 0).
+        """
+        return self.get_color_for(member.role_ids)
+
+    def get_color_for(self, role_ids: t.Iterable[hikari.Snowflakeish]) -> hikari.Color:
+        """Retrieves the color of the top colored role out of a set of roles.
+
+        Parameters
+        ----------
+        role_ids : Iterable[hikari.Snowflakeish]
+            The IDs of the roles, in the order of the member's roles.
+
+        Returns
+        -------
+        hikari.Color
+            The retrieved color object. If no color is found, it will return RGB(0, 0, 0).
+        """
+        role_ids = tuple(role_ids)
+        key = frozenset(role_ids)
+        if (color := self._cache.get(key)) is not None:
+            return color
+
+        top_position, color, tied = None, hikari.Color(0), False
+        colored_roles = self._colored_roles
+        for role_id in role_ids:
+            if not (colored_role := colored_roles.get(role_id)):
+                continue
+
+            if top_position is None or colored_role[0] > top_position:
+                (top_position, color), tied = colored_role, False
+            elif colored_role[0] == top_position and colored_role[1] != color:
+                tied = True
+
+        if tied:
+            return color
+
+        return put_bounded(self._cache, key, color, self._max_cache_size)
+
+    def update_role(self, role: hikari.Role) -> None:
+        """Update the resolver after a role was created or updated.
+        Only memoized colors of role sets including this role are invalidated.
+
+        Parameters
+        ----------
+        role : hikari.Role
+            The created or updated role.
+        """
+        colored_role = (role.position, role.color) if role.color else None
+        if self._colored_roles.get(role.id) == colored_role:
+            return
+
+        if colored_role:
+            self._colored_roles[role.id] = colored_role
+        else:
+            self._colored_roles.pop(role.id, None)
+
+        self._invalidate_role(role.id)
+
+    def remove_role(self, role_id: hikari.Snowflakeish) -> None:
+        """Update the resolver after a role was deleted.
+        Only memoized colors of role sets including this role are invalidated.
+
+        Parameters
+        ----------
+        role_id : hikari.Snowflakeish
+            The ID of the deleted role.
+        """
+        if self._colored_roles.pop(hikari.Snowflake(role_id), None) is not None:
+            self._invalidate_role(hikari.Snowflake(role_id))
+
+    def clear_cache(self) -> None:
+        """Clear all memoized colors, keeping the colored roles."""
+        self._cache.clear()
+
+    def _listeners(self) -> t.Sequence[ListenerT]:
+        return (
+            (hikari.RoleCreateEvent, self._on_role_event),
+            (hikari.RoleUpdateEvent, self._on_role_event),
+            (hikari.RoleDeleteEvent, self._on_role_delete),
+        )
+
+    async def _on_role_event(self, event: t.Union[hikari.RoleCreateEvent, hikari.RoleUpdateEvent]) -> None:
+        if event.guild_id == self._guild_id:
+            self.update_role(event.role)
+
+    async def _on_role_delete(self, event: hikari.RoleDeleteEvent) -> None:
+        if event.guild_id == self._guild_id:
+            self.remove_role(event.role_id)
+
+    def _invalidate_role(self, role_id: int) -> None:
+        for key in [role_ids for role_ids in self._cache if role_id in role_ids]:
+            del self._cache[key]
+
+
 # MIT License
 #
 # Copyright (c) 2022-present HyperGH
@@ -1,18 +1,230 @@
-import re
+import asyncio
+import collections
+import functools
+import time
 import typing as t
 
 import hikari
 
 from .errors import EmbedValidationError
+from .internal import EventListener
+from .internal import ListenerT
+from .internal import lazy_getattr
+from .internal import lazy_regex
 
-__all__: t.Sequence[str] = ("fetch_message_from_link", "validate_embed")
+__all__: t.Sequence[str] = (
+    "fetch_message_from_link",
+    "fetch_messages_from_links",
+    "find_message_links",
+    "MessageCache",
+    "MessageLink",
+    "EmbedViolation",
+    "find_embed_violations",
+    "validate_embed",
+    "validate_embeds",
+    "paginate_embed",
+    "batch_embeds",
+)
 
-MESSAGE_LINK_REGEX = re.compile(
-    r"https?:\/\/(www\.)?[-a-zA-Z0-9@:%._\+~#=]{1,256}\.[a-zA-Z0-9()]{1,6}\b([-a-zA-Z0-9()!@:%_\+.~#?&\/\/=]*)channels[\/][0-9]{1,}[\/][0-9]{1,}[\/][0-9]{1,}"
+# Compiled when first used rather than on import, MESSAGE_LINK_REGEX is provided by __getattr__
+_message_link_regex = lazy_regex(
+    r"https?://(?:(?:www|ptb|canary)\.)?discord(?:app)?\.com/channels/"
+    r"(?P<guild_id>[0-9]+|@me)/(?P<channel_id>[0-9]+)/(?P<message_id>[0-9]+)"
 )
 
+if t.TYPE_CHECKING:
+    MESSAGE_LINK_REGEX: t.Pattern[str]
+else:
+    __getattr__ = lazy_getattr(__name__, {"MESSAGE_LINK_REGEX": _message_link_regex})
+
+_TITLE_LIMIT = 256
+_DESCRIPTION_LIMIT = 4096
+_FIELD_COUNT_LIMIT = 25
+_FIELD_NAME_LIMIT = 256
+_FIELD_VALUE_LIMIT = 1024
+_FOOTER_LIMIT = 2048
+_AUTHOR_LIMIT = 256
+_TOTAL_LIMIT = 6000  # Shared by all embeds in a message
+_EMBED_COUNT_LIMIT = 10
+
+EmbedFieldT = t.Union[t.Tuple[str, str], t.Tuple[str, str, bool]]
+"""An embed field as a (name, value) or (name, value, inline) tuple."""
+
+
+class MessageLink(t.NamedTuple):
+    """A message link found in a string."""
+
+    guild_id: t.Optional[hikari.Snowflake]
+    """The ID of the guild the message is in, None for messages in DMs."""
+    channel_id: hikari.Snowflake
+    """The ID of the channel the message is in."""
+    message_id: hikari.Snowflake
+    """The ID of the message."""
+    span: t.Tuple[int, int]
+    """The start and end index of the link in the string."""
+
+
+class MessageCache(EventListener):
+    """A least recently used cache of fetched messages, with entries expiring after a time to live.
+
+    Messages are keyed by the IDs of their channel and the message itself. Concurrent requests for a message
+    that is not cached yet share a single REST call instead of each fetching it.
+    Failed fetches are not cached.
+
+    To make sure edited or deleted messages are not served from the cache, call `subscribe` with the bot,
+    which listens to message update and delete events, or call `invalidate` manually.
+
+    Parameters
+    ----------
+    max_size : int
+        The maximum amount of messages to cache, by default 1024. The least recently used message is evicted first.
+    ttl : float
+        The amount of seconds a message is cached for, by default 300.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        message_cache = toolbox.MessageCache(ttl=600)
+        message_cache.subscribe(bot)
+
+        message = await toolbox.fetch_message_from_link(link, bot=bot, cache=message_cache)
+    """
+
+    __slots__ = ("_entries", "_pending", "_max_size", "_ttl", "_hits", "_misses", "_coalesced")
+
+    def __init__(self, *, max_size: int = 1024, ttl: float = 300) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1.")
+        if ttl <= 0:
+            raise ValueError("ttl must be greater than 0.")
+
+        # Maps (channel_id, message_id) to (expiry, message), ordered from least to most recently used
+        self._entries: t.OrderedDict[t.Tuple[int, int], t.Tuple[float, hikari.Message]] = collections.OrderedDict()
+        self._pending: t.Dict[t.Tuple[int, int], asyncio.Future[hikari.Message]] = {}
+        self._max_size = max_size
+        self._ttl = ttl
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hits(self) -> int:
+        """The amount of requests answered from the cache."""
+        return self._hits
 
-async def fetch_message_from_link(message_link: str, *, bot: hikari.RESTAware) -> hikari.Message:
+    @property
+    def misses(self) -> int:
+        """The amount of requests that resulted in a REST call."""
+        return self._misses
+
+    @property
+    def coalesced(self) -> int:
+        """The amount of requests that waited on the REST call of an earlier request for the same message."""
+        return self._coalesced
+
+    async def fetch_message(
+        self,
+        channel: hikari.SnowflakeishOr[hikari.TextableChannel],
+        message: hikari.SnowflakeishOr[hikari.PartialMessage],
+        *,
+        bot: hikari.RESTAware,
+    ) -> hikari.Message:
+        """Get a message from the cache, fetching it if it is not cached or expired.
+
+        Parameters
+        ----------
+        channel : hikari.SnowflakeishOr[hikari.TextableChannel]
+            The channel the message is in.
+        message : hikari.SnowflakeishOr[hikari.PartialMessage]
+            The message to get.
+        bot : RESTAware
+            The bot object to execute REST calls with.
+
+        Returns
+        -------
+        hikari.Message
+            The message object.
+        """
+        key = (int(channel), int(message))
+
+        if (entry := self._entries.get(key)) is not None:
+            expires_at, cached = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return cached
+
+            del self._entries[key]
+
+        if (future := self._pending.get(key)) is None:
+            self._misses += 1
+            future = asyncio.ensure_future(bot.rest.fetch_message(*key))
+            future.add_done_callback(functools.partial(self._on_fetched, key))
+            self._pending[key] = future
+        else:
+            self._coalesced += 1
+
+        # Shielded so a cancelled request does not cancel the fetch for everyone else waiting on it
+        return await asyncio.shield(future)
+
+    def invalidate(
+        self,
+        channel: hikari.SnowflakeishOr[hikari.TextableChannel],
+        message: hikari.SnowflakeishOr[hikari.PartialMessage],
+    ) -> None:
+        """Remove a message from the cache. A fetch of it that is in progress will not be cached.
+
+        Parameters
+        ----------
+        channel : hikari.SnowflakeishOr[hikari.TextableChannel]
+            The channel the message is in.
+        message : hikari.SnowflakeishOr[hikari.PartialMessage]
+            The message to remove.
+        """
+        key = (int(channel), int(message))
+        self._entries.pop(key, None)
+        self._pending.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all messages from the cache, keeping the counters."""
+        self._entries.clear()
+        self._pending.clear()
+
+    def _listeners(self) -> t.Sequence[ListenerT]:
+        return (
+            (hikari.MessageUpdateEvent, self._on_message_event),
+            (hikari.MessageDeleteEvent, self._on_message_event),
+            (hikari.GuildBulkMessageDeleteEvent, self._on_bulk_delete),
+        )
+
+    async def _on_message_event(self, event: t.Union[hikari.MessageUpdateEvent, hikari.MessageDeleteEvent]) -> None:
+        self.invalidate(event.channel_id, event.message_id)
+
+    async def _on_bulk_delete(self, event: hikari.GuildBulkMessageDeleteEvent) -> None:
+        for message_id in event.message_ids:
+            self.invalidate(event.channel_id, message_id)
+
+    def _on_fetched(self, key: t.Tuple[int, int], future: asyncio.Future[hikari.Message]) -> None:
+        if self._pending.get(key) is not future:  # Invalidated while being fetched
+            return
+
+        del self._pending[key]
+        if future.cancelled() or future.exception() is not None:
+            return
+
+        self._entries[key] = (time.monotonic() + self._ttl, future.result())
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+
+async def fetch_message_from_link(
+    message_link: str, *, bot: hikari.RESTAware, cache: t.Optional[MessageCache] = None
+) -> hikari.Message:
     """Parse a message_link string into a message object.
 
     Parameters
@@ -21,6 +233,8 @@ async def fetch_message_from_link(message_link: str, *, bot: hikari.RESTAware) -
         The message link.
     bot : RESTAware
         The bot object to execute REST calls with.
+    cache : MessageCache, optional
+        The cache to get the message from, fetching it only if it is not cached, by default None.
 
     Returns
     -------
@@ -33,14 +247,191 @@ async def fetch_message_from_link(message_link: str, *, bot: hikari.RESTAware) -
         If the message link is invalid.
     """
 
-    if not MESSAGE_LINK_REGEX.fullmatch(message_link):
+    channel_id, message_id = _parse_message_link(message_link)
+
+    if cache is not None:
+        return await cache.fetch_message(channel_id, message_id, bot=bot)
+
+    return await bot.rest.fetch_message(channel_id, message_id)
+
+
+async def fetch_messages_from_links(
+    message_links: t.Iterable[str],
+    *,
+    bot: hikari.RESTAware,
+    concurrency: int = 5,
+    cache: t.Optional[MessageCache] = None,
+) -> t.Sequence[t.Union[hikari.Message, Exception]]:
+    """Parse many message_link strings into message objects.
+
+    Links pointing to the same message are only fetched once, messages found in the cache of the bot
+    are not fetched at all, and the remaining messages are fetched concurrently.
+
+    Parameters
+    ----------
+    message_links : Iterable[str]
+        The message links.
+    bot : RESTAware
+        The bot object to execute REST calls with. If it is also `CacheAware`, its message cache is checked first.
+    concurrency : int
+        The maximum amount of messages fetched at the same time, by default 5.
+    cache : MessageCache, optional
+        The cache to get messages from, fetching them only if they are not cached, by default None.
+
+    Returns
+    -------
+    Sequence[Union[hikari.Message, Exception]]
+        The message objects, in the same order as `message_links`.
+        If a link is invalid or its message could not be fetched, the exception is returned in its place
+        instead of being raised: a `ValueError` for invalid links, or the error raised by the REST call.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1.")
+
+    parsed: t.List[t.Union[t.Tuple[int, int], ValueError]] = []
+    for message_link in message_links:
+        try:
+            parsed.append(_parse_message_link(message_link))
+        except ValueError as e:
+            parsed.append(e)
+
+    results: t.Dict[t.Tuple[int, int], t.Union[hikari.Message, Exception]] = {}
+    to_fetch: t.Dict[t.Tuple[int, int], None] = {}  # Ordered set of unique messages
+
+    for ids in parsed:
+        if not isinstance(ids, tuple) or ids in results or ids in to_fetch:
+            continue
+
+        if isinstance(bot, hikari.CacheAware) and (message := bot.cache.get_message(ids[1])):
+            results[ids] = message
+        else:
+            to_fetch[ids] = None
+
+    semaphore = asyncio.Semaphore(concurrency)
+    fetch_message = functools.partial(cache.fetch_message, bot=bot) if cache is not None else bot.rest.fetch_message
+
+    async def fetch(channel_id: int, message_id: int) -> None:
+        async with semaphore:
+            try:
+                results[channel_id, message_id] = await fetch_message(channel_id, message_id)
+            except Exception as e:
+                results[channel_id, message_id] = e
+
+    await asyncio.gather(*(fetch(*ids) for ids in to_fetch))
+
+    return [results[ids] if isinstance(ids, tuple) else ids for ids in parsed]
+
+
+def find_message_links(content: str) -> t.Iterator[MessageLink]:
+    """Find all Discord message links in a string, such as the content of a message.
+
+    Parameters
+    ----------
+    content : str
+        The string to search.
+
+    Returns
+    -------
+    Iterator[MessageLink]
+        The message links found, in the order they appear in.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        for link in toolbox.find_message_links(message.content):
+            quoted = await bot.rest.fetch_message(link.channel_id, link.message_id)
+    """
+    if "/channels/" not in content:
+        return
+
+    for match in _message_link_regex().finditer(content):
+        yield _to_message_link(match)
+
+
+def _to_message_link(match: t.Match[str]) -> MessageLink:
+    guild_id, channel_id, message_id = match.group("guild_id", "channel_id", "message_id")
+    return MessageLink(
+        hikari.Snowflake(guild_id) if guild_id != "@me" else None,
+        hikari.Snowflake(channel_id),
+        hikari.Snowflake(message_id),
+        match.span(),
+    )
+
+
+def _parse_message_link(message_link: str) -> t.Tuple[int, int]:
+    """Parse a message_link string into the IDs of the channel and the message.
+
+    Parameters
+    ----------
+    message_link : str
+        The message link.
+
+    Returns
+    -------
+    Tuple[int, int]
+        The channel ID and the message ID.
+
+    Raises
+    ------
+    ValueError
+        If the message link is invalid.
+    """
+    if not (match := _message_link_regex().fullmatch(message_link)):
         raise ValueError(
-            "Invalid message link provided, should match the following regex: " + MESSAGE_LINK_REGEX.pattern
+            "Invalid message link provided, should match the following regex: " + _message_link_regex().pattern
         )
 
-    _, channel_id, message_id = message_link.split("/channels/")[1].split("/")
+    return int(match.group("channel_id")), int(match.group("message_id"))
+
+
+class EmbedViolation(t.NamedTuple):
+    """A limit exceeded by an embed, or by all embeds of a message combined."""
+
+    embed_index: t.Optional[int]
+    """The index of the embed in the message, None if the limit applies to the message as a whole."""
+    location: str
+    """What exceeded the limit, such as ``title``, ``fields[2].value`` or ``total``."""
+    length: int
+    """The length or amount found."""
+    limit: int
+    """The maximum length or amount allowed."""
+
+    def __str__(self) -> str:
+        subject = f"Embed {self.embed_index}" if self.embed_index is not None else "Message"
+
+        if self.location in ("fields", "embeds"):
+            return f"{subject} must have at most {self.limit} {self.location}, got {self.length}."
+
+        return f"{subject} {self.location} must be at most {self.limit} characters, got {self.length}."
+
+
+def find_embed_violations(embeds: t.Sequence[hikari.Embed]) -> t.List[EmbedViolation]:
+    """Find all limits exceeded by the embeds of a single message.
+
+    Each embed is measured in a single pass, and the combined length of all embeds is checked
+    against the limit shared by all embeds in a message.
+
+    Parameters
+    ----------
+    embeds : Sequence[hikari.Embed]
+        The embeds to check.
+
+    Returns
+    -------
+    List[EmbedViolation]
+        The exceeded limits, in the order they were found. Empty if the embeds are valid.
+    """
+    violations: t.List[EmbedViolation] = []
+    total = sum(_measure_embed(embed, index, violations) for index, embed in enumerate(embeds))
+
+    if len(embeds) > 1 and total > _TOTAL_LIMIT:
+        violations.append(EmbedViolation(None, "total", total, _TOTAL_LIMIT))
 
-    return await bot.rest.fetch_message(int(channel_id), int(message_id))
+    if len(embeds) > _EMBED_COUNT_LIMIT:
+        violations.append(EmbedViolation(None, "embeds", len(embeds), _EMBED_COUNT_LIMIT))
+
+    return violations
 
 
 def validate_embed(embed: hikari.Embed) -> hikari.Embed:
@@ -54,43 +445,230 @@ def validate_embed(embed: hikari.Embed) -> hikari.Embed:
     Raises
     ------
     EmbedValidationError
-        Raised when the embed is invalid.
+        Raised when the embed is invalid. All exceeded limits are available as `violations`.
 
     Returns
     -------
     hikari.Embed
         The embed that was validated.
     """
-    if (length := embed.total_length()) > 6000:
-        raise EmbedValidationError(f"Embed total length must be less than 6000 characters, got {length}.")
+    violations: t.List[EmbedViolation] = []
+    _measure_embed(embed, 0, violations)
 
-    if embed.title and (length := len(embed.title)) > 256:
-        raise EmbedValidationError(f"Embed title must be less than 256 characters, got {length}.")
+    if violations:
+        raise EmbedValidationError(" ".join(map(str, violations)), violations)
 
-    if embed.description and (length := len(embed.description)) > 4096:
-        raise EmbedValidationError(f"Embed description must be less than 4096 characters, got {length}.")
+    return embed
 
-    if embed.footer and embed.footer.text and (length := len(embed.footer.text)) > 2048:
-        raise EmbedValidationError(f"Embed footer text must be less than 2048 characters, got {length}.")
 
-    if embed.author and embed.author.name and (length := len(embed.author.name)) > 256:
-        raise EmbedValidationError(f"Embed author name must be less than 256 characters, got {length}.")
+def validate_embeds(embeds: t.Sequence[hikari.Embed]) -> t.Sequence[hikari.Embed]:
+    """Validate the embeds of a single message, checking the length of all fields
+    and the combined length of all embeds.
 
-    if embed.fields:
-        if (field_count := len(embed.fields)) > 25:
-            raise EmbedValidationError(f"Embed must have less than 25 fields, got {field_count}.")
+    Parameters
+    ----------
+    embeds : Sequence[hikari.Embed]
+        The embeds to validate.
 
-        for i, field in enumerate(embed.fields):
-            if (length := len(field.name)) > 256:
-                raise EmbedValidationError(
-                    f"Embed field {i} ({field.name}): name must be less than 256 characters, got {length}."
-                )
-            if (length := len(field.value)) > 1024:
-                raise EmbedValidationError(
-                    f"Embed field {i} ({field.name}): value must be less than 1024 characters, got {length}."
-                )
+    Raises
+    ------
+    EmbedValidationError
+        Raised when any embed is invalid, or the embeds are too long combined.
+        All exceeded limits are available as `violations`.
 
-    return embed
+    Returns
+    -------
+    Sequence[hikari.Embed]
+        The embeds that were validated.
+    """
+    if violations := find_embed_violations(embeds):
+        raise EmbedValidationError(" ".join(map(str, violations)), violations)
+
+    return embeds
+
+
+def paginate_embed(
+    description: t.Iterable[str] = (),
+    fields: t.Iterable[EmbedFieldT] = (),
+    *,
+    title: t.Optional[str] = None,
+    color: t.Optional[hikari.Colorish] = None,
+) -> t.Iterator[hikari.Embed]:
+    """Lazily split text and fields into as many embeds as needed to stay within the embed limits.
+
+    The description is filled first, then the fields. Text is split on line boundaries,
+    lines longer than a limit are split at the limit. Field values that are too long are split
+    into multiple fields with the same name.
+
+    Parameters
+    ----------
+    description : Iterable[str]
+        The text of the description, such as a generator of lines. Chunks are joined with a newline.
+    fields : Iterable[EmbedFieldT]
+        The fields, as (name, value) or (name, value, inline) tuples. Names are truncated to the limit.
+    title : str, optional
+        The title of every page, by default None.
+    color : hikari.Colorish, optional
+        The color of every page, by default None.
+
+    Returns
+    -------
+    Iterator[hikari.Embed]
+        The pages, each a valid embed. An embed is only yielded once it is full or the input is exhausted.
+
+    Raises
+    ------
+    ValueError
+        If the title is too long.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        lines = (f"{member.mention}: {member.joined_at}" for member in members)
+
+        for embeds in toolbox.batch_embeds(toolbox.paginate_embed(lines, title="Members")):
+            await bot.rest.create_message(channel_id, embeds=embeds)
+    """
+    base_length = len(title) if title else 0
+    if base_length > _TITLE_LIMIT:
+        raise ValueError(f"title must be at most {_TITLE_LIMIT} characters, got {base_length}.")
+
+    embed = hikari.Embed(title=title, color=color)
+    length = base_length
+    lines: t.List[str] = []
+    description_length = 0
+
+    for line in _split_lines(description, _DESCRIPTION_LIMIT):
+        added = len(line) + 1 if lines else len(line)  # Account for the newline joining it to the previous line
+        if description_length + added > _DESCRIPTION_LIMIT:
+            embed.description = "\n".join(lines)
+            yield embed
+            embed, length, lines, description_length = hikari.Embed(title=title, color=color), base_length, [], 0
+            added = len(line)
+
+        lines.append(line)
+        description_length += added
+        length += added
+
+    if lines:
+        embed.description = "\n".join(lines)
+
+    field_count = 0
+    for name, value, *inline in fields:
+        name = name[:_FIELD_NAME_LIMIT]
+
+        for chunk in _join_lines(_split_lines((value,), _FIELD_VALUE_LIMIT), _FIELD_VALUE_LIMIT):
+            added = len(name) + len(chunk)
+            if field_count == _FIELD_COUNT_LIMIT or length + added > _TOTAL_LIMIT:
+                yield embed
+                embed, length, field_count = hikari.Embed(title=title, color=color), base_length, 0
+
+            embed.add_field(name, chunk, inline=bool(inline and inline[0]))
+            field_count += 1
+            length += added
+
+    if length > base_length:
+        yield embed
+
+
+def batch_embeds(embeds: t.Iterable[hikari.Embed]) -> t.Iterator[t.List[hikari.Embed]]:
+    """Lazily group embeds into batches that can be sent in a single message,
+    respecting the maximum amount of embeds and their combined length.
+
+    Parameters
+    ----------
+    embeds : Iterable[hikari.Embed]
+        The embeds to group, such as the pages returned by `paginate_embed`. Each embed must be valid on its own.
+
+    Returns
+    -------
+    Iterator[List[hikari.Embed]]
+        The batches of embeds, in order.
+    """
+    batch: t.List[hikari.Embed] = []
+    length = 0
+
+    for embed in embeds:
+        embed_length = embed.total_length()
+        if batch and (len(batch) == _EMBED_COUNT_LIMIT or length + embed_length > _TOTAL_LIMIT):
+            yield batch
+            batch, length = [], 0
+
+        batch.append(embed)
+        length += embed_length
+
+    if batch:
+        yield batch
+
+
+def _split_lines(texts: t.Iterable[str], limit: int) -> t.Iterator[str]:
+    """Split texts into lines, splitting lines longer than limit into multiple lines."""
+    for text in texts:
+        for line in text.split("\n"):
+            if len(line) <= limit:
+                yield line
+            else:
+                yield from (line[i : i + limit] for i in range(0, len(line), limit))
+
+
+def _join_lines(lines: t.Iterable[str], limit: int) -> t.Iterator[str]:
+    """Join lines with newlines into chunks of at most limit characters."""
+    chunk: t.List[str] = []
+    length = -1  # The first line is not preceded by a newline
+
+    for line in lines:
+        if chunk and length + len(line) + 1 > limit:
+            yield "\n".join(chunk)
+            chunk, length = [], -1
+
+        chunk.append(line)
+        length += len(line) + 1
+
+    if chunk:
+        yield "\n".join(chunk)
+
+
+def _measure_embed(embed: hikari.Embed, index: int, violations: t.List[EmbedViolation]) -> int:
+    """Add the limits exceeded by an embed to violations and return its total length."""
+    total = 0
+
+    if title := embed.title:
+        total += (length := len(title))
+        if length > _TITLE_LIMIT:
+            violations.append(EmbedViolation(index, "title", length, _TITLE_LIMIT))
+
+    if description := embed.description:
+        total += (length := len(description))
+        if length > _DESCRIPTION_LIMIT:
+            violations.append(EmbedViolation(index, "description", length, _DESCRIPTION_LIMIT))
+
+    if embed.footer and embed.footer.text:
+        total += (length := len(embed.footer.text))
+        if length > _FOOTER_LIMIT:
+            violations.append(EmbedViolation(index, "footer.text", length, _FOOTER_LIMIT))
+
+    if embed.author and embed.author.name:
+        total += (length := len(embed.author.name))
+        if length > _AUTHOR_LIMIT:
+            violations.append(EmbedViolation(index, "author.name", length, _AUTHOR_LIMIT))
+
+    if fields := embed.fields:
+        if len(fields) > _FIELD_COUNT_LIMIT:
+            violations.append(EmbedViolation(index, "fields", len(fields), _FIELD_COUNT_LIMIT))
+
+        for i, field in enumerate(fields):
+            name_length, value_length = len(field.name), len(field.value)
+            total += name_length + value_length
+            if name_length > _FIELD_NAME_LIMIT:
+                violations.append(EmbedViolation(index, f"fields[{i}].name", name_length, _FIELD_NAME_LIMIT))
+            if value_length > _FIELD_VALUE_LIMIT:
+                violations.append(EmbedViolation(index, f"fields[{i}].value", value_length, _FIELD_VALUE_LIMIT))
+
+    if total > _TOTAL_LIMIT:
+        violations.append(EmbedViolation(index, "total", total, _TOTAL_LIMIT))
+
+    return total
 
 
 # MIT License
@@ -0,0 +1,331 @@
+from __future__ import annotations
+
+import typing as t
+
+import hikari
+
+from .errors import CacheFailureError
+from .internal import EventListener
+from .internal import ListenerT
+from .internal import put_bounded
+
+__all__: t.Sequence[str] = ("PermissionResolver",)
+
+_ALL_PERMISSIONS = hikari.Permissions.all_permissions()
+_ADMINISTRATOR = int(hikari.Permissions.ADMINISTRATOR)
+
+# Overwrites of a channel, mapping the id of the target to an (allow, deny) pair of bitmasks
+_Overwrites = t.Dict[hikari.Snowflake, t.Tuple[int, int]]
+
+
+def _check_moderation(
+    is_above: bool,
+    is_owner: bool,
+    permissions: hikari.Permissions,
+    calculate_moderator_permissions: t.Callable[[], hikari.Permissions],
+) -> bool:
+    """The checks of `can_moderate`, once the hierarchy of the members is known.
+
+    Parameters
+    ----------
+    is_above : bool
+        Whether the moderator's top role is above the member's.
+    is_owner : bool
+        Whether the member is the owner of the guild.
+    permissions : hikari.Permissions
+        The permissions the moderator should have.
+    calculate_moderator_permissions : Callable[[], hikari.Permissions]
+        Calculates the permissions of the moderator, only called if `permissions` are required.
+
+    Returns
+    -------
+    bool
+        Whether the moderator can execute moderation actions on the member.
+    """
+    if not is_above or is_owner:
+        return False
+
+    if permissions is hikari.Permissions.NONE:
+        return True
+
+    mod_perms = calculate_moderator_permissions()
+
+    if mod_perms & hikari.Permissions.ADMINISTRATOR:
+        return True
+
+    return bool(mod_perms & permissions)
+
+
+class PermissionResolver(EventListener):
+    """Calculates the permissions of members in a single guild from a snapshot of its roles and channels.
+
+    Role permissions and channel overwrites are stored as integer bitmasks keyed by snowflake.
+    Calculated permissions are cached per set of roles, and per set of roles in a channel,
+    so members sharing the same roles are only calculated once.
+
+    The results are identical to `calculate_permissions`, as long as the snapshot is kept up to date.
+    This can be done by calling `subscribe` with the bot, which listens to role, channel and guild updates,
+    or by calling the `update_*` and `remove_*` methods manually.
+
+    Parameters
+    ----------
+    guild : hikari.Guild
+        The guild to calculate permissions in. Its roles are resolved from cache.
+    max_cache_size : int
+        The maximum amount of role sets to cache, per channel and for guild-wide permissions,
+        by default 4096. The oldest entries are evicted first.
+
+    Raises
+    ------
+    ValueError
+        If `max_cache_size` is less than 1.
+    CacheFailureError
+        The roles of the guild could not be resolved from cache.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        resolver = toolbox.PermissionResolver(guild)
+        resolver.subscribe(bot)
+
+        permissions = resolver.calculate_permissions(member, channel)
+    """
+
+    __slots__ = ("_guild_id", "_owner_id", "_roles", "_overwrites", "_role_cache", "_channel_cache", "_max_cache_size")
+
+    def __init__(self, guild: hikari.Guild, *, max_cache_size: int = 4096) -> None:
+        if max_cache_size < 1:
+            raise ValueError("max_cache_size must be at least 1.")
+
+        roles = guild.get_roles()
+        if guild.id not in roles:
+            raise CacheFailureError("Guild roles could not be resolved from cache.")
+
+        self._guild_id = guild.id
+        self._owner_id = guild.owner_id
+        self._roles: t.Dict[hikari.Snowflake, int] = {role.id: int(role.permissions) for role in roles.values()}
+        self._overwrites: t.Dict[hikari.Snowflake, _Overwrites] = {}
+        self._role_cache: t.Dict[t.FrozenSet[hikari.Snowflake], hikari.Permissions] = {}
+        self._channel_cache: t.Dict[hikari.Snowflake, t.Dict[t.FrozenSet[hikari.Snowflake], hikari.Permissions]] = {}
+        self._max_cache_size = max_cache_size
+
+    @property
+    def guild_id(self) -> hikari.Snowflake:
+        """The ID of the guild this resolver calculates permissions in."""
+        return self._guild_id
+
+    def calculate_permissions(
+        self, member: hikari.Member, channel: t.Optional[hikari.PermissibleGuildChannel] = None
+    ) -> hikari.Permissions:
+        """Calculate the permissions of a member.
+        If a channel is provided, channel overwrites will be taken into account.
+
+        Parameters
+        ----------
+        member : hikari.Member
+            The member to calculate the permissions of.
+        channel : hikari.PermissibleGuildChannel, optional
+            The channel for permission overwrite calculations, by default None.
+
+        Returns
+        -------
+        hikari.Permissions
+            The calculated permissions.
+        """
+        if member.id == self._owner_id:
+            return _ALL_PERMISSIONS
+
+        role_ids = frozenset(member.role_ids)
+        permissions = self._role_cache.get(role_ids)
+        if permissions is None:
+            permissions = put_bounded(
+                self._role_cache, role_ids, self._calculate_role_permissions(role_ids), self._max_cache_size
+            )
+
+        if not channel or permissions is _ALL_PERMISSIONS:  # Administrators bypass overwrites
+            return permissions
+
+        overwrites = self._overwrites.get(channel.id)
+        if overwrites is None:
+            overwrites = self._snapshot_channel(channel)
+
+        channel_cache = self._channel_cache.setdefault(channel.id, {})
+        channel_permissions = channel_cache.get(role_ids)
+        if channel_permissions is None:
+            channel_permissions = put_bounded(
+                channel_cache,
+                role_ids,
+                self._calculate_channel_permissions(role_ids, int(permissions), overwrites),
+                self._max_cache_size,
+            )
+
+        if overwrite_member := overwrites.get(member.id):
+            allow, deny = overwrite_member
+            return hikari.Permissions((int(channel_permissions) & ~deny) | allow)
+
+        return channel_permissions
+
+    def update_guild(self, guild: hikari.Guild) -> None:
+        """Update the guild owner after a guild update.
+
+        Parameters
+        ----------
+        guild : hikari.Guild
+            The updated guild.
+        """
+        self._owner_id = guild.owner_id
+
+    def update_role(self, role: hikari.Role) -> None:
+        """Update the snapshot after a role was created or updated.
+        Only cached permissions of role sets including this role are invalidated.
+
+        Parameters
+        ----------
+        role : hikari.Role
+            The created or updated role.
+        """
+        permissions = int(role.permissions)
+        if self._roles.get(role.id) != permissions:
+            self._roles[role.id] = permissions
+            self._invalidate_role(role.id)
+
+    def remove_role(self, role_id: hikari.Snowflakeish) -> None:
+        """Update the snapshot after a role was deleted.
+        Only cached permissions of role sets including this role are invalidated.
+
+        Parameters
+        ----------
+        role_id : hikari.Snowflakeish
+            The ID of the deleted role.
+        """
+        if self._roles.pop(hikari.Snowflake(role_id), None) is not None:
+            self._invalidate_role(hikari.Snowflake(role_id))
+
+    def update_channel(self, channel: hikari.PermissibleGuildChannel) -> None:
+        """Update the snapshot after a channel was updated.
+        Only cached permissions in this channel are invalidated.
+
+        Parameters
+        ----------
+        channel : hikari.PermissibleGuildChannel
+            The updated channel.
+        """
+        self._channel_cache.pop(channel.id, None)
+        self._snapshot_channel(channel)
+
+    def remove_channel(self, channel_id: hikari.Snowflakeish) -> None:
+        """Update the snapshot after a channel was deleted.
+
+        Parameters
+        ----------
+        channel_id : hikari.Snowflakeish
+            The ID of the deleted channel.
+        """
+        self._channel_cache.pop(hikari.Snowflake(channel_id), None)
+        self._overwrites.pop(hikari.Snowflake(channel_id), None)
+
+    def clear_cache(self) -> None:
+        """Clear all cached permissions, keeping the snapshot of roles and channels."""
+        self._role_cache.clear()
+        self._channel_cache.clear()
+
+    def _listeners(self) -> t.Sequence[ListenerT]:
+        return (
+            (hikari.RoleCreateEvent, self._on_role_event),
+            (hikari.RoleUpdateEvent, self._on_role_event),
+            (hikari.RoleDeleteEvent, self._on_role_delete),
+            (hikari.GuildChannelUpdateEvent, self._on_channel_update),
+            (hikari.GuildChannelDeleteEvent, self._on_channel_delete),
+            (hikari.GuildUpdateEvent, self._on_guild_update),
+        )
+
+    async def _on_role_event(self, event: t.Union[hikari.RoleCreateEvent, hikari.RoleUpdateEvent]) -> None:
+        if event.guild_id == self._guild_id:
+            self.update_role(event.role)
+
+    async def _on_role_delete(self, event: hikari.RoleDeleteEvent) -> None:
+        if event.guild_id == self._guild_id:
+            self.remove_role(event.role_id)
+
+    async def _on_channel_update(self, event: hikari.GuildChannelUpdateEvent) -> None:
+        if event.guild_id == self._guild_id and isinstance(event.channel, hikari.PermissibleGuildChannel):
+            self.update_channel(event.channel)
+
+    async def _on_channel_delete(self, event: hikari.GuildChannelDeleteEvent) -> None:
+        if event.guild_id == self._guild_id:
+            self.remove_channel(event.channel_id)
+
+    async def _on_guild_update(self, event: hikari.GuildUpdateEvent) -> None:
+        if event.guild_id == self._guild_id:
+            self.update_guild(event.guild)
+
+    def _calculate_role_permissions(self, role_ids: t.FrozenSet[hikari.Snowflake]) -> hikari.Permissions:
+        roles = self._roles
+        permissions = roles[self._guild_id]  # Start with @everyone perms
+
+        for role_id in role_ids:
+            permissions |= roles.get(role_id, 0)
+
+        if permissions & _ADMINISTRATOR:
+            return _ALL_PERMISSIONS
+
+        return hikari.Permissions(permissions)
+
+    def _calculate_channel_permissions(
+        self, role_ids: t.FrozenSet[hikari.Snowflake], permissions: int, overwrites: _Overwrites
+    ) -> hikari.Permissions:
+        if overwrite_everyone := overwrites.get(self._guild_id):
+            allow, deny = overwrite_everyone
+            permissions = (permissions & ~deny) | allow
+
+        allow = deny = 0
+        for role_id in role_ids:
+            if role_id in self._roles and (overwrite := overwrites.get(role_id)):
+                allow |= overwrite[0]
+                deny |= overwrite[1]
+
+        return hikari.Permissions((permissions & ~deny) | allow)
+
+    def _snapshot_channel(self, channel: hikari.PermissibleGuildChannel) -> _Overwrites:
+        overwrites = {
+            overwrite.id: (int(overwrite.allow), int(overwrite.deny))
+            for overwrite in channel.permission_overwrites.values()
+        }
+        self._overwrites[channel.id] = overwrites
+        return overwrites
+
+    def _invalidate_role(self, role_id: hikari.Snowflake) -> None:
+        if role_id == self._guild_id:  # Everyone has the @everyone role
+            self.clear_cache()
+            return
+
+        for key in [role_ids for role_ids in self._role_cache if role_id in role_ids]:
+            del self._role_cache[key]
+
+        for channel_cache in self._channel_cache.values():
+            for key in [role_ids for role_ids in channel_cache if role_id in role_ids]:
+                del channel_cache[key]
+
+
+# MIT License
+#
+# Copyright (c) 2022-present HyperGH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
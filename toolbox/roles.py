@@ -1,8 +1,14 @@
+from __future__ import annotations
+
+import bisect
 import typing as t
 
 import hikari
 
-__all__: t.Sequence[str] = ("sort_roles",)
+from .internal import EventListener
+from .internal import ListenerT
+
+__all__: t.Sequence[str] = ("sort_roles", "RoleOrder")
 
 
 def sort_roles(roles: t.Sequence[hikari.Role], ascending: bool = False) -> t.Sequence[hikari.Role]:
@@ -23,6 +29,223 @@ def sort_roles(roles: t.Sequence[hikari.Role], ascending: bool = False) -> t.Seq
     return sorted(roles, key=lambda r: r.position, reverse=not ascending)
 
 
+class _RoleView(t.Sequence[hikari.Role]):
+    """A read-only view over the roles of a `RoleOrder`, optionally reversed."""
+
+    __slots__ = ("_roles", "_reverse")
+
+    def __init__(self, roles: t.List[hikari.Role], reverse: bool) -> None:
+        self._roles = roles
+        self._reverse = reverse
+
+    @t.overload
+    def __getitem__(self, index: int) -> hikari.Role: ...
+
+    @t.overload
+    def __getitem__(self, index: slice) -> t.Sequence[hikari.Role]: ...
+
+    def __getitem__(self, index: t.Union[int, slice]) -> t.Union[hikari.Role, t.Sequence[hikari.Role]]:
+        if isinstance(index, slice):
+            if not self._reverse:
+                return self._roles[index]
+
+            roles = self._roles
+            return [roles[-i - 1] for i in range(len(roles))[index]]
+
+        return self._roles[-index - 1 if self._reverse else index]
+
+    def __len__(self) -> int:
+        return len(self._roles)
+
+    def __iter__(self) -> t.Iterator[hikari.Role]:
+        return reversed(self._roles) if self._reverse else iter(self._roles)
+
+    def __reversed__(self) -> t.Iterator[hikari.Role]:
+        return iter(self._roles) if self._reverse else reversed(self._roles)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+
+class RoleOrder(EventListener):
+    """The roles of a single guild, kept in position order as they are created, updated and deleted.
+
+    Roles with equal positions are ordered by ID, lower IDs being higher, like in `toolbox.is_above`.
+    Updates are applied with a binary search instead of sorting all roles again.
+
+    The order is kept up to date by calling `subscribe` with the bot, which listens to role updates,
+    or by calling `update_role` and `remove_role` manually.
+
+    Parameters
+    ----------
+    guild : hikari.Guild
+        The guild to order the roles of. Its roles are resolved from cache.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        order = toolbox.RoleOrder(guild)
+        order.subscribe(bot)
+
+        top_roles = order.descending()[:5]
+        member_roles = order.get_roles(member.role_ids)
+    """
+
+    __slots__ = ("_guild_id", "_keys", "_roles", "_entries")
+
+    def __init__(self, guild: hikari.Guild) -> None:
+        self._guild_id = guild.id
+        roles = sorted(guild.get_roles().values(), key=self._key)
+        # Parallel lists, sorted in ascending order
+        self._keys: t.List[t.Tuple[int, int]] = [self._key(role) for role in roles]
+        self._roles: t.List[hikari.Role] = roles
+        # Maps role IDs to their sort key and role
+        self._entries: t.Dict[int, t.Tuple[t.Tuple[int, int], hikari.Role]] = {
+            role.id: (key, role) for role, key in zip(roles, self._keys)
+        }
+
+    def __len__(self) -> int:
+        return len(self._roles)
+
+    def __contains__(self, role_id: object) -> bool:
+        return role_id in self._entries
+
+    @property
+    def guild_id(self) -> hikari.Snowflake:
+        """The ID of the guild the roles are in."""
+        return self._guild_id
+
+    def ascending(self) -> t.Sequence[hikari.Role]:
+        """A view of the roles from the lowest to the highest.
+        The view is not a copy and reflects later updates.
+
+        Returns
+        -------
+        Sequence[hikari.Role]
+            The roles, in ascending order.
+        """
+        return _RoleView(self._roles, reverse=False)
+
+    def descending(self) -> t.Sequence[hikari.Role]:
+        """A view of the roles from the highest to the lowest.
+        The view is not a copy and reflects later updates.
+
+        Returns
+        -------
+        Sequence[hikari.Role]
+            The roles, in descending order.
+        """
+        return _RoleView(self._roles, reverse=True)
+
+    def sort_roles(self, ascending: bool = False) -> t.Sequence[hikari.Role]:
+        """A view of all roles, like `sort_roles`. By default it is in a descending order.
+        Unlike `sort_roles`, which keeps roles with equal positions in the order they were passed in,
+        those are ordered by ID, lower IDs being higher.
+
+        Parameters
+        ----------
+        ascending : bool, optional
+            Whether to sort in ascending order, by default False.
+
+        Returns
+        -------
+        Sequence[hikari.Role]
+            The sorted roles.
+        """
+        return _RoleView(self._roles, reverse=not ascending)
+
+    def get_role(self, role_id: hikari.Snowflakeish) -> t.Optional[hikari.Role]:
+        """Get a role by ID.
+
+        Parameters
+        ----------
+        role_id : hikari.Snowflakeish
+            The ID of the role.
+
+        Returns
+        -------
+        Optional[hikari.Role]
+            The role, or None if it is not in the guild.
+        """
+        entry = self._entries.get(int(role_id))
+        return entry[1] if entry else None
+
+    def get_roles(self, role_ids: t.Iterable[hikari.Snowflakeish], ascending: bool = False) -> t.Sequence[hikari.Role]:
+        """Get a subset of the roles in order, such as the roles of a member.
+        Only the subset is sorted, IDs of roles not in the guild are ignored.
+        The IDs are expected to be unique, like `hikari.Member.role_ids`.
+
+        Parameters
+        ----------
+        role_ids : Iterable[hikari.Snowflakeish]
+            The IDs of the roles to get.
+        ascending : bool, optional
+            Whether to sort in ascending order, by default False.
+
+        Returns
+        -------
+        Sequence[hikari.Role]
+            The sorted roles.
+        """
+        entries = self._entries
+        # Sort keys are unique per role, so roles themselves are never compared
+        subset = sorted(
+            (entries[role_id] for role_id in map(int, role_ids) if role_id in entries), reverse=not ascending
+        )
+        return [role for _, role in subset]
+
+    def update_role(self, role: hikari.Role) -> None:
+        """Insert or move a role after it was created or updated.
+
+        Parameters
+        ----------
+        role : hikari.Role
+            The created or updated role.
+        """
+        key = self._key(role)
+        if (entry := self._entries.get(role.id)) is not None:
+            index = bisect.bisect_left(self._keys, entry[0])
+            del self._keys[index], self._roles[index]
+
+        index = bisect.bisect_left(self._keys, key)
+        self._keys.insert(index, key)
+        self._roles.insert(index, role)
+        self._entries[role.id] = (key, role)
+
+    def remove_role(self, role_id: hikari.Snowflakeish) -> None:
+        """Remove a role after it was deleted.
+
+        Parameters
+        ----------
+        role_id : hikari.Snowflakeish
+            The ID of the deleted role.
+        """
+        if (entry := self._entries.pop(int(role_id), None)) is not None:
+            index = bisect.bisect_left(self._keys, entry[0])
+            del self._keys[index], self._roles[index]
+
+    def _listeners(self) -> t.Sequence[ListenerT]:
+        return (
+            (hikari.RoleCreateEvent, self._on_role_event),
+            (hikari.RoleUpdateEvent, self._on_role_event),
+            (hikari.RoleDeleteEvent, self._on_role_delete),
+        )
+
+    async def _on_role_event(self, event: t.Union[hikari.RoleCreateEvent, hikari.RoleUpdateEvent]) -> None:
+        if event.guild_id == self._guild_id:
+            self.update_role(event.role)
+
+    async def _on_role_delete(self, event: hikari.RoleDeleteEvent) -> None:
+        if event.guild_id == self._guild_id:
+            self.remove_role(event.role_id)
+
+    @staticmethod
+    def _key(role: hikari.Role) -> t.Tuple[int, int]:
+        # Lower IDs are higher in the hierarchy when positions are equal
+        return (role.position, -role.id)
+
+
 # MIT License
 #
 # Copyright (c) 2022-present HyperGH
@@ -0,0 +1,389 @@
+from __future__ import annotations
+
+import array
+import bisect
+import sys
+import typing as t
+
+import hikari
+
+from .errors import CacheFailureError
+from .internal import EventListener
+from .internal import ListenerT
+from .permissions import _check_moderation
+
+__all__: t.Sequence[str] = ("GuildSnapshot",)
+
+_ALL_PERMISSIONS = hikari.Permissions.all_permissions()
+_ADMINISTRATOR = int(hikari.Permissions.ADMINISTRATOR)
+
+
+class GuildSnapshot(EventListener):
+    """A compact snapshot of the roles and channel overwrites of a single guild.
+
+    Roles are stored as parallel arrays of IDs, positions, colors and permissions, sorted by ID,
+    and the overwrites of each channel as a single array of (target ID, allow, deny) triples.
+    No `hikari.Role` or `hikari.GuildChannel` objects are kept alive,
+    so a snapshot takes a fraction of the memory of the cached objects it replaces.
+
+    The results are identical to `calculate_permissions`, `is_above`, `get_member_color` and `can_moderate`,
+    as long as the snapshot is kept up to date. Like `hikari.Member.get_top_role`, out of roles sharing a position,
+    the one listed first in the member's roles is picked.
+    The snapshot is kept up to date by calling `subscribe` with the bot, which listens to role, channel and
+    guild updates, or by calling the `update_*` and `remove_*` methods manually.
+
+    Parameters
+    ----------
+    guild : hikari.Guild
+        The guild to snapshot. Its roles, and its channels for gateway guilds, are resolved from cache.
+
+    Raises
+    ------
+    CacheFailureError
+        The roles of the guild could not be resolved from cache.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        snapshot = toolbox.GuildSnapshot(guild)
+        snapshot.subscribe(bot)
+
+        if snapshot.can_moderate(moderator, member, hikari.Permissions.BAN_MEMBERS):
+            ...
+    """
+
+    __slots__ = ("_guild_id", "_owner_id", "_role_ids", "_positions", "_colors", "_permissions", "_overwrites")
+
+    def __init__(self, guild: hikari.Guild) -> None:
+        roles = sorted(guild.get_roles().values(), key=lambda role: role.id)
+        if not any(role.id == guild.id for role in roles):
+            raise CacheFailureError("Guild roles could not be resolved from cache.")
+
+        self._guild_id = guild.id
+        self._owner_id = guild.owner_id
+        # Parallel arrays, sorted by role ID
+        self._role_ids = array.array("Q", [role.id for role in roles])
+        self._positions = array.array("i", [role.position for role in roles])
+        self._colors = array.array("I", [role.color for role in roles])
+        self._permissions = array.array("Q", [role.permissions for role in roles])
+        # Maps channel IDs to their overwrites, as flattened (target ID, allow, deny) triples
+        self._overwrites: t.Dict[int, array.array[int]] = {}
+
+        if isinstance(guild, hikari.GatewayGuild):
+            for channel in guild.get_channels().values():
+                self.update_channel(channel)
+
+    def __len__(self) -> int:
+        return len(self._role_ids)
+
+    def __sizeof__(self) -> int:
+        return (
+            super().__sizeof__()
+            + sum(sys.getsizeof(a) for a in (self._role_ids, self._positions, self._colors, self._permissions))
+            + sys.getsizeof(self._overwrites)
+            + sum(map(sys.getsizeof, self._overwrites.values()))
+        )
+
+    @property
+    def guild_id(self) -> hikari.Snowflake:
+        """The ID of the guild this is a snapshot of."""
+        return self._guild_id
+
+    def calculate_permissions(
+        self,
+        member: hikari.Member,
+        channel: t.Optional[hikari.SnowflakeishOr[hikari.PermissibleGuildChannel]] = None,
+    ) -> hikari.Permissions:
+        """Calculate the permissions of a member.
+        If a channel is provided, channel overwrites will be taken into account.
+
+        Parameters
+        ----------
+        member : hikari.Member
+            The member to calculate the permissions of.
+        channel : hikari.SnowflakeishOr[hikari.PermissibleGuildChannel], optional
+            The channel or ID of the channel for permission overwrite calculations, by default None.
+            Channels missing from the snapshot are added to it.
+
+        Returns
+        -------
+        hikari.Permissions
+            The calculated permissions.
+
+        Raises
+        ------
+        CacheFailureError
+            The ID of a channel missing from the snapshot was provided.
+        """
+        if member.id == self._owner_id:
+            return _ALL_PERMISSIONS
+
+        role_ids = set(member.role_ids)
+        role_permissions = self._permissions
+        everyone = self._index(self._guild_id)
+        permissions = role_permissions[everyone] if everyone is not None else 0  # Start with @everyone perms
+        for index in self._indexes(role_ids):
+            permissions |= role_permissions[index]
+
+        if permissions & _ADMINISTRATOR:
+            return _ALL_PERMISSIONS
+
+        if channel is None:  # End of role-based permissions
+            return hikari.Permissions(permissions)
+
+        if isinstance(channel, hikari.PermissibleGuildChannel):
+            overwrites = self._overwrites.get(channel.id)
+            if overwrites is None:
+                overwrites = self._snapshot_channel(channel)
+        elif (overwrites := self._overwrites.get(int(channel))) is None:
+            raise CacheFailureError("Channel could not be resolved from the snapshot.")
+
+        allow = deny = 0
+        member_overwrite: t.Optional[t.Tuple[int, int]] = None
+        for i in range(0, len(overwrites), 3):
+            target_id = overwrites[i]
+            if target_id == self._guild_id:
+                permissions = (permissions & ~overwrites[i + 2]) | overwrites[i + 1]
+            if target_id in role_ids:  # Like calculate_permissions, @everyone is also a role of the member
+                if self._index(target_id) is not None:
+                    allow |= overwrites[i + 1]
+                    deny |= overwrites[i + 2]
+            elif target_id == member.id:
+                member_overwrite = (overwrites[i + 1], overwrites[i + 2])
+
+        permissions = (permissions & ~deny) | allow
+        if member_overwrite:
+            permissions = (permissions & ~member_overwrite[1]) | member_overwrite[0]
+
+        return hikari.Permissions(permissions)
+
+    def is_above(self, member1: hikari.Member, member2: hikari.Member) -> bool:
+        """
+        Returns True if member1's top role's position is higher than member2's.
+
+        Parameters
+        ----------
+        member1 : hikari.Member
+            The first member to compare.
+        member2 : hikari.Member
+            The second member to compare.
+
+        Returns
+        -------
+        bool
+            Whether member1's top role's position is higher than member2's.
+
+        Raises
+        ------
+        CacheFailureError
+            None of the roles of one of the members are in the snapshot.
+        """
+        return self._top_key(member1.role_ids) > self._top_key(member2.role_ids)
+
+    def get_member_color(self, member: hikari.Member) -> hikari.Color:
+        """Retrieves the color of a member based on the top colored role.
+
+        Parameters
+        ----------
+        member : hikari.Member
+            The member to get the color of.
+
+        Returns
+        -------
+        hikari.Color
+            The retrieved color object. If no color is found, it will return RGB(0, 0, 0).
+        """
+        positions, colors = self._positions, self._colors
+        top_position, color = None, 0
+        for index in self._indexes(member.role_ids):
+            # Colors are ints, black is treated as no color
+            if colors[index] and (top_position is None or positions[index] > top_position):
+                top_position, color = positions[index], colors[index]
+
+        return hikari.Color(color)
+
+    def can_moderate(
+        self, moderator: hikari.Member, member: hikari.Member, permissions: hikari.Permissions = hikari.Permissions.NONE
+    ) -> bool:
+        """
+        Returns True if "moderator" can execute moderation actions on "member", also checks if "moderator" has "permissions".
+
+        Parameters
+        ----------
+        moderator : hikari.Member
+            The moderator to check.
+        member : hikari.Member
+            The member to check.
+        permissions : hikari.Permissions
+            The permissions `moderator` should have.
+
+        Returns
+        -------
+        bool
+            Whether "moderator" can execute moderation actions on "member".
+
+        Raises
+        ------
+        CacheFailureError
+            None of the roles of one of the members are in the snapshot.
+        """
+        return _check_moderation(
+            self.is_above(moderator, member),
+            member.id == self._owner_id,
+            permissions,
+            lambda: self.calculate_permissions(moderator),
+        )
+
+    def update_guild(self, guild: hikari.Guild) -> None:
+        """Update the guild owner after a guild update.
+
+        Parameters
+        ----------
+        guild : hikari.Guild
+            The updated guild.
+        """
+        self._owner_id = guild.owner_id
+
+    def update_role(self, role: hikari.Role) -> None:
+        """Update the snapshot after a role was created or updated.
+
+        Parameters
+        ----------
+        role : hikari.Role
+            The created or updated role.
+        """
+        index = bisect.bisect_left(self._role_ids, role.id)
+        if index == len(self._role_ids) or self._role_ids[index] != role.id:
+            self._role_ids.insert(index, role.id)
+            self._positions.insert(index, role.position)
+            self._colors.insert(index, role.color)
+            self._permissions.insert(index, role.permissions)
+            return
+
+        self._positions[index] = role.position
+        self._colors[index] = role.color
+        self._permissions[index] = role.permissions
+
+    def remove_role(self, role_id: hikari.Snowflakeish) -> None:
+        """Update the snapshot after a role was deleted.
+
+        Parameters
+        ----------
+        role_id : hikari.Snowflakeish
+            The ID of the deleted role.
+        """
+        if (index := self._index(int(role_id))) is not None:
+            for values in (self._role_ids, self._positions, self._colors, self._permissions):
+                del values[index]
+
+    def update_channel(self, channel: hikari.PermissibleGuildChannel) -> None:
+        """Update the snapshot after a channel was created or updated.
+
+        Parameters
+        ----------
+        channel : hikari.PermissibleGuildChannel
+            The created or updated channel.
+        """
+        self._snapshot_channel(channel)
+
+    def remove_channel(self, channel_id: hikari.Snowflakeish) -> None:
+        """Update the snapshot after a channel was deleted.
+
+        Parameters
+        ----------
+        channel_id : hikari.Snowflakeish
+            The ID of the deleted channel.
+        """
+        self._overwrites.pop(int(channel_id), None)
+
+    def _listeners(self) -> t.Sequence[ListenerT]:
+        return (
+            (hikari.RoleCreateEvent, self._on_role_event),
+            (hikari.RoleUpdateEvent, self._on_role_event),
+            (hikari.RoleDeleteEvent, self._on_role_delete),
+            (hikari.GuildChannelCreateEvent, self._on_channel_event),
+            (hikari.GuildChannelUpdateEvent, self._on_channel_event),
+            (hikari.GuildChannelDeleteEvent, self._on_channel_delete),
+            (hikari.GuildUpdateEvent, self._on_guild_update),
+        )
+
+    async def _on_role_event(self, event: t.Union[hikari.RoleCreateEvent, hikari.RoleUpdateEvent]) -> None:
+        if event.guild_id == self._guild_id:
+            self.update_role(event.role)
+
+    async def _on_role_delete(self, event: hikari.RoleDeleteEvent) -> None:
+        if event.guild_id == self._guild_id:
+            self.remove_role(event.role_id)
+
+    async def _on_channel_event(
+        self, event: t.Union[hikari.GuildChannelCreateEvent, hikari.GuildChannelUpdateEvent]
+    ) -> None:
+        if event.guild_id == self._guild_id and isinstance(event.channel, hikari.PermissibleGuildChannel):
+            self.update_channel(event.channel)
+
+    async def _on_channel_delete(self, event: hikari.GuildChannelDeleteEvent) -> None:
+        if event.guild_id == self._guild_id:
+            self.remove_channel(event.channel_id)
+
+    async def _on_guild_update(self, event: hikari.GuildUpdateEvent) -> None:
+        if event.guild_id == self._guild_id:
+            self.update_guild(event.guild)
+
+    def _index(self, role_id: int) -> t.Optional[int]:
+        index = bisect.bisect_left(self._role_ids, role_id)
+        if index < len(self._role_ids) and self._role_ids[index] == role_id:
+            return index
+
+        return None
+
+    def _indexes(self, role_ids: t.Iterable[int]) -> t.Iterator[int]:
+        """The indexes of the roles in the snapshot, skipping missing roles."""
+        for role_id in role_ids:
+            if (index := self._index(role_id)) is not None:
+                yield index
+
+    def _top_key(self, role_ids: t.Iterable[int]) -> t.Tuple[int, int]:
+        # Like Member.get_top_role, the first of the roles sharing the highest position is the top role,
+        # which is then compared by position and ID like in is_above
+        positions = self._positions
+        top_index = None
+        for index in self._indexes(role_ids):
+            if top_index is None or positions[index] > positions[top_index]:
+                top_index = index
+
+        if top_index is None:
+            raise CacheFailureError("Some objects could not be resolved from cache.")
+
+        return positions[top_index], -self._role_ids[top_index]
+
+    def _snapshot_channel(self, channel: hikari.PermissibleGuildChannel) -> array.array[int]:
+        overwrites = array.array("Q")
+        for overwrite in channel.permission_overwrites.values():
+            overwrites.extend((overwrite.id, overwrite.allow, overwrite.deny))
+
+        self._overwrites[channel.id] = overwrites
+        return overwrites
+
+
+# MIT License
+#
+# Copyright (c) 2022-present HyperGH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
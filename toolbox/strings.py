@@ -1,24 +1,84 @@
+from __future__ import annotations
+
+import collections
+import concurrent.futures
 import datetime
+import functools
+import itertools
+import os
 import re
+import sys
 import typing as t
 from enum import Enum
 from enum import IntFlag
 
+from .internal import lazy_getattr
+from .internal import lazy_regex
+from .internal import submit_batched
+
+if t.TYPE_CHECKING:
+    import hikari
+
+    from .messages import MessageLink
+
 __all__: t.Sequence[str] = (
     "format_dt",
+    "format_dt_many",
+    "format_snowflake",
+    "format_snowflakes",
+    "snowflake_to_timestamp",
     "TimestampStyle",
     "utcnow",
     "is_url",
     "is_invite",
+    "find_urls",
+    "find_invites",
+    "find_urls_async",
+    "find_invites_async",
+    "URLMatch",
+    "InviteMatch",
+    "MarkdownSpan",
+    "ContentMatch",
+    "ContentScanner",
     "remove_markdown",
+    "remove_markdown_many",
+    "remove_markdown_async",
+    "MarkdownStripper",
     "MarkdownFormat",
 )
 
 
-LINK_REGEX = re.compile(
+# Patterns are compiled when first used rather than on import, the public ones are provided by __getattr__
+_link_regex = lazy_regex(
     r"https?:\/\/(www\.)?[-a-zA-Z0-9@:%._\+~#=]{1,256}\.[a-zA-Z0-9()]{1,6}\b([-a-zA-Z0-9()!@:%_\+.~#?&\/\/=]*)"
 )
-INVITE_REGEX = re.compile(r"(?:https?://)?discord(?:app)?\.(?:com/invite|gg)/[a-zA-Z0-9]+/?")
+_invite_regex = lazy_regex(r"(?:https?://)?discord(?:app)?\.(?:com/invite|gg)/(?P<code>[a-zA-Z0-9-]+)/?")
+
+# Strings shorter than this are processed inline by the async functions, as sending them to an executor costs more
+_OFFLOAD_THRESHOLD = 1024
+
+_DISCORD_EPOCH_MS = 1420070400000  # The first second of 2015, in milliseconds since the Unix epoch
+
+TimeT = t.Union[datetime.datetime, int, "hikari.Unique"]
+"""A datetime, a POSIX timestamp in seconds, or a snowflake or object with an ID to use the creation time of."""
+
+
+class URLMatch(t.NamedTuple):
+    """An URL found in a string."""
+
+    url: str
+    """The URL."""
+    span: t.Tuple[int, int]
+    """The start and end index of the URL in the string."""
+
+
+class InviteMatch(t.NamedTuple):
+    """A Discord invite found in a string."""
+
+    code: str
+    """The invite code, such as ``Jx4cNGG``."""
+    span: t.Tuple[int, int]
+    """The start and end index of the invite in the string."""
 
 
 class TimestampStyle(str, Enum):
@@ -95,22 +155,102 @@ class MarkdownFormat(IntFlag):
     """Used to remove all possible formatting."""
 
 
-FORMAT_DICT = {
+_FORMAT_PATTERNS: t.Dict[MarkdownFormat, t.Tuple[str, str, str]] = {
     # First value is the regex pattern of the affiliated enum flag, the match includes the formatting that causes it.
-    # Second value is the amount of characters that will be sliced off the match.
-    MarkdownFormat.MULTI_CODE_BLOCK: (re.compile(r"(`{3}[^`]+`{3})"), 3),
-    MarkdownFormat.CODE_BLOCK: (re.compile(r"(`[^`]+`)"), 1),
-    MarkdownFormat.MULTI_QUOTE: (re.compile(r"\s*>{3} ([\s\S]+)"), 0),
-    MarkdownFormat.QUOTE: (re.compile(r"\s*> ([\s\S]+)"), 0),
-    MarkdownFormat.BOLD: (re.compile(r"(\*{2}[^*]+\*{2})"), 2),
-    MarkdownFormat.UNDERLINE: (re.compile(r"(__[^_]+__)"), 2),
-    MarkdownFormat.STRIKETHROUGH: (re.compile(r"(~~[^~]+~~)"), 2),
-    MarkdownFormat.ITALIC_UNDERSCORE: (re.compile(r"(_[^_]+_)"), 1),
-    MarkdownFormat.ITALIC_ASTERISK: (re.compile(r"(\*[^*]+\*)"), 1),
-    MarkdownFormat.SPOILER: (re.compile(r"(\|{2}[^|]+\|{2})"), 2),
+    # Second value is the template the match is substituted with, the first group holds the formatted content.
+    # Third value is a substring every match contains, formats are skipped if it is not in the content.
+    # Formats are applied in this order, each one on the result of the previous ones.
+    MarkdownFormat.MULTI_CODE_BLOCK: (r"`{3}([^`]+)`{3}", r"\1", "```"),
+    MarkdownFormat.CODE_BLOCK: (r"`([^`]+)`", r"\1", "`"),
+    MarkdownFormat.MULTI_QUOTE: (r">{3} ", "", ">>> "),
+    MarkdownFormat.QUOTE: (r"> ", "", "> "),
+    MarkdownFormat.BOLD: (r"\*{2}([^*]+)\*{2}", r"\1", "**"),
+    MarkdownFormat.UNDERLINE: (r"__([^_]+)__", r"\1", "__"),
+    MarkdownFormat.STRIKETHROUGH: (r"~~([^~]+)~~", r"\1", "~~"),
+    MarkdownFormat.ITALIC_UNDERSCORE: (r"_([^_]+)_", r"\1", "_"),
+    MarkdownFormat.ITALIC_ASTERISK: (r"\*([^*]+)\*", r"\1", "*"),
+    MarkdownFormat.SPOILER: (r"\|{2}([^|]+)\|{2}", r"\1", "||"),
 }
 
 
+@functools.lru_cache(maxsize=None)
+def _format_dict() -> t.Dict[MarkdownFormat, t.Tuple[t.Pattern[str], str, str]]:
+    return {
+        format: (re.compile(pattern), template, marker)
+        for format, (pattern, template, marker) in _FORMAT_PATTERNS.items()
+    }
+
+
+if t.TYPE_CHECKING:
+    LINK_REGEX: t.Pattern[str]
+    INVITE_REGEX: t.Pattern[str]
+    FORMAT_DICT: t.Dict[MarkdownFormat, t.Tuple[t.Pattern[str], str, str]]
+else:
+    __getattr__ = lazy_getattr(
+        __name__, {"LINK_REGEX": _link_regex, "INVITE_REGEX": _invite_regex, "FORMAT_DICT": _format_dict}
+    )
+
+
+CODE_FORMATS = MarkdownFormat.MULTI_CODE_BLOCK | MarkdownFormat.CODE_BLOCK
+
+# Code blocks are swapped out for "<placeholder><index><placeholder>" while the other formats are removed,
+# the placeholder is a private use character that cannot be matched by any of the patterns above,
+# or a sequence of them if the content contains every private use character.
+_PLACEHOLDER = "\ue000"
+_PRIVATE_USE_END = "\uf8ff"
+_placeholder_regex = lazy_regex(_PLACEHOLDER + r"(\d+)" + _PLACEHOLDER)
+
+# A compiled step of a markdown removal plan: the bound substitution method of the pattern,
+# the replacement template, the marker substring and whether the step removes code blocks.
+_PlanStep = t.Tuple[t.Callable[..., str], str, str, bool]
+
+
+class MarkdownSpan(t.NamedTuple):
+    """Markdown formatting found in a string."""
+
+    format: MarkdownFormat
+    """The format of the span."""
+    span: t.Tuple[int, int]
+    """The start and end index of the span in the string, including the formatting characters."""
+    content_span: t.Optional[t.Tuple[int, int]]
+    """The start and end index of the formatted content, None for quotes."""
+
+
+ContentMatch = t.Union[MarkdownSpan, URLMatch, InviteMatch, "MessageLink"]
+"""Anything found in a string by `ContentScanner`."""
+
+
+def _message_link_regex() -> t.Pattern[str]:
+    # The messages module imports hikari, so it is only imported once a scanner looks for message links
+    from .messages import _message_link_regex
+
+    return _message_link_regex()
+
+
+# Links found by ContentScanner, with a substring every match contains, in order of priority
+_URL = "url"
+_INVITE = "invite"
+_MESSAGE_LINK = "message_link"
+_LINK_COMPONENTS: t.Tuple[t.Tuple[str, t.Callable[[], t.Pattern[str]], str], ...] = (
+    (_MESSAGE_LINK, _message_link_regex, "/channels/"),
+    (_INVITE, _invite_regex, "discord"),
+    (_URL, _link_regex, "http"),
+)
+
+# A substring links found by ContentScanner start with
+_LINK_PREFIXES = {_MESSAGE_LINK: "http", _INVITE: "discord", _URL: "http"}
+
+# The characters links found by ContentScanner can start with, markdown starts with the first character of its marker
+_LINK_STARTS = {_MESSAGE_LINK: "h", _INVITE: "hd", _URL: "h"}
+
+# A kind of content found by ContentScanner, with its pattern and a substring every match contains
+_ScanComponent = t.Tuple[t.Union[MarkdownFormat, str], t.Pattern[str], str]
+
+# How to handle a match of a scan component: its kind, the index of the group holding the formatted content
+# or 0 if there is none, and whether the formatted content should be scanned as well
+_ScanHandler = t.Tuple[t.Union[MarkdownFormat, str], int, bool]
+
+
 def format_dt(time: datetime.datetime, style: t.Optional[TimestampStyle] = None) -> str:
     """
     Convert a datetime into a Discord timestamp.
@@ -135,6 +275,145 @@ def format_dt(time: datetime.datetime, style: t.Optional[TimestampStyle] = None)
     return f"<t:{int(time.timestamp())}>"
 
 
+def format_dt_many(times: t.Iterable[TimeT], style: t.Optional[TimestampStyle] = None) -> t.List[str]:
+    """
+    Convert many times into Discord timestamps.
+    For styling see this link: https://discord.com/developers/docs/reference#message-formatting-timestamp-styles
+
+    If NumPy is installed, an array of ``datetime64`` values or of POSIX timestamps in seconds
+    is converted in a single vectorized operation. NumPy is not required otherwise.
+
+    Parameters
+    ----------
+    times : Iterable[TimeT]
+        The times to convert. Each can be a datetime, a POSIX timestamp in seconds,
+        or a `hikari.Snowflake` or `hikari.Unique` to use the creation time of.
+    style : TimestampStyle, optional
+        The style to use for all timestamps, by default None.
+
+    Returns
+    -------
+    List[str]
+        The formatted timestamps, in the same order as `times`.
+
+    Raises
+    ------
+    TypeError
+        If a NumPy array is neither of ``datetime64`` nor of integer type.
+    """
+    template = f"<t:{{}}:{style}>" if style else "<t:{}>"
+
+    # Only arrays can be passed if NumPy is already imported, so it never has to be imported here
+    if (np := sys.modules.get("numpy")) is not None and isinstance(times, np.ndarray):
+        if np.issubdtype(times.dtype, np.datetime64):
+            seconds = times.astype("datetime64[s]").astype(np.int64)
+        elif np.issubdtype(times.dtype, np.integer):
+            seconds = times.astype(np.int64, copy=False)
+        else:
+            raise TypeError(f"Expected an array of datetime64 or integers, got {times.dtype}.")
+
+        return list(map(template.format, seconds.tolist()))
+
+    return list(map(template.format, map(_to_timestamp, times)))
+
+
+def _to_timestamp(time: TimeT) -> int:
+    """Convert a time into a POSIX timestamp in seconds."""
+    if type(time) is int:
+        return time
+
+    if isinstance(time, datetime.datetime):
+        return int(time.timestamp())
+
+    # Snowflakes and objects with an ID have a creation time, checked without importing hikari
+    if hasattr(time, "created_at"):
+        return snowflake_to_timestamp(time)
+
+    return int(time)
+
+
+def snowflake_to_timestamp(snowflake: hikari.SnowflakeishOr[hikari.Unique]) -> int:
+    """
+    Get the creation time of a snowflake as a POSIX timestamp in seconds,
+    computed from its bits without creating a datetime.
+
+    Parameters
+    ----------
+    snowflake : hikari.SnowflakeishOr[hikari.Unique]
+        The snowflake, or an object with an ID, to get the creation time of.
+
+    Returns
+    -------
+    int
+        The creation time in seconds since the Unix epoch.
+    """
+    if not isinstance(snowflake, int):
+        snowflake = snowflake.id
+
+    return ((int(snowflake) >> 22) + _DISCORD_EPOCH_MS) // 1000
+
+
+def format_snowflake(snowflake: hikari.SnowflakeishOr[hikari.Unique], style: t.Optional[TimestampStyle] = None) -> str:
+    """
+    Convert the creation time of a snowflake into a Discord timestamp.
+    Equivalent to ``format_dt(snowflake.created_at, style)``, without creating a datetime.
+
+    Parameters
+    ----------
+    snowflake : hikari.SnowflakeishOr[hikari.Unique]
+        The snowflake, or an object with an ID, to format the creation time of.
+    style : TimestampStyle, optional
+        The style to use for the timestamp, by default None.
+
+    Returns
+    -------
+    str
+        The formatted timestamp.
+    """
+    if style:
+        return f"<t:{snowflake_to_timestamp(snowflake)}:{style}>"
+
+    return f"<t:{snowflake_to_timestamp(snowflake)}>"
+
+
+def format_snowflakes(
+    snowflakes: t.Iterable[hikari.SnowflakeishOr[hikari.Unique]], style: t.Optional[TimestampStyle] = None
+) -> t.List[str]:
+    """
+    Convert the creation times of many snowflakes into Discord timestamps.
+
+    If NumPy is installed, an integer array of snowflakes is converted in a single vectorized operation.
+    NumPy is not required otherwise.
+
+    Parameters
+    ----------
+    snowflakes : Iterable[hikari.SnowflakeishOr[hikari.Unique]]
+        The snowflakes, or objects with an ID, to format the creation times of.
+    style : TimestampStyle, optional
+        The style to use for all timestamps, by default None.
+
+    Returns
+    -------
+    List[str]
+        The formatted timestamps, in the same order as `snowflakes`.
+
+    Raises
+    ------
+    TypeError
+        If a NumPy array is not of integer type.
+    """
+    template = f"<t:{{}}:{style}>" if style else "<t:{}>"
+
+    if (np := sys.modules.get("numpy")) is not None and isinstance(snowflakes, np.ndarray):
+        if not np.issubdtype(snowflakes.dtype, np.integer):
+            raise TypeError(f"Expected an array of integers, got {snowflakes.dtype}.")
+
+        seconds = ((snowflakes.astype(np.uint64) >> 22) + _DISCORD_EPOCH_MS) // 1000
+        return list(map(template.format, seconds.tolist()))
+
+    return list(map(template.format, map(snowflake_to_timestamp, snowflakes)))
+
+
 def utcnow() -> datetime.datetime:
     """
     A short-hand function to return a timezone-aware utc datetime.
@@ -164,9 +443,9 @@ def is_url(string: str, *, fullmatch: bool = True) -> bool:
         Whether the string is an URL.
     """
 
-    if fullmatch and LINK_REGEX.fullmatch(string):
+    if fullmatch and _link_regex().fullmatch(string):
         return True
-    elif not fullmatch and LINK_REGEX.match(string):
+    elif not fullmatch and _link_regex().match(string):
         return True
 
     return False
@@ -189,14 +468,135 @@ def is_invite(string: str, *, fullmatch: bool = True) -> bool:
         Whether the string is a Discord invite.
     """
 
-    if fullmatch and INVITE_REGEX.fullmatch(string):
+    if fullmatch and _invite_regex().fullmatch(string):
         return True
-    elif not fullmatch and INVITE_REGEX.match(string):
+    elif not fullmatch and _invite_regex().match(string):
         return True
 
     return False
 
 
+def find_urls(content: str) -> t.Iterator[URLMatch]:
+    """
+    Find all http URLs in a string, matching the same URLs as `is_url`.
+
+    Strings without ``http`` are skipped without running the regex. The pattern only has
+    bounded repetitions and cannot match across another URL, so the time taken is linear
+    in the length of the string, even for crafted input.
+
+    Parameters
+    ----------
+    content : str
+        The string to search.
+
+    Returns
+    -------
+    Iterator[URLMatch]
+        The URLs found, in the order they appear in.
+    """
+    if "http" not in content:
+        return
+
+    for match in _link_regex().finditer(content):
+        yield URLMatch(match.group(), match.span())
+
+
+def find_invites(content: str) -> t.Iterator[InviteMatch]:
+    """
+    Find all Discord invites in a string, matching the same invites as `is_invite`.
+
+    Strings without ``discord`` are skipped without running the regex.
+
+    Parameters
+    ----------
+    content : str
+        The string to search.
+
+    Returns
+    -------
+    Iterator[InviteMatch]
+        The invites found, in the order they appear in.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        if any(invite.code not in allowed_codes for invite in toolbox.find_invites(message.content)):
+            await message.delete()
+    """
+    if "discord" not in content:
+        return
+
+    for match in _invite_regex().finditer(content):
+        yield InviteMatch(match.group("code"), match.span())
+
+
+async def find_urls_async(
+    content: str, *, executor: t.Optional[concurrent.futures.Executor] = None, threshold: int = _OFFLOAD_THRESHOLD
+) -> t.List[URLMatch]:
+    """
+    Find all http URLs in a string like `find_urls`, on an executor for long strings.
+
+    Calls made within a short window are sent to the executor together,
+    strings shorter than `threshold` are searched inline.
+
+    Parameters
+    ----------
+    content : str
+        The string to search.
+    executor : concurrent.futures.Executor, optional
+        The executor to search on, by default the default executor of the event loop.
+    threshold : int
+        The length from which strings are searched on the executor, by default 1024.
+
+    Returns
+    -------
+    List[URLMatch]
+        The URLs found, in the order they appear in.
+    """
+    if len(content) < threshold:
+        return list(find_urls(content))
+
+    return await submit_batched(executor, _find_urls_list, content)
+
+
+async def find_invites_async(
+    content: str, *, executor: t.Optional[concurrent.futures.Executor] = None, threshold: int = _OFFLOAD_THRESHOLD
+) -> t.List[InviteMatch]:
+    """
+    Find all Discord invites in a string like `find_invites`, on an executor for long strings.
+
+    Calls made within a short window are sent to the executor together,
+    strings shorter than `threshold` are searched inline.
+
+    Parameters
+    ----------
+    content : str
+        The string to search.
+    executor : concurrent.futures.Executor, optional
+        The executor to search on, by default the default executor of the event loop.
+    threshold : int
+        The length from which strings are searched on the executor, by default 1024.
+
+    Returns
+    -------
+    List[InviteMatch]
+        The invites found, in the order they appear in.
+    """
+    if len(content) < threshold:
+        return list(find_invites(content))
+
+    return await submit_batched(executor, _find_invites_list, content)
+
+
+def _find_urls_list(content: str) -> t.List[URLMatch]:
+    return list(find_urls(content))
+
+
+def _find_invites_list(content: str) -> t.List[InviteMatch]:
+    return list(find_invites(content))
+
+
 def remove_markdown(content: str, formats: MarkdownFormat = MarkdownFormat.ALL) -> str:
     """
     Removes the markdown formatting from Discord messages.
@@ -217,57 +617,617 @@ def remove_markdown(content: str, formats: MarkdownFormat = MarkdownFormat.ALL)
     str
         The cleaned string without markdown formatting.
     """
-    code_block_matches = []
-    for format, (regex, replace) in FORMAT_DICT.items():
-        if formats & format:
-            if format & MarkdownFormat.MULTI_CODE_BLOCK or format & MarkdownFormat.CODE_BLOCK:
-                code_block_matches += re.findall(regex, content)
-            matches = re.findall(regex, content)
-            if not code_block_matches:
-                for match in matches:
-                    if format & MarkdownFormat.MULTI_QUOTE or format & MarkdownFormat.QUOTE:
-                        content = _remove_quote(content, format)
-                        continue
-                    content = content.replace(match, match[replace:-replace], 1)
+    return _strip_markdown(content, _compile_plan(formats))
+
+
+def remove_markdown_many(
+    contents: t.Iterable[str],
+    formats: MarkdownFormat = MarkdownFormat.ALL,
+    *,
+    executor: t.Optional[concurrent.futures.Executor] = None,
+    chunksize: int = 256,
+) -> t.Iterator[str]:
+    """
+    Lazily removes the markdown formatting from many Discord messages.
+    This is a shorthand for `MarkdownStripper(formats).strip_many(contents)`.
+
+    Parameters
+    ----------
+    contents : Iterable[str]
+        The `str` objects, which need their content cleaned from Discord's markdown formatting.
+        Generators are consumed lazily.
+    formats : MarkdownFormat
+        The `IntFlag` of the formatting that needs to be removed.
+        Default is `MarkdownFormat.ALL`.
+    executor : concurrent.futures.Executor, optional
+        If provided, the contents are stripped in chunks on this executor, by default None.
+    chunksize : int
+        The amount of contents sent to the executor per task, by default 256.
+
+    Returns
+    -------
+    Iterator[str]
+        The cleaned strings, in the same order as `contents`.
+    """
+    return MarkdownStripper(formats).strip_many(contents, executor=executor, chunksize=chunksize)
+
+
+async def remove_markdown_async(
+    content: str,
+    formats: MarkdownFormat = MarkdownFormat.ALL,
+    *,
+    executor: t.Optional[concurrent.futures.Executor] = None,
+    threshold: int = _OFFLOAD_THRESHOLD,
+) -> str:
+    """
+    Removes the markdown formatting from a Discord message, on an executor for long messages.
+    This is a shorthand for `MarkdownStripper(formats).strip_async(content)`.
+
+    Parameters
+    ----------
+    content : str
+        The `str` object, which needs their content cleaned from Discord's markdown formatting.
+    formats : MarkdownFormat
+        The `IntFlag` of the formatting that needs to be removed.
+        Default is `MarkdownFormat.ALL`.
+    executor : concurrent.futures.Executor, optional
+        The executor to remove the formatting on, by default the default executor of the event loop.
+    threshold : int
+        The length from which messages are cleaned on the executor, by default 1024.
+
+    Returns
+    -------
+    str
+        The cleaned string without markdown formatting.
+    """
+    return await MarkdownStripper(formats).strip_async(content, executor=executor, threshold=threshold)
+
+
+class MarkdownStripper:
+    """
+    Removes markdown formatting using a plan compiled once for a combination of formats.
+    Use this over `remove_markdown` when cleaning large amounts of messages with the same formats.
+
+    Parameters
+    ----------
+    formats : MarkdownFormat
+        The `IntFlag` of the formatting that needs to be removed.
+        Default is `MarkdownFormat.ALL`.
+        Multiple can be supplied by using bitwise OR.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        stripper = toolbox.MarkdownStripper(toolbox.MarkdownFormat.BOLD | toolbox.MarkdownFormat.ITALIC_ASTERISK)
+
+        stripper("**Hello** *World*")  # Returns "Hello World"
+
+        # Lazily strips a generator of messages in chunks, across processes
+        with concurrent.futures.ProcessPoolExecutor() as executor:
+            for content in stripper.strip_many(fetch_history(), executor=executor):
+                index(content)
+    """
+
+    __slots__ = ("_formats", "_plan")
+
+    def __init__(self, formats: MarkdownFormat = MarkdownFormat.ALL) -> None:
+        self._formats = MarkdownFormat(formats)
+        self._plan = _compile_plan(self._formats)
+
+    def __reduce__(self) -> t.Tuple[t.Type["MarkdownStripper"], t.Tuple[MarkdownFormat]]:
+        # Patterns are recompiled from the plan cache instead of pickling the plan
+        return (MarkdownStripper, (self._formats,))
+
+    def __repr__(self) -> str:
+        return f"MarkdownStripper({self._formats!r})"
+
+    @property
+    def formats(self) -> MarkdownFormat:
+        """The formats removed by this stripper."""
+        return self._formats
+
+    def __call__(self, content: str) -> str:
+        """
+        Removes the markdown formatting from a Discord message.
+
+        Parameters
+        ----------
+        content : str
+            The `str` object, which needs their content cleaned from Discord's markdown formatting.
+
+        Returns
+        -------
+        str
+            The cleaned string without markdown formatting.
+        """
+        return _strip_markdown(content, self._plan)
+
+    def strip_many(
+        self,
+        contents: t.Iterable[str],
+        *,
+        executor: t.Optional[concurrent.futures.Executor] = None,
+        chunksize: int = 256,
+    ) -> t.Iterator[str]:
+        """
+        Lazily removes the markdown formatting from many Discord messages.
+
+        When an executor is provided, contents are read in chunks of `chunksize` and only a few chunks
+        are in flight at a time, so arbitrarily large generators can be processed with bounded memory.
+        Note that markdown removal holds the GIL, a `concurrent.futures.ProcessPoolExecutor` should be
+        preferred over a `concurrent.futures.ThreadPoolExecutor` to stripe work across cores.
+
+        Parameters
+        ----------
+        contents : Iterable[str]
+            The `str` objects, which need their content cleaned from Discord's markdown formatting.
+            Generators are consumed lazily.
+        executor : concurrent.futures.Executor, optional
+            If provided, the contents are stripped in chunks on this executor, by default None.
+        chunksize : int
+            The amount of contents sent to the executor per task, by default 256.
+
+        Returns
+        -------
+        Iterator[str]
+            The cleaned strings, in the same order as `contents`.
+        """
+        if chunksize < 1:
+            raise ValueError("chunksize must be at least 1.")
+
+        if executor is None:
+            return map(self, contents)
+
+        return self._strip_many_in_executor(contents, executor, chunksize)
+
+    async def strip_async(
+        self,
+        content: str,
+        *,
+        executor: t.Optional[concurrent.futures.Executor] = None,
+        threshold: int = _OFFLOAD_THRESHOLD,
+    ) -> str:
+        """
+        Removes the markdown formatting from a Discord message without blocking the event loop.
+
+        Messages of at least `threshold` characters are cleaned on the executor, so a burst of long messages
+        does not delay other tasks such as gateway heartbeats. Calls made within a short window are sent
+        to the executor together, shorter messages are cleaned inline. Like with `strip_many`,
+        a `concurrent.futures.ProcessPoolExecutor` should be preferred to stripe work across cores.
+
+        Parameters
+        ----------
+        content : str
+            The `str` object, which needs their content cleaned from Discord's markdown formatting.
+        executor : concurrent.futures.Executor, optional
+            The executor to remove the formatting on, by default the default executor of the event loop.
+        threshold : int
+            The length from which messages are cleaned on the executor, by default 1024.
+
+        Returns
+        -------
+        str
+            The cleaned string without markdown formatting.
+
+        Examples
+        --------
+        .. code-block:: python
+
+            stripper = toolbox.MarkdownStripper()
+            executor = concurrent.futures.ProcessPoolExecutor()
+
+            @bot.listen()
+            async def on_message(event: hikari.GuildMessageCreateEvent) -> None:
+                index(await stripper.strip_async(event.content or "", executor=executor))
+        """
+        if len(content) < threshold:
+            return _strip_markdown(content, self._plan)
+
+        return await submit_batched(executor, self, content)
+
+    def _strip_chunk(self, chunk: t.List[str]) -> t.List[str]:
+        plan = self._plan
+        return [_strip_markdown(content, plan) for content in chunk]
+
+    def _strip_many_in_executor(
+        self, contents: t.Iterable[str], executor: concurrent.futures.Executor, chunksize: int
+    ) -> t.Iterator[str]:
+        iterator = iter(contents)
+        chunks = iter(lambda: list(itertools.islice(iterator, chunksize)), [])
+        pending: t.Deque[concurrent.futures.Future[t.List[str]]] = collections.deque(
+            executor.submit(self._strip_chunk, chunk) for chunk in itertools.islice(chunks, 2 * (os.cpu_count() or 1))
+        )
+
+        try:
+            while pending:
+                results = pending.popleft().result()
+                if chunk := next(chunks, None):
+                    pending.append(executor.submit(self._strip_chunk, chunk))
+                yield from results
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+class ContentScanner:
+    """
+    Finds markdown formatting, URLs, invites and message links in a single pass over a string.
+
+    All kinds of content are matched by a single combined pattern, compiled once per combination of kinds
+    present in the content. Content formatted with markdown other than code blocks is searched as well,
+    so ``**https://example.com**`` results in both a bold span and an URL.
+    Invites and message links that are also URLs are yielded as both.
+
+    Parameters
+    ----------
+    formats : MarkdownFormat
+        The `IntFlag` of the formatting to find, by default `MarkdownFormat.ALL`.
+    urls : bool
+        Whether to find URLs, by default True.
+    invites : bool
+        Whether to find Discord invites, by default True.
+    message_links : bool
+        Whether to find Discord message links, by default True.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        scanner = toolbox.ContentScanner(toolbox.MarkdownFormat.SPOILER)
+
+        @bot.listen()
+        async def on_message(event: hikari.GuildMessageCreateEvent) -> None:
+            for match in scanner.scan(event.content or ""):
+                if isinstance(match, toolbox.InviteMatch) and match.code not in allowed_codes:
+                    await event.message.delete()
+    """
+
+    __slots__ = ("_formats", "_components")
+
+    def __init__(
+        self,
+        formats: MarkdownFormat = MarkdownFormat.ALL,
+        *,
+        urls: bool = True,
+        invites: bool = True,
+        message_links: bool = True,
+    ) -> None:
+        self._formats = MarkdownFormat(formats)
+        enabled = {_URL: urls, _INVITE: invites, _MESSAGE_LINK: message_links}
+
+        # Code blocks come first, as nothing inside them is formatted, then links, so markdown does not split them
+        markdown = [
+            (format, regex, marker) for format, (regex, _, marker) in _format_dict().items() if formats & format
+        ]
+        self._components: t.Tuple[_ScanComponent, ...] = (
+            *(component for component in markdown if component[0] & CODE_FORMATS),
+            *((kind, regex(), marker) for kind, regex, marker in _LINK_COMPONENTS if enabled[kind]),
+            *(component for component in markdown if not component[0] & CODE_FORMATS),
+        )
+
+    def __reduce__(self) -> t.Tuple[t.Callable[[], "ContentScanner"], t.Tuple[()]]:
+        # Components are rebuilt from the pattern caches instead of pickling them, links are told apart by identity
+        kinds = {kind for kind, _, _ in self._components}
+        return (
+            functools.partial(
+                ContentScanner,
+                self._formats,
+                urls=_URL in kinds,
+                invites=_INVITE in kinds,
+                message_links=_MESSAGE_LINK in kinds,
+            ),
+            (),
+        )
+
+    def __repr__(self) -> str:
+        kinds = {kind for kind, _, _ in self._components}
+        return (
+            f"ContentScanner({self._formats!r}, urls={_URL in kinds}, "
+            f"invites={_INVITE in kinds}, message_links={_MESSAGE_LINK in kinds})"
+        )
+
+    def scan(self, content: str) -> t.Iterator[ContentMatch]:
+        """
+        Find everything this scanner looks for in a string.
+
+        Parameters
+        ----------
+        content : str
+            The string to scan, such as the content of a message.
+
+        Returns
+        -------
+        Iterator[ContentMatch]
+            The markdown spans, URLs, invites and message links found, ordered by their start index.
+        """
+        present = tuple(component for component in self._components if component[2] in content)
+        if not present:
+            return iter(())
+
+        return _compile_scanner(present).scan(content, 0, len(content))
+
+    async def scan_async(
+        self,
+        content: str,
+        *,
+        executor: t.Optional[concurrent.futures.Executor] = None,
+        threshold: int = _OFFLOAD_THRESHOLD,
+    ) -> t.List[ContentMatch]:
+        """
+        Find everything this scanner looks for in a string, on an executor for long strings.
+
+        Calls made within a short window are sent to the executor together,
+        strings shorter than `threshold` are scanned inline.
+
+        Parameters
+        ----------
+        content : str
+            The string to scan, such as the content of a message.
+        executor : concurrent.futures.Executor, optional
+            The executor to scan on, by default the default executor of the event loop.
+        threshold : int
+            The length from which strings are scanned on the executor, by default 1024.
+
+        Returns
+        -------
+        List[ContentMatch]
+            The markdown spans, URLs, invites and message links found, ordered by their start index.
+        """
+        if len(content) < threshold:
+            return list(self.scan(content))
+
+        return await submit_batched(executor, self._scan_list, content)
+
+    async def scan_messages(
+        self, messages: t.AsyncIterable[hikari.Message]
+    ) -> t.AsyncIterator[t.Tuple[hikari.Message, t.List[ContentMatch]]]:
+        """
+        Scan the content of messages as they arrive.
+
+        Parameters
+        ----------
+        messages : AsyncIterable[hikari.Message]
+            The messages to scan, such as ``bot.rest.fetch_messages(channel)``.
+
+        Returns
+        -------
+        AsyncIterator[Tuple[hikari.Message, List[ContentMatch]]]
+            Each message with everything found in its content.
+        """
+        async for message in messages:
+            yield message, list(self.scan(message.content or ""))
+
+    def _scan_list(self, content: str) -> t.List[ContentMatch]:
+        return list(self.scan(content))
+
+
+class _CompiledScanner:
+    """The patterns of a `ContentScanner` for a combination of components, combined into one."""
+
+    __slots__ = ("_regex", "_handlers", "_markers", "_urls", "_url_regex", "_link_regexes")
+
+    def __init__(self, components: t.Tuple[_ScanComponent, ...]) -> None:
+        # Maps the index of the group wrapping each pattern to how to handle its matches
+        self._handlers: t.Dict[int, _ScanHandler] = {}
+        index = 1
+        for kind, regex, _ in components:
+            if isinstance(kind, MarkdownFormat) and regex.groups:
+                self._handlers[index] = (kind, index + 1, not kind & CODE_FORMATS)
             else:
-                for match in matches:
-                    if format & MarkdownFormat.MULTI_CODE_BLOCK or format & MarkdownFormat.CODE_BLOCK:
-                        content = content.replace(match, match[replace:-replace], 1)
-                        continue
-                    else:
-                        ignore = False
-                        for code_block_match in code_block_matches:
-                            if match in code_block_match:
-                                ignore = True
-                        if not ignore:
-                            content = content.replace(match, match[replace:-replace], 1)
+                self._handlers[index] = (kind, 0, False)
+            index += regex.groups + 1
 
-    return content
+        # The lookahead lets the regex engine skip characters no match can start with,
+        # which it cannot do for an alternation of groups on its own
+        starts = {character for kind, _, marker in components for character in _starts(kind, marker)}
+        first_characters = re.escape("".join(sorted(starts)))
+        alternatives = "|".join(f"({regex.pattern})" for _, regex, _ in components)
+        self._regex = re.compile(f"(?=[{first_characters}])(?:{alternatives})")
+        # Formatted content is only scanned if it contains the first character of a marker
+        self._markers = re.compile(f"[{first_characters}]")
+        self._urls = any(kind is _URL for kind, _, _ in components)
+        self._url_regex = _link_regex()
+        # The patterns of the links markdown must not end inside of, with a substring every match starts with
+        self._link_regexes = [(regex, _LINK_PREFIXES[kind]) for kind, regex, _ in components if isinstance(kind, str)]
+
+    def scan(self, content: str, pos: int, endpos: int) -> t.Iterator[ContentMatch]:
+        while True:
+            for match in self._regex.finditer(content, pos, endpos):
+                # The group wrapping a pattern closes after the groups inside of it, so it is the last index
+                kind, content_group, recurse = self._handlers[match.lastindex]  # type: ignore[index]
+
+                if type(kind) is not str:
+                    if recurse and self._crosses_link(content, *match.span()):
+                        # Links only take priority where they start first, such as in "a_b https://example.com/c_d"
+                        pos = match.start() + 1
+                        break
+
+                    content_span = match.span(content_group) if content_group else None
+                    yield MarkdownSpan(t.cast(MarkdownFormat, kind), match.span(), content_span)
+                    if recurse and self._markers.search(content, *match.span(content_group)):
+                        yield from self.scan(content, *match.span(content_group))
+                    continue
+
+                if kind is _URL:
+                    yield URLMatch(match.group(), match.span())
+                    continue
+
+                if kind is _MESSAGE_LINK:
+                    from .messages import (
+                        _to_message_link,  # Already imported by _message_link_regex
+                    )
+
+                    yield _to_message_link(match)
+                else:
+                    yield InviteMatch(match.group("code"), match.span())
+
+                if self._urls and (url := self._url_regex.match(content, match.start(), endpos)):
+                    yield URLMatch(url.group(), url.span())
+                    if url.end() > match.end():
+                        # The URL continues after the link, such as with a query string, resume scanning after it
+                        pos = url.end()
+                        break
+            else:
+                return
+
+    def _crosses_link(self, content: str, start: int, end: int) -> bool:
+        """Whether a link starts inside of a span and ends after it."""
+        for regex, prefix in self._link_regexes:
+            index = content.find(prefix, start + 1, end)
+            while index != -1:
+                if (link := regex.match(content, index)) and link.end() > end:
+                    return True
+                index = content.find(prefix, index + 1, end)
+
+        return False
 
 
-def _remove_quote(content: str, formats: MarkdownFormat) -> str:
+def _starts(kind: t.Union[MarkdownFormat, str], marker: str) -> str:
+    """Get the characters a match of a scan component can start with."""
+    return _LINK_STARTS[kind] if isinstance(kind, str) else marker[0]
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_scanner(components: t.Tuple[_ScanComponent, ...]) -> _CompiledScanner:
     """
-    Helper function to remove quote formatting.
+    Helper function to combine the patterns of a scanner, cached per combination of components.
+
+    Parameters
+    ----------
+    components : Tuple[_ScanComponent, ...]
+        The components present in the content, in order of priority.
+
+    Returns
+    -------
+    _CompiledScanner
+        The combined patterns.
+    """
+    return _CompiledScanner(components)
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_plan(formats: MarkdownFormat) -> t.Tuple[_PlanStep, ...]:
+    """
+    Helper function to compile the steps needed to remove the given formats.
+    Plans are cached per combination of formats.
+
+    Parameters
+    ----------
+    formats : MarkdownFormat
+        The `IntFlag` of the formatting that needs to be removed.
+
+    Returns
+    -------
+    Tuple[_PlanStep, ...]
+        The steps to apply, in order.
+    """
+    return tuple(
+        (regex.sub, template, marker, bool(format & CODE_FORMATS))
+        for format, (regex, template, marker) in _format_dict().items()
+        if formats & format
+    )
+
+
+def _strip_markdown(content: str, plan: t.Tuple[_PlanStep, ...]) -> str:
+    """
+    Helper function to remove markdown formatting by applying a compiled plan.
 
     Parameters
     ----------
     content : str
-        The `str` object, which needs to be cleaned from quote formatting.
-    format : MarkdownFormat
-        The type of quote formatting that needs to be removed.
+        The `str` object, which needs their content cleaned from Discord's markdown formatting.
+    plan : Tuple[_PlanStep, ...]
+        The steps to apply, in order.
 
     Returns
     -------
     str
-        The cleaned string without quote formatting.
+        The cleaned string without markdown formatting.
     """
-    if formats == MarkdownFormat.MULTI_QUOTE and ">>> " in content:
-        content = content.replace(">>> ", "")
-    if formats == MarkdownFormat.QUOTE and "> " in content:
-        content = content.replace("> ", "")
+    if not content or not plan:
+        return content
+
+    code_blocks: t.List[str] = []
+    placeholder, placeholder_regex = _PLACEHOLDER, _placeholder_regex()
+
+    if placeholder in content:
+        placeholder, placeholder_regex = _find_placeholder(content)
+
+    def stash_code_block(match: t.Match[str]) -> str:
+        code_block = match.group(1)
+        if code_blocks and placeholder in code_block:  # Code block spans an earlier one
+            code_block = _restore_code_blocks(code_block, code_blocks, placeholder_regex)
+
+        code_blocks.append(code_block)
+        return f"{placeholder}{len(code_blocks) - 1}{placeholder}"
+
+    for sub, template, marker, is_code_block in plan:
+        if marker in content:
+            content = sub(stash_code_block if is_code_block else template, content)
+
+    if code_blocks:
+        content = _restore_code_blocks(content, code_blocks, placeholder_regex)
+
     return content
 
 
+def _find_placeholder(content: str) -> t.Tuple[str, t.Pattern[str]]:
+    """
+    Helper function to find a code block placeholder that is not present in the content.
+
+    Parameters
+    ----------
+    content : str
+        The `str` object the placeholder will be inserted into.
+
+    Returns
+    -------
+    Tuple[str, Pattern[str]]
+        The placeholder and the regex pattern matching it, the first group holds the index of the code block.
+    """
+    characters = [chr(codepoint) for codepoint in range(ord(_PLACEHOLDER), ord(_PRIVATE_USE_END) + 1)]
+    for placeholder in characters[1:]:
+        if placeholder not in content:
+            return placeholder, re.compile(placeholder + r"(\d+)" + placeholder)
+
+    # Every private use character is present, fall back to a sequence of them.
+    # Removing formats only drops ASCII markers, so a sequence that is not in the private use characters
+    # of the content cannot be formed by removing the formats between them either.
+    # A sequence that cannot overlap itself is also never matched across the edges of a placeholder.
+    private_use = "".join(char for char in content if _PLACEHOLDER <= char <= _PRIVATE_USE_END)
+    length = 2
+    while True:
+        taken = {private_use[i : i + length] for i in range(len(private_use) - length + 1)}
+        for sequence in itertools.product(characters, repeat=length):
+            placeholder = "".join(sequence)
+            if placeholder not in taken and not any(placeholder[:i] == placeholder[-i:] for i in range(1, length)):
+                return placeholder, re.compile(placeholder + r"(\d+)" + placeholder)
+
+        length += 1
+
+
+def _restore_code_blocks(content: str, code_blocks: t.Sequence[str], placeholder_regex: t.Pattern[str]) -> str:
+    """
+    Helper function to put the stashed code blocks back in place of their placeholders.
+
+    Parameters
+    ----------
+    content : str
+        The `str` object containing the placeholders.
+    code_blocks : Sequence[str]
+        The code blocks, in the order they were stashed.
+    placeholder_regex : Pattern[str]
+        The regex pattern matching a placeholder.
+
+    Returns
+    -------
+    str
+        The content with the code blocks put back.
+    """
+    return placeholder_regex.sub(lambda match: code_blocks[int(match.group(1))], content)
+
+
 # MIT License
 #
 # Copyright (c) 2022-present HyperGH